@@ -1,13 +1,27 @@
 from django.contrib import admin
-from .models import ContactMessage, Project, TeamMember, Meeting, Testimonial
+from . import search
+from .models import ContactMessage, Project, TeamMember, Meeting, Testimonial, OutboundEmail, CalendarJob, RenditionJob, RelatedProjectsJob, Technology
 
 # Customize the admin site
 admin.site.site_header = "Serendipity Admin"
 admin.site.site_title = "Serendipity Admin Portal"
 admin.site.index_title = "Welcome to Serendipity Admin"
 
+class FullTextSearchMixin:
+    """
+    Admin search through the full-text index in core.search, best matches
+    first. Falls back to the regular search_fields LIKE search on backends
+    without an index.
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        results = search.search(queryset, search_term)
+        if results is None:
+            return super().get_search_results(request, queryset, search_term)
+        return results, False
+
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ('name', 'email', 'subject', 'inquiry_type', 'preferred_contact', 'received_at')
     list_filter = ('inquiry_type', 'preferred_contact', 'received_at')
     search_fields = ('name', 'email', 'subject', 'message')
@@ -16,8 +30,10 @@ class ContactMessageAdmin(admin.ModelAdmin):
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ('title', 'category', 'client', 'completion_date')
-    list_filter = ('category', 'completion_date')
+    list_filter = ('category', 'completed_on')
     search_fields = ('title', 'description', 'client', 'technologies')
+    # Served by the (completed_on) and (category, completed_on) indexes
+    ordering = ('-completed_on',)
     
     fieldsets = (
         ('Basic Information', {
@@ -58,7 +74,7 @@ class TeamMemberAdmin(admin.ModelAdmin):
     )
 
 @admin.register(Meeting)
-class MeetingAdmin(admin.ModelAdmin):
+class MeetingAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ('name', 'email', 'topic', 'date', 'time', 'status', 'created_at', 'google_meet_url_link')
     list_filter = ('status', 'date', 'created_at')
     search_fields = ('name', 'email', 'topic', 'notes')
@@ -88,77 +104,46 @@ class MeetingAdmin(admin.ModelAdmin):
     google_meet_url_link.allow_tags = True
     
     def generate_meet_links(self, request, queryset):
-        """Action to generate Google Meet links for selected meetings"""
-        from .meeting_utils import generate_google_meet_url
-        from django.core.mail import send_mail
+        """Action to generate Google Meet links for selected meetings.
+
+        Events are created through the Calendar API batch endpoint, the
+        meetings are saved with one bulk_update and the confirmation emails
+        are queued in one insert for the send_queued_mail worker.
+        """
+        from .meeting_utils import create_calendar_events
+        from .mail_queue import enqueue_mass_mail
         from django.conf import settings
+        from django.contrib import messages
         import logging
-        import sys
-        
+
         logger = logging.getLogger(__name__)
-        updated_count = 0
-        error_count = 0
-        
-        # Log to see the action is being called
-        print("\n" + "="*70)
-        print("🎬 ADMIN ACTION: GENERATE MEET LINKS")
-        print("="*70)
-        print(f"Processing {queryset.count()} meeting(s)")
-        sys.stdout.flush()
-        
-        for meeting in queryset:
-            print(f"\n📌 Meeting ID {meeting.id}: {meeting.topic}")
-            print(f"   Current URL: {meeting.google_meet_url}")
-            print(f"   Status: {meeting.status}")
-            sys.stdout.flush()
-            
-            if not meeting.google_meet_url:
-                print(f"   ✓ URL is empty, generating...")
-                sys.stdout.flush()
-                
-                try:
-                    print(f"\n📌 Processing Meeting ID {meeting.id}: {meeting.topic}")
-                    sys.stdout.flush()
-                    
-                    # Generate Google Meet URL using OAuth if available
-                    result = generate_google_meet_url(
-                        meeting_title=meeting.topic,
-                        meeting_date=meeting.date,
-                        meeting_time=meeting.time,
-                        meeting_email=meeting.email,
-                        meeting_notes=meeting.notes if meeting.notes else ""
-                    )
-                    
-                    sys.stdout.flush()
-                    
-                    # Extract URL from result dictionary
-                    if isinstance(result, dict):
-                        meet_url = result.get('url')
-                        method = result.get('method', 'unknown')
-                        event_id = result.get('event_id', '')
-                        is_real = method == 'calendar_api'
-                    else:
-                        meet_url = result
-                        method = 'unknown'
-                        is_real = False
-                    
-                    if meet_url:
-                        meeting.google_meet_url = meet_url
-                        meeting.status = 'confirmed'
-                        meeting.save()
-                        
-                        print(f"✅ Saved URL: {meet_url}")
-                        print(f"   Method: {method} {'(REAL)' if is_real else '(fallback)'}")
-                        sys.stdout.flush()
-                        
-                        # Log the meeting creation
-                        logger.info(f"✓ Meeting {meeting.id} - {meeting.topic}")
-                        logger.info(f"  Method: {method} {'(REAL)' if is_real else '(fallback)'}")
-                        if event_id:
-                            logger.info(f"  Event ID: {event_id}")
-                        
-                        # Send email to user with Google Meet link
-                        email_body = f"""
+
+        meetings = [meeting for meeting in queryset if not meeting.google_meet_url]
+        if not meetings:
+            self.message_user(request, "✓ All meetings already have Google Meet links")
+            return
+
+        results = create_calendar_events(meetings)
+
+        updated = []
+        emails = []
+        for meeting in meetings:
+            result = results.get(meeting.pk, {})
+            meet_url = result.get('url')
+            if not (result.get('success') and meet_url):
+                error = result.get('error') or 'No URL generated'
+                logger.error(f"Failed to generate URL for meeting {meeting.id}: {error}")
+                self.message_user(request, f'❌ Error processing meeting {meeting.id}: {error}', level=messages.ERROR)
+                continue
+
+            method = result.get('method', 'unknown')
+            logger.debug(f"✓ Meeting {meeting.id} - {meeting.topic} ({method})")
+            meeting.google_meet_url = meet_url
+            meeting.status = 'confirmed'
+            updated.append(meeting)
+
+            # Email to user with Google Meet link
+            email_body = f"""
 Hello {meeting.name},
 
 Your meeting has been confirmed! Here are the details:
@@ -179,57 +164,15 @@ We look forward to meeting with you!
 Best regards,
 Serendipity Team
                         """
-                        
-                        try:
-                            send_mail(
-                                f'✓ Meeting Confirmed: {meeting.topic}',
-                                email_body,
-                                settings.DEFAULT_FROM_EMAIL,
-                                [meeting.email],
-                                fail_silently=False,
-                            )
-                            print(f"📧 Email sent to {meeting.email}")
-                            logger.info(f"  Email sent to: {meeting.email}")
-                            sys.stdout.flush()
-                        except Exception as e:
-                            logger.error(f"Error sending email to {meeting.email}: {str(e)}")
-                            print(f"❌ Email error: {str(e)}")
-                            self.message_user(request, f'⚠️ Error sending email to {meeting.email}: {str(e)}')
-                            sys.stdout.flush()
-                        
-                        updated_count += 1
-                    else:
-                        error_count += 1
-                        print(f"❌ No URL generated for meeting {meeting.id}")
-                        logger.error(f"Failed to generate URL for meeting {meeting.id}")
-                        sys.stdout.flush()
-                        
-                except Exception as e:
-                    error_count += 1
-                    print(f"❌ Error: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                    logger.error(f"Error processing meeting {meeting.id}: {str(e)}")
-                    self.message_user(request, f'❌ Error processing meeting {meeting.id}: {str(e)}')
-                    sys.stdout.flush()
-            else:
-                print(f"   ⏭️ Skipping (already has URL)")
-                sys.stdout.flush()
-        
-        print("\n" + "="*70)
-        if updated_count > 0:
-            msg = f'✓ Generated and sent Google Meet links for {updated_count} meeting(s).'
-            print(msg)
-            self.message_user(request, msg)
-        if error_count > 0:
-            msg = f'❌ Failed to process {error_count} meeting(s). Check logs for details.'
-            print(msg)
-            self.message_user(request, msg)
-        if updated_count == 0 and error_count == 0:
-            print("⏭️ No meetings to process (all may already have URLs)")
-            self.message_user(request, "✓ All meetings already have Google Meet links")
-        print("="*70 + "\n")
-        sys.stdout.flush()
+            emails.append((f'✓ Meeting Confirmed: {meeting.topic}', email_body, settings.DEFAULT_FROM_EMAIL, [meeting.email]))
+
+        if updated:
+            Meeting.objects.bulk_update(updated, ['google_meet_url', 'status'])
+            enqueue_mass_mail(emails)
+            self.message_user(request, f'✓ Generated Google Meet links for {len(updated)} meeting(s). Confirmation emails are queued.')
+        failed = len(meetings) - len(updated)
+        if failed:
+            self.message_user(request, f'❌ Failed to process {failed} meeting(s). Check logs for details.', level=messages.ERROR)
     generate_meet_links.short_description = 'Generate Google Meet links and send to users'
     
     def mark_as_confirmed(self, request, queryset):
@@ -248,3 +191,46 @@ Serendipity Team
 class TestimonialAdmin(admin.ModelAdmin):
     list_display = ('name', 'workplace', 'feedback')
     search_fields = ('name', 'workplace', 'feedback')
+
+@admin.register(Technology)
+class TechnologyAdmin(admin.ModelAdmin):
+    list_display = ('name', 'slug', 'project_count')
+    search_fields = ('name', 'slug')
+    # Tags are created from Project.technologies; counts are maintained by core.technologies
+    readonly_fields = ('slug', 'project_count')
+    ordering = ('-project_count', 'name')
+
+@admin.register(CalendarJob)
+class CalendarJobAdmin(admin.ModelAdmin):
+    list_display = ('meeting', 'status', 'attempts', 'next_attempt_at', 'created_at', 'finished_at')
+    list_filter = ('status',)
+    readonly_fields = ('attempts', 'last_error', 'event_id', 'created_at', 'finished_at')
+    list_select_related = ('meeting',)
+
+@admin.register(RenditionJob)
+class RenditionJobAdmin(admin.ModelAdmin):
+    list_display = ('source', 'preset', 'status', 'attempts', 'created_at', 'finished_at')
+    list_filter = ('status', 'preset')
+    search_fields = ('source',)
+    readonly_fields = ('attempts', 'last_error', 'created_at', 'finished_at')
+
+@admin.register(RelatedProjectsJob)
+class RelatedProjectsJobAdmin(admin.ModelAdmin):
+    list_display = ('project_pk', 'status', 'attempts', 'created_at', 'finished_at')
+    list_filter = ('status',)
+    readonly_fields = ('attempts', 'last_error', 'created_at', 'finished_at')
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at')
+    list_filter = ('status',)
+    search_fields = ('subject',)
+    readonly_fields = ('attempts', 'last_error', 'created_at', 'sent_at')
+    actions = ['retry_now']
+
+    def retry_now(self, request, queryset):
+        """Requeue selected messages for immediate delivery"""
+        from django.utils import timezone
+        updated = queryset.exclude(status='sent').update(status='pending', next_attempt_at=timezone.now())
+        self.message_user(request, f'{updated} email(s) queued for retry.')
+    retry_now.short_description = 'Retry selected emails now'
@@ -0,0 +1,237 @@
+"""
+Inline asset extraction and minification.
+
+Templates historically carried their CSS and JS in inline ``<style>`` and
+``<script>`` blocks, so every page view re-sent tens of kilobytes that the
+browser could never cache. ``extract_inline_assets`` moves those blocks into
+files under ``static/bundles/`` and swaps them for ``{% static %}`` references;
+``MinifiedManifestStaticFilesStorage`` (core.storage) then minifies, hashes and
+precompresses the bundles during ``collectstatic``.
+
+Blocks that contain template syntax are left inline because they depend on
+the request context.
+"""
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+BUNDLE_DIR = 'bundles'
+
+INLINE_BLOCK_RE = re.compile(
+    r'(?P<indent>[ \t]*)<(?P<tag>style|script)(?P<attrs>[^>]*)>(?P<body>.*?)</(?P=tag)>',
+    re.DOTALL | re.IGNORECASE,
+)
+TEMPLATE_SYNTAX_RE = re.compile(r'\{[{%#]')
+LOAD_STATIC_RE = re.compile(r'\{%\s*load\s+[^%]*\bstatic\b[^%]*%\}')
+EXTENDS_RE = re.compile(r'\{%\s*extends\s+[^%]+%\}[ \t]*\n?')
+SCRIPT_TYPES = ('', 'text/javascript', 'application/javascript', 'module')
+EXTENSIONS = {'style': 'css', 'script': 'js'}
+
+
+@dataclass
+class ExtractionResult:
+    template: str
+    bundles: list = field(default_factory=list)
+    skipped: int = 0
+    bytes_moved: int = 0
+
+
+def _script_type(attrs):
+    match = re.search(r'\btype\s*=\s*["\']?([^"\'\s>]+)', attrs, re.IGNORECASE)
+    return match.group(1).lower() if match else ''
+
+
+def _is_extractable(tag, attrs, body):
+    if not body.strip() or TEMPLATE_SYNTAX_RE.search(body):
+        return False
+    if tag == 'script':
+        if re.search(r'\bsrc\s*=', attrs, re.IGNORECASE):
+            return False
+        return _script_type(attrs) in SCRIPT_TYPES
+    return True
+
+
+def bundle_name(template_name, tag, index):
+    """``core/home.html`` -> ``bundles/core/home.css`` (``home-2.css`` for the second block)."""
+    stem = Path(template_name).with_suffix('').as_posix()
+    suffix = '' if index == 1 else f'-{index}'
+    return f'{BUNDLE_DIR}/{stem}{suffix}.{EXTENSIONS[tag]}'
+
+
+def _reference(tag, attrs, name, indent):
+    if tag == 'style':
+        return f'{indent}<link rel="stylesheet" href="{{% static \'{name}\' %}}">'
+    attrs = re.sub(r'\s*\btype\s*=\s*["\']?text/javascript["\']?', '', attrs, flags=re.IGNORECASE)
+    return f'{indent}<script{attrs} src="{{% static \'{name}\' %}}"></script>'
+
+
+def _dedent(body):
+    lines = body.strip('\n').splitlines()
+    margin = min((len(line) - len(line.lstrip()) for line in lines if line.strip()), default=0)
+    return '\n'.join(line[margin:] for line in lines).rstrip() + '\n'
+
+
+def _ensure_load_static(source):
+    if LOAD_STATIC_RE.search(source):
+        return source
+    extends = EXTENDS_RE.match(source.lstrip())
+    if extends:
+        offset = len(source) - len(source.lstrip()) + extends.end()
+        return source[:offset] + '{% load static %}\n' + source[offset:]
+    return '{% load static %}\n' + source
+
+
+def extract_template(source, template_name):
+    """
+    Split the inline blocks out of one template.
+
+    Returns ``(new_source, {bundle_name: contents}, ExtractionResult)``.
+    Running it again on its own output is a no-op.
+    """
+    result = ExtractionResult(template=template_name)
+    bundles = {}
+    counters = {'style': 0, 'script': 0}
+
+    def replace(match):
+        tag = match.group('tag').lower()
+        attrs, body = match.group('attrs'), match.group('body')
+        if not _is_extractable(tag, attrs, body):
+            if body.strip():
+                result.skipped += 1
+            return match.group(0)
+        counters[tag] += 1
+        name = bundle_name(template_name, tag, counters[tag])
+        bundles[name] = _dedent(body)
+        result.bundles.append(name)
+        result.bytes_moved += len(match.group(0).encode())
+        return _reference(tag, attrs, name, match.group('indent'))
+
+    new_source = INLINE_BLOCK_RE.sub(replace, source)
+    if bundles:
+        new_source = _ensure_load_static(new_source)
+    return new_source, bundles, result
+
+
+def extract_inline_assets(templates_dir, static_dir, dry_run=False):
+    """Extract every template under ``templates_dir`` into ``static_dir/bundles``."""
+    templates_dir, static_dir = Path(templates_dir), Path(static_dir)
+    results = []
+    for path in sorted(templates_dir.rglob('*.html')):
+        template_name = path.relative_to(templates_dir).as_posix()
+        source = path.read_text(encoding='utf-8')
+        new_source, bundles, result = extract_template(source, template_name)
+        results.append(result)
+        if not bundles or dry_run:
+            continue
+        for name, contents in bundles.items():
+            target = static_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(contents, encoding='utf-8')
+        path.write_text(new_source, encoding='utf-8')
+    return results
+
+
+# --- Minification -----------------------------------------------------------
+# Deliberately conservative: the bundles are hand-written page code, so the
+# goal is to drop comments and indentation without ever changing semantics.
+
+CSS_STRING_RE = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+
+def _minify_css_chunk(chunk):
+    chunk = re.sub(r'\s+', ' ', chunk)
+    chunk = re.sub(r'\s*([{};,>])\s*', r'\1', chunk)
+    chunk = re.sub(r':\s+', ':', chunk)
+    return chunk.replace(';}', '}')
+
+
+def minify_css(source):
+    source = CSS_COMMENT_RE.sub('', source)
+    parts = CSS_STRING_RE.split(source)
+    # Odd indices are string literals; keep them byte-for-byte.
+    return ''.join(
+        part if index % 2 else _minify_css_chunk(part) for index, part in enumerate(parts)
+    ).strip()
+
+
+def _template_literal_lines(source):
+    """
+    ``[(line, starts_inside, ends_inside)]``, the flags telling whether the
+    line starts/ends inside a template literal, or None when the literals
+    don't balance (e.g. a backtick in a regex literal) and the scan can't be
+    trusted.
+    """
+    lines = source.splitlines()
+    # One entry per open template literal ('`') or ${...} substitution ('{')
+    stack = []
+    quote = None
+    in_comment = False
+    result = []
+    for line in lines:
+        starts_inside = bool(stack) and stack[-1] == '`'
+        quote = None
+        index = 0
+        while index < len(line):
+            char = line[index]
+            pair = line[index:index + 2]
+            if in_comment:
+                if pair == '*/':
+                    in_comment = False
+                    index += 1
+            elif stack and stack[-1] == '`':
+                if char == '\\':
+                    index += 1
+                elif char == '`':
+                    stack.pop()
+                elif pair == '${':
+                    stack.append('{')
+                    index += 1
+            elif quote:
+                if char == '\\':
+                    index += 1
+                elif char == quote:
+                    quote = None
+            elif pair == '//':
+                break
+            elif pair == '/*':
+                in_comment = True
+                index += 1
+            elif char in '\'"':
+                quote = char
+            elif char == '`':
+                stack.append('`')
+            elif char == '{' and stack:
+                stack.append('{')
+            elif char == '}' and stack:
+                stack.pop()
+            index += 1
+        result.append((line, starts_inside, bool(stack) and stack[-1] == '`'))
+    return None if stack else result
+
+
+def minify_js(source):
+    """
+    Strip indentation, blank lines and whole-line ``//`` comments.
+
+    Newlines are kept so automatic semicolon insertion behaves exactly as it
+    did in the original source. Lines inside template literals are part of
+    the string and are kept as they are; a bundle whose literals can't be
+    matched up is left unminified.
+    """
+    scanned = _template_literal_lines(source)
+    if scanned is None:
+        return source
+    lines = []
+    for line, starts_inside, ends_inside in scanned:
+        if not starts_inside:
+            line = line.lstrip()
+            if not line or line.startswith('//'):
+                continue
+        if not ends_inside:
+            line = line.rstrip()
+        lines.append(line)
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
@@ -0,0 +1,385 @@
+"""
+Streaming bulk import/export of portfolio content (JSONL or CSV).
+
+Used by the ``import_content`` and ``export_content`` management commands.
+Rows are processed in batches: each batch looks up the existing rows it
+matches in one query, then inserts with ``bulk_create`` and updates with a
+single ``executemany`` inside its own transaction. Because bulk writes skip
+``save()`` and model signals, the derived fields (``Project.completed_on``,
+``TeamMember.slug`` and the parsed profile lists) are filled here, the
+technology index is synced, renditions are queued and updated projects'
+cached details are dropped per batch, and the related project lists and
+content caches are refreshed once at the end.
+
+Image columns take either a name already present in media storage or a
+local file path. Local files are copied into storage under the field's
+``upload_to``, several at a time.
+"""
+import csv
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.db import connections, router, transaction
+from django.utils.text import slugify
+
+from . import related, technologies
+from .caching import (
+    CONTENT_NAMESPACE, PORTFOLIO_NAMESPACE, TEAM_NAMESPACE, bump_version, invalidate_project_details,
+    mark_content_changed,
+)
+from .models import Project, RelatedProject, TeamMember, Testimonial, parse_completion_date, parse_technologies
+from .renditions import enqueue_renditions
+
+
+@dataclass(frozen=True)
+class ContentSpec:
+    model: type
+    fields: tuple
+    # Columns identifying an existing row to update instead of creating a new one
+    key: tuple
+    image_fields: tuple = ()
+
+
+SPECS = {
+    'projects': ContentSpec(
+        Project,
+        ('title', 'description', 'category', 'client', 'completion_date', 'technologies', 'website',
+         'team_member', 'image', 'fallback_image', 'external_image'),
+        key=('title',),
+        image_fields=('image', 'fallback_image'),
+    ),
+    'team': ContentSpec(
+        TeamMember,
+        ('slug', 'name', 'email', 'admin_email', 'phone', 'role', 'bio', 'image', 'education', 'experience',
+         'skills', 'location'),
+        key=('slug',),
+        image_fields=('image',),
+    ),
+    'testimonials': ContentSpec(
+        Testimonial,
+        ('name', 'workplace', 'feedback', 'image'),
+        key=('name', 'workplace'),
+        image_fields=('image',),
+    ),
+}
+
+FORMATS = ('jsonl', 'csv')
+
+
+
+class ImportRowError(ValueError):
+    pass
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    errors: list = field(default_factory=list)
+    # Projects whose technologies or category were written, for core.related
+    reindexed: set = field(default_factory=set)
+
+    def error(self, line, message):
+        self.errors.append((line, message))
+
+
+def detect_format(path, fmt=None):
+    if fmt:
+        return fmt
+    return 'csv' if str(path).lower().endswith('.csv') else 'jsonl'
+
+
+# --- Export -----------------------------------------------------------------
+
+def _export_value(instance, name):
+    if name == 'team_member':
+        return instance.team_member.slug if instance.team_member_id else ''
+    value = getattr(instance, name)
+    if hasattr(value, 'name') and name in ('image', 'fallback_image'):
+        return value.name or ''
+    return value
+
+
+def export_rows(spec, batch_size=2000):
+    """Yield one dict per row, streaming the table in ``batch_size`` chunks"""
+    queryset = spec.model.objects.order_by('pk')
+    if spec.model is Project:
+        queryset = queryset.select_related('team_member').only(
+            *[name for name in spec.fields if name != 'team_member'], 'team_member__slug')
+    for instance in queryset.iterator(chunk_size=batch_size):
+        yield {name: _export_value(instance, name) for name in spec.fields}
+
+
+def write_rows(rows, stream, fmt, fieldnames):
+    count = 0
+    if fmt == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in rows:
+            # Lists are written as JSON so they round-trip through CSV
+            writer.writerow({k: json.dumps(v) if isinstance(v, list) else ('' if v is None else v)
+                             for k, v in row.items()})
+            count += 1
+    else:
+        for row in rows:
+            stream.write(json.dumps(row, ensure_ascii=False) + '\n')
+            count += 1
+    return count
+
+
+# --- Import -----------------------------------------------------------------
+
+def read_rows(stream, fmt):
+    """Yield ``(line_number, row dict)`` from a JSONL or CSV stream"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield number, json.loads(line)
+
+
+def _parse_bool(value, default=True):
+    if value in (None, ''):
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'y')
+
+
+class ImageFetcher:
+    """
+    Copy referenced local image files into media storage concurrently.
+
+    Each distinct source path is copied once, however many rows use it.
+    """
+
+    def __init__(self, model, image_root=None, workers=8):
+        self.model = model
+        self.image_root = Path(image_root) if image_root else None
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.pending = {}
+
+    def _local_path(self, value):
+        path = Path(value)
+        if not path.is_absolute() and self.image_root:
+            path = self.image_root / path
+        return path
+
+    def _copy(self, field_name, path):
+        model_field = self.model._meta.get_field(field_name)
+        with open(path, 'rb') as f:
+            name = model_field.generate_filename(None, path.name)
+            return model_field.storage.save(name, File(f, name=path.name))
+
+    def submit(self, field_name, value):
+        """Return a callable resolving to the storage name for ``value``"""
+        if not value:
+            return lambda: ''
+        storage = self.model._meta.get_field(field_name).storage
+        path = self._local_path(value)
+        if not path.is_file():
+            if storage.exists(value):
+                return lambda: value
+            raise ImportRowError(f'{field_name}: {value} is neither a local file nor in media storage')
+        key = (field_name, str(path))
+        if key not in self.pending:
+            self.pending[key] = self.executor.submit(self._copy, field_name, path)
+        return self.pending[key].result
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+def _build_instance(spec, row, member_slugs):
+    values = {}
+    for name in spec.fields:
+        if name not in row:
+            continue
+        value = row[name]
+        if name == 'technologies':
+            value = parse_technologies(value)
+        elif name == 'external_image':
+            value = _parse_bool(value)
+        elif name == 'team_member':
+            slug = (value or '').strip()
+            if slug and slug not in member_slugs:
+                raise ImportRowError(f'team_member: no team member with slug {slug!r}')
+            name, value = 'team_member_id', member_slugs.get(slug)
+        elif name not in spec.image_fields and value == '' and spec.model._meta.get_field(name).null:
+            value = None
+        values[name] = value
+
+    instance = spec.model(**{k: v for k, v in values.items() if k not in spec.image_fields})
+    if spec.model is Project:
+        instance.completed_on = parse_completion_date(instance.completion_date)
+    elif spec.model is TeamMember:
+        instance.parse_profile_fields()
+        if not instance.slug:
+            instance.slug = slugify(instance.name)
+    try:
+        instance.clean_fields(exclude=['team_member', *spec.image_fields])
+    except ValidationError as e:
+        raise ImportRowError('; '.join(f'{k}: {" ".join(v)}' for k, v in e.message_dict.items())) from None
+    return instance, values
+
+
+def _derived_fields(model):
+    """(source, derived) field pairs that save() would recompute"""
+    if model is Project:
+        return [('completion_date', 'completed_on')]
+    if model is TeamMember:
+        return [(source, target) for source, (target, _) in TeamMember.PARSED_FIELDS.items()]
+    return []
+
+
+def _key(spec, source):
+    get = source.get if isinstance(source, dict) else lambda name: getattr(source, name)
+    return tuple(str(get(name) or '') for name in spec.key)
+
+
+def _update_many(model, instances, field_names):
+    """
+    Write ``field_names`` of ``instances`` with one parameterised UPDATE run
+    through ``executemany``. ``QuerySet.bulk_update`` builds a CASE expression
+    per field and row, which costs far more than the UPDATEs themselves at
+    import batch sizes.
+    """
+    db = router.db_for_write(model)
+    connection = connections[db]
+    qn = connection.ops.quote_name
+    fields = [model._meta.get_field(name) for name in field_names]
+    sql = 'UPDATE {} SET {} WHERE {} = %s'.format(
+        qn(model._meta.db_table),
+        ', '.join(f'{qn(f.column)} = %s' for f in fields),
+        qn(model._meta.pk.column),
+    )
+    params = [
+        [f.get_db_prep_save(f.pre_save(instance, False), connection) for f in fields] + [instance.pk]
+        for instance in instances
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, params)
+
+
+def _import_batch(spec, batch, create_only, result):
+    prepared = []
+    for line, instance, values, images in batch:
+        try:
+            for name, resolve in images.items():
+                setattr(instance, name, resolve())
+        except (OSError, ImportRowError) as e:
+            result.error(line, str(e))
+            continue
+        prepared.append((instance, values))
+
+    existing = {}
+    if not create_only and prepared:
+        lookup = {spec.key[0] + '__in': {_key(spec, instance)[0] for instance, _ in prepared}}
+        for obj in spec.model.objects.filter(**lookup):
+            existing[_key(spec, obj)] = obj
+
+    to_create, to_update, update_fields = [], {}, set()
+    category_deltas = Counter()
+    for instance, values in prepared:
+        key = _key(spec, instance)
+        match = existing.get(key)
+        if match is None:
+            to_create.append(instance)
+            if not create_only:
+                existing[key] = instance
+            continue
+        fields = list(values) + [derived for source, derived in _derived_fields(spec.model) if source in values]
+        changed = [name for name in fields if getattr(match, name) != getattr(instance, name)]
+        if spec.model is Project and 'category' in changed and match.pk is not None:
+            category_deltas[match.category] -= 1
+            category_deltas[instance.category] += 1
+        for name in changed:
+            setattr(match, name, getattr(instance, name))
+        # A key repeated within the batch just overwrites the pending row
+        if match.pk is None:
+            continue
+        if not changed:
+            result.unchanged += 1
+            continue
+        update_fields.update(changed)
+        to_update[match.pk] = match
+
+    with transaction.atomic():
+        created = spec.model.objects.bulk_create(to_create, batch_size=len(to_create) or None)
+        if to_update:
+            _update_many(spec.model, list(to_update.values()), sorted(update_fields))
+        if spec.model is Project:
+            category_deltas.update(project.category for project in created)
+            technologies.adjust_category_counts(category_deltas)
+            technologies.sync_projects([*created, *(project for project in to_update.values()
+                                                    if 'technologies' in update_fields)])
+    if spec.model is Project:
+        result.reindexed.update(project.pk for project in created)
+        if {'technologies', 'category'} & update_fields:
+            result.reindexed.update(to_update)
+        if to_update:
+            # Including the details of projects listing an updated one as related work
+            invalidate_project_details([*to_update, *RelatedProject.objects.filter(
+                related__in=list(to_update)).values_list('project_id', flat=True)])
+    if spec.image_fields:
+        enqueue_renditions(*created, *to_update.values())
+    result.created += len(created)
+    result.updated += len(to_update)
+
+
+def import_rows(spec, rows, batch_size=500, image_root=None, workers=8, create_only=False):
+    """Import ``(line, row)`` pairs; bad rows are reported in the result and skipped"""
+    result = ImportResult()
+    member_slugs = dict(TeamMember.objects.exclude(slug=None).values_list('slug', 'pk')) \
+        if 'team_member' in spec.fields else {}
+    fetcher = ImageFetcher(spec.model, image_root=image_root, workers=workers)
+    batch = []
+    try:
+        for line, row in rows:
+            try:
+                instance, values = _build_instance(spec, row, member_slugs)
+                # Start the image copies now so they overlap with parsing the rest of the batch
+                images = {name: fetcher.submit(name, row.get(name)) for name in spec.image_fields if name in row}
+            except (ImportRowError, ValueError, TypeError) as e:
+                result.error(line, str(e))
+                continue
+            batch.append((line, instance, values, images))
+            if len(batch) >= batch_size:
+                _import_batch(spec, batch, create_only, result)
+                batch = []
+        if batch:
+            _import_batch(spec, batch, create_only, result)
+    finally:
+        fetcher.close()
+        if result.reindexed:
+            related.refresh_projects(result.reindexed)
+        if result.created or result.updated:
+            # Bulk writes don't send post_save, so invalidate here
+            for namespace in (PORTFOLIO_NAMESPACE, CONTENT_NAMESPACE, TEAM_NAMESPACE):
+                bump_version(namespace)
+            mark_content_changed()
+    return result
+
+
+def open_input(path):
+    if path == '-':
+        return sys.stdin
+    return open(path, newline='', encoding='utf-8')
+
+
+def open_output(path, stdout=sys.stdout):
+    if path == '-':
+        return stdout
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return open(path, 'w', newline='', encoding='utf-8')
@@ -0,0 +1,126 @@
+"""
+Versioned cache helpers for content that is identical for every visitor.
+
+Each namespace (e.g. ``portfolio``) owns a version counter in the cache.
+Cached entries embed the current version in their key, so bumping the
+counter from a model signal invalidates every entry of that namespace at
+once without having to know which keys were written.
+
+Everything here lives in the long-lived ``content`` cache alias.
+"""
+import time
+
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+
+CONTENT_CACHE_ALIAS = 'content'
+cache = ConnectionProxy(caches, CONTENT_CACHE_ALIAS)
+
+# Entries are invalidated through the version counter, the timeout only
+# bounds how long orphaned entries of old versions linger in the cache.
+CACHE_TIMEOUT = 60 * 60 * 24
+
+# Project cards shown on the home and portfolio pages
+PORTFOLIO_NAMESPACE = 'portfolio'
+
+# Template fragments shared by all users on the home, portfolio and about pages
+CONTENT_NAMESPACE = 'content'
+
+# Modal details of a single project (``core:project:<pk>:detail``). These are
+# keyed by pk instead of a namespace version and deleted one by one, so
+# editing a project leaves the other projects' details cached.
+PROJECT_DETAIL_KEY = 'core:project:{}:detail'
+
+# Team member lookups (slug -> pk map used by the portfolio routes)
+TEAM_NAMESPACE = 'team'
+
+# allauth SocialApp configuration (Google OAuth availability flag)
+SOCIAL_APP_NAMESPACE = 'socialapp'
+
+
+# Timestamp of the last Project/TeamMember/Testimonial change, used as the
+# Last-Modified/ETag source for conditional GETs on the content pages
+CONTENT_CHANGED_KEY = 'core:content:changed_at'
+
+
+def _version_key(namespace):
+    return f'core:{namespace}:version'
+
+
+def get_version(namespace):
+    """Return the current version of a namespace, initialising it if needed"""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Seed with a timestamp so an evicted counter never restarts at a
+        # version whose entries may still be in the cache.
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace):
+    """Invalidate every cached entry of a namespace"""
+    key = _version_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), None)
+
+
+def versioned_key(namespace, name):
+    return f'core:{namespace}:v{get_version(namespace)}:{name}'
+
+
+def get_or_build(namespace, name, builder, timeout=CACHE_TIMEOUT):
+    """
+    Read-through lookup: return the cached value for ``name`` in the current
+    version of ``namespace``, calling ``builder()`` and storing its result on
+    a miss.
+    """
+    key = versioned_key(namespace, name)
+    value = cache.get(key)
+    if value is None:
+        value = builder()
+        cache.set(key, value, timeout)
+    return value
+
+
+def get_or_build_many(key_format, ids, builder, timeout=CACHE_TIMEOUT):
+    """
+    Batched read-through lookup of per-object entries: return ``{id: value}``
+    for the ``ids`` found in the cache or built by ``builder(missing_ids)``,
+    which returns a ``{id: value}`` dict and may omit ids that don't exist.
+    """
+    keys = {key_format.format(pk): pk for pk in ids}
+    values = {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+    missing = [pk for pk in keys.values() if pk not in values]
+    if missing:
+        built = builder(missing)
+        cache.set_many({key_format.format(pk): value for pk, value in built.items()}, timeout)
+        values.update(built)
+    return values
+
+
+def invalidate_project_details(pks):
+    """Drop the cached modal details of the given projects"""
+    cache.delete_many([PROJECT_DETAIL_KEY.format(pk) for pk in pks])
+
+
+def mark_content_changed():
+    """Record that page content changed just now"""
+    cache.set(CONTENT_CHANGED_KEY, time.time(), None)
+
+
+def content_changed_at():
+    """
+    Return the epoch time of the last content change. A missing marker is
+    re-seeded with the current time, which errs on the side of a fresh render.
+    """
+    changed_at = cache.get(CONTENT_CHANGED_KEY)
+    if changed_at is None:
+        now = time.time()
+        cache.add(CONTENT_CHANGED_KEY, now, None)
+        # A cache that stores nothing (DummyCache) means "always changed"
+        changed_at = cache.get(CONTENT_CHANGED_KEY, now)
+    return changed_at
@@ -0,0 +1,64 @@
+"""
+Conditional GET support for the content pages.
+
+The portfolio, about, team and team member pages only change when an admin
+edits a Project, TeamMember or Testimonial, so their validators come from the
+content change marker kept by core.signals. The shared layout is still
+user-specific (name in the nav, staff links, CSRF tokens in forms), so the
+ETag also folds in the visitor's identity. A matching request is answered
+with a 304 before the view or the template engine runs.
+"""
+import hashlib
+from datetime import datetime, timezone
+
+from django.contrib.messages import get_messages
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.views.decorators.http import condition
+
+from .caching import SOCIAL_APP_NAMESPACE, content_changed_at, get_version
+
+
+def _user_identity(request):
+    user = request.user
+    if not user.is_authenticated:
+        parts = ['anonymous']
+    else:
+        parts = [user.pk, user.username, user.first_name, user.is_staff, user.is_superuser]
+    # The CSRF secret rotates on login, so a cached page never carries a stale token
+    parts.append(request.META.get('CSRF_COOKIE', ''))
+    return ':'.join(str(part) for part in parts)
+
+
+def _validators(request):
+    """Compute ``(etag, last_modified)`` once per request, or ``(None, None)`` to opt out"""
+    if not hasattr(request, '_content_validators'):
+        if len(get_messages(request)):
+            # Pending flash messages are rendered (and consumed) by the page
+            request._content_validators = (None, None)
+        else:
+            changed_at = content_changed_at()
+            last_modified = datetime.fromtimestamp(changed_at, tz=timezone.utc)
+            last_login = getattr(request.user, 'last_login', None)
+            if last_login and last_login > last_modified:
+                last_modified = last_login
+            raw = ':'.join([
+                repr(changed_at),
+                str(get_version(SOCIAL_APP_NAMESPACE)),
+                # Changes with every deploy that touches static files
+                getattr(staticfiles_storage, 'manifest_hash', ''),
+                _user_identity(request),
+            ])
+            request._content_validators = (hashlib.sha256(raw.encode()).hexdigest()[:32], last_modified)
+    return request._content_validators
+
+
+def content_etag(request, *args, **kwargs):
+    return _validators(request)[0]
+
+
+def content_last_modified(request, *args, **kwargs):
+    return _validators(request)[1]
+
+
+# Decorator for views whose output depends only on content models and the visitor
+content_conditional = condition(etag_func=content_etag, last_modified_func=content_last_modified)
@@ -1,20 +1,42 @@
 from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
 from allauth.socialaccount.models import SocialApp
 
+from .caching import SOCIAL_APP_NAMESPACE, get_or_build, get_version
+
+# In-process (version, available) pair so renders skip even the shared cache
+# lookup of the flag until core.signals bumps the social app version.
+_google_oauth_available = (None, False)
+
+
+def _google_app_exists():
+    return SocialApp.objects.filter(provider='google').exists()
+
 
 def google_oauth_context(request):
     """
     Add Google OAuth availability to all templates.
     This prevents DoesNotExist errors when Google OAuth app is not configured.
     """
+    global _google_oauth_available
     try:
-        google_app = SocialApp.objects.get(provider='google')
-        google_oauth_available = True
-    except SocialApp.DoesNotExist:
-        google_oauth_available = False
+        version = get_version(SOCIAL_APP_NAMESPACE)
+        cached_version, google_oauth_available = _google_oauth_available
+        if cached_version != version:
+            google_oauth_available = get_or_build(SOCIAL_APP_NAMESPACE, 'google_oauth_available', _google_app_exists)
+            _google_oauth_available = (version, google_oauth_available)
     except Exception:
+        # Not cached, so a transient database error doesn't stick
         google_oauth_available = False
 
     return {
         'google_oauth_available': google_oauth_available,
     }
+
+
+def static_version(request):
+    """
+    Hash of the static files manifest, part of every shared fragment cache
+    key: the fragments embed hashed static URLs, which a deploy can remove
+    """
+    return {'static_version': getattr(staticfiles_storage, 'manifest_hash', '')}
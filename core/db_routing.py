@@ -0,0 +1,58 @@
+"""
+Primary/replica routing.
+
+Writes always go to the primary. Reads go to the replica only while a view
+wrapped in ``read_from_replica`` is running, and only when
+``settings.DATABASE_REPLICA_ALIAS`` names a configured replica. Everything
+else (auth, sessions, admin, forms) keeps reading from the primary, so a
+user never reads back a stale copy of what they just wrote.
+"""
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+from .caching import content_changed_at
+
+_read_alias = ContextVar('core_read_alias', default=None)
+
+
+def replica_alias():
+    """The alias replica-eligible reads should use right now, or None for the primary"""
+    alias = getattr(settings, 'DATABASE_REPLICA_ALIAS', None)
+    if not alias:
+        return None
+    # Just after an edit the replica may not have caught up yet, and whatever
+    # is read now ends up in the versioned page caches.
+    if time.time() - content_changed_at() < settings.DATABASE_REPLICA_LAG:
+        return None
+    return alias
+
+
+def read_from_replica(view):
+    """Route the ORM reads made while ``view`` runs (including template rendering) to the replica"""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        token = _read_alias.set(replica_alias())
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
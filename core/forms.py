@@ -110,3 +110,22 @@ class MeetingForm(forms.ModelForm):
             'date': forms.DateInput(attrs={'class': 'form-control', 'type': 'text', 'id': 'meetingDatePicker', 'autocomplete': 'off'}),
             'time': forms.TimeInput(attrs={'class': 'form-control', 'type': 'time'}),
         }
+
+class MeetingFilterForm(forms.Form):
+    """Filters and paging parameters for the staff meetings dashboard"""
+    status = forms.ChoiceField(
+        choices=[('', 'All statuses')] + Meeting.STATUS_CHOICES,
+        required=False,
+        widget=forms.Select(attrs={'class': 'form-select'}),
+    )
+    date_from = forms.DateField(required=False, widget=forms.DateInput(attrs={'class': 'form-control', 'type': 'date'}))
+    date_to = forms.DateField(required=False, widget=forms.DateInput(attrs={'class': 'form-control', 'type': 'date'}))
+    cursor = forms.CharField(required=False, widget=forms.HiddenInput)
+    limit = forms.IntegerField(required=False, min_value=1, max_value=100, widget=forms.HiddenInput)
+
+class PortfolioFilterForm(forms.Form):
+    """Filters and paging parameters for the portfolio page and its JSON endpoint"""
+    tech = forms.CharField(required=False, max_length=100)
+    category = forms.ChoiceField(choices=[('', 'All categories')] + Project.CATEGORY_CHOICES, required=False)
+    cursor = forms.CharField(required=False)
+    limit = forms.IntegerField(required=False, min_value=1, max_value=48)
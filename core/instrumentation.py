@@ -0,0 +1,172 @@
+"""
+Lightweight instrumentation for the meeting scheduling pipeline.
+
+span() times a stage (token load, client build, event insert, email send)
+and emits one structured log record per stage on the ``core.instrumentation``
+logger at DEBUG level, so nothing is formatted or written unless that level
+is enabled. When settings.METRICS_ENABLED is true the durations are also
+recorded in per-stage latency histograms, exposed in Prometheus text format
+by the metrics view.
+
+Most stages run in the worker commands (send_queued_mail,
+process_calendar_jobs), not in the web process that serves the metrics, so
+the histograms are counters in the ``metrics`` cache alias that every
+process increments. With the redis backend they are shared by every process
+and host and increments are atomic. The file backend shares them between the
+processes of one host, but its incr() is a read followed by a write, so
+observations recorded at the same moment by two processes can be lost;
+treat those numbers as approximate. With locmem each process sees just its
+own.
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS_CACHE_ALIAS = 'metrics'
+
+# Stages that have recorded at least once, so the metrics view knows which
+# counters to read
+STAGES_KEY = 'core:metrics:stages'
+
+# Stages this process has seen in STAGES_KEY
+_registered = set()
+_registered_lock = threading.Lock()
+
+
+def metrics_enabled():
+    return getattr(settings, 'METRICS_ENABLED', False)
+
+
+def _metrics_cache():
+    return caches[METRICS_CACHE_ALIAS]
+
+
+def _bucket_key(stage, index):
+    # Non-cumulative: index i counts durations in (buckets[i - 1], buckets[i]],
+    # index len(buckets) the ones above the last bound
+    return f'core:metrics:{stage}:bucket:{index}'
+
+
+def _sum_key(stage):
+    # Total duration in microseconds, an integer so it can be incremented
+    return f'core:metrics:{stage}:sum_us'
+
+
+def _increment(cache, key, delta=1):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # First observation: create the counter, unless another process just did
+        if not cache.add(key, delta, None):
+            cache.incr(key, delta)
+
+
+def _register(cache, stage):
+    """
+    Add ``stage`` to the shared stage list. The list is rewritten without a
+    lock, so a concurrent registration can drop it; the stage is only
+    remembered once it has been read back, which repairs that on the next
+    observation.
+    """
+    stages = cache.get(STAGES_KEY) or []
+    if stage in stages:
+        with _registered_lock:
+            _registered.add(stage)
+    else:
+        cache.set(STAGES_KEY, sorted({*stages, stage}), None)
+
+
+def observe(stage, seconds):
+    """Record a stage duration in its histogram"""
+    cache = _metrics_cache()
+    _increment(cache, _bucket_key(stage, bisect_left(LATENCY_BUCKETS, seconds)))
+    _increment(cache, _sum_key(stage), round(seconds * 1_000_000))
+    if stage not in _registered:
+        _register(cache, stage)
+
+
+def reset_metrics():
+    cache = _metrics_cache()
+    stages = cache.get(STAGES_KEY) or []
+    cache.delete_many([STAGES_KEY, *(_sum_key(stage) for stage in stages), *(
+        _bucket_key(stage, index) for stage in stages for index in range(len(LATENCY_BUCKETS) + 1))])
+    with _registered_lock:
+        _registered.clear()
+
+
+def snapshot():
+    """{stage: (cumulative bucket counts, count, sum in seconds)} read from the shared counters"""
+    cache = _metrics_cache()
+    stages = cache.get(STAGES_KEY) or []
+    keys = {stage: ([_bucket_key(stage, index) for index in range(len(LATENCY_BUCKETS) + 1)], _sum_key(stage))
+            for stage in stages}
+    values = cache.get_many([key for bucket_keys, sum_key in keys.values() for key in (*bucket_keys, sum_key)])
+    result = {}
+    for stage, (bucket_keys, sum_key) in keys.items():
+        counts, running = [], 0
+        for key in bucket_keys:
+            running += values.get(key, 0)
+            counts.append(running)
+        result[stage] = (counts[:-1], running, values.get(sum_key, 0) / 1_000_000)
+    return result
+
+
+@contextmanager
+def span(stage, **fields):
+    """
+    Time the enclosed block as ``stage``. Extra keyword fields are attached to
+    the log record (e.g. meeting_id, batch_size) for structured handlers.
+    """
+    log_enabled = logger.isEnabledFor(logging.DEBUG)
+    record_metrics = metrics_enabled()
+    if not (log_enabled or record_metrics):
+        yield
+        return
+
+    outcome = 'ok'
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        outcome = 'error'
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        if record_metrics:
+            try:
+                observe(stage, elapsed)
+            except Exception:
+                # An unreachable metrics cache must not fail the work being timed
+                logger.warning('Could not record duration of stage %s', stage, exc_info=True)
+        if log_enabled:
+            logger.debug(
+                'stage=%s outcome=%s duration_ms=%.1f %s', stage, outcome, elapsed * 1000,
+                ' '.join(f'{key}={value}' for key, value in fields.items()),
+                extra={'stage': stage, 'outcome': outcome, 'duration_ms': round(elapsed * 1000, 1), **fields},
+            )
+
+
+def render_prometheus():
+    """Render all stage histograms in the Prometheus text exposition format"""
+    name = 'core_stage_duration_seconds'
+    lines = [
+        f'# HELP {name} Duration of meeting pipeline stages.',
+        f'# TYPE {name} histogram',
+    ]
+    for stage, (counts, count, total) in sorted(snapshot().items()):
+        for bound, bucket_count in zip(LATENCY_BUCKETS, counts):
+            lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {bucket_count}')
+        lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {count}')
+        lines.append(f'{name}_sum{{stage="{stage}"}} {total}')
+        lines.append(f'{name}_count{{stage="{stage}"}} {count}')
+    return '\n'.join(lines) + '\n'
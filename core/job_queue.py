@@ -0,0 +1,129 @@
+"""
+Claiming, leases and retry backoff shared by the database-backed work queues
+(core.mail_queue, core.meeting_jobs, core.renditions).
+
+A worker claims due rows by moving them to the queue's claimed status
+('sending', 'running') and stamping ``claimed_at``. The claim is a lease: a
+worker that crashes or is stopped before recording an outcome leaves the
+row claimed, and once the lease has run out the next claim_batch() counts
+the lost run as a failed attempt and puts the row back in the queue, or
+fails it when it has used up its attempts.
+
+QueueWorkerCommand is the polling loop behind the worker management commands.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Retry delays: 1, 2, 4, 8... minutes, capped at one hour
+BACKOFF_BASE_SECONDS = 60
+BACKOFF_MAX_SECONDS = 60 * 60
+
+LEASE_EXPIRED_ERROR = 'Worker lease expired before the job finished'
+
+
+def backoff_delay(attempts):
+    """Seconds to wait before retrying a job that has failed ``attempts`` times"""
+    return min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+
+
+def _lease_start(lease_seconds, now=None):
+    """Claims made before this moment have expired"""
+    return (now or timezone.now()) - timedelta(seconds=lease_seconds)
+
+
+def queued(claimed_status, lease_seconds):
+    """Q for rows that are waiting to run or held by a worker whose lease is still valid"""
+    return Q(status='pending') | Q(status=claimed_status, claimed_at__gt=_lease_start(lease_seconds))
+
+
+def release_expired(model, claimed_status, lease_seconds, max_attempts):
+    """
+    Put rows whose lease has expired back in the queue, counting the lost
+    run as an attempt. Returns the number of rows released.
+    """
+    now = timezone.now()
+    expired = model.objects.filter(status=claimed_status, claimed_at__lte=_lease_start(lease_seconds, now))
+    given_up = expired.filter(attempts__gte=max_attempts - 1).update(
+        status='failed', attempts=F('attempts') + 1, last_error=LEASE_EXPIRED_ERROR, claimed_at=None,
+    )
+    retried = expired.update(
+        status='pending', attempts=F('attempts') + 1, last_error=LEASE_EXPIRED_ERROR, claimed_at=None,
+        next_attempt_at=now,
+    )
+    if given_up or retried:
+        logger.warning(f"Released {retried + given_up} expired {model.__name__} claims "
+                       f"({retried} requeued, {given_up} failed)")
+    return retried + given_up
+
+
+def claim_batch(queryset, batch_size, claimed_status, lease_seconds, max_attempts):
+    """
+    Move up to ``batch_size`` due rows of ``queryset`` to ``claimed_status``
+    under a fresh lease and return them, oldest due first. Expired claims
+    are released first so they are picked up again.
+    """
+    model = queryset.model
+    with transaction.atomic():
+        release_expired(model, claimed_status, lease_seconds, max_attempts)
+        now = timezone.now()
+        due = (
+            queryset
+            .select_for_update(skip_locked=True)
+            .filter(status='pending', next_attempt_at__lte=now)
+            .order_by('next_attempt_at', 'pk')[:batch_size]
+        )
+        batch = list(due)
+        model.objects.filter(pk__in=[item.pk for item in batch]).update(status=claimed_status, claimed_at=now)
+    for item in batch:
+        item.status, item.claimed_at = claimed_status, now
+    return batch
+
+
+class QueueWorkerCommand(BaseCommand):
+    """
+    Runs ``process_batch`` until the queue is drained, or keeps polling with
+    --loop. Subclasses set the defaults and name the two outcome counts.
+    """
+    default_batch_size = 10
+    default_max_attempts = 3
+    default_interval = 5.0
+    batch_size_help = 'Maximum number of jobs claimed per batch'
+    outcomes = ('succeeded', 'failed')
+
+    def process_batch(self, batch_size, max_attempts):
+        """Run one batch; returns a tuple of counts matching ``outcomes``"""
+        raise NotImplementedError
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=self.default_batch_size,
+                            help=self.batch_size_help)
+        parser.add_argument('--max-attempts', type=int, default=self.default_max_attempts,
+                            help='Attempts before a job is marked as failed')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep polling the queue instead of exiting once it is drained')
+        parser.add_argument('--interval', type=float, default=self.default_interval,
+                            help='Seconds to sleep between polls when the queue is empty (with --loop)')
+
+    def handle(self, *args, **options):
+        ok_label, failed_label = self.outcomes
+        total_ok = total_failed = 0
+        while True:
+            ok, failed = self.process_batch(options['batch_size'], options['max_attempts'])
+            total_ok += ok
+            total_failed += failed
+            if ok or failed:
+                self.stdout.write(f'Batch: {ok} {ok_label}, {failed} {failed_label}')
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'Done: {total_ok} {ok_label}, {total_failed} {failed_label}'))
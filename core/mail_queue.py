@@ -0,0 +1,104 @@
+"""
+Database-backed outbound mail queue.
+
+Views call enqueue_mail() instead of send_mail(), which only inserts an
+OutboundEmail row. The send_queued_mail management command drains the queue
+in batches over a single SMTP connection and retries failed messages with
+exponential backoff. Claims are leased (see core.job_queue), so messages
+held by a worker that died are picked up again.
+"""
+import logging
+from datetime import timedelta
+
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from .instrumentation import span
+from .job_queue import backoff_delay, claim_batch
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+MAX_ATTEMPTS = 5
+# How long a claimed batch may stay 'sending' before another worker retries it
+LEASE_SECONDS = 15 * 60
+
+
+def enqueue_mail(subject, message, from_email, recipient_list):
+    """Queue an email for the worker - same arguments as django.core.mail.send_mail"""
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email,
+        recipients=list(recipient_list),
+    )
+
+
+def enqueue_mass_mail(datatuple):
+    """
+    Queue several emails with one INSERT - same datatuple format as
+    django.core.mail.send_mass_mail: (subject, message, from_email, recipient_list)
+    """
+    return OutboundEmail.objects.bulk_create([
+        OutboundEmail(subject=subject, body=message, from_email=from_email, recipients=list(recipient_list))
+        for subject, message, from_email, recipient_list in datatuple
+    ])
+
+
+def _record_failure(email, error, max_attempts):
+    email.attempts += 1
+    email.last_error = str(error)
+    if email.attempts >= max_attempts:
+        email.status = 'failed'
+        logger.error(f"Giving up on email {email.pk} after {email.attempts} attempts: {error}")
+    else:
+        email.status = 'pending'
+        email.next_attempt_at = timezone.now() + timedelta(seconds=backoff_delay(email.attempts))
+        logger.warning(f"Email {email.pk} failed (attempt {email.attempts}), retrying at {email.next_attempt_at}: {error}")
+    email.claimed_at = None
+    email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at', 'claimed_at'])
+
+
+def send_queued_mail(batch_size=DEFAULT_BATCH_SIZE, max_attempts=MAX_ATTEMPTS, connection=None):
+    """
+    Deliver one batch of due messages over a single connection.
+    Returns a (sent, failed) tuple of message counts.
+    """
+    batch = claim_batch(OutboundEmail.objects.all(), batch_size, 'sending', LEASE_SECONDS, max_attempts)
+    if not batch:
+        return 0, 0
+
+    connection = connection or get_connection()
+    sent = failed = 0
+    try:
+        with span('smtp_connect'):
+            connection.open()
+    except Exception as e:
+        # Nothing can be delivered this round, reschedule the whole batch
+        for email in batch:
+            _record_failure(email, e, max_attempts)
+        return 0, len(batch)
+
+    try:
+        for email in batch:
+            message = EmailMessage(email.subject, email.body, email.from_email, email.recipients, connection=connection)
+            try:
+                with span('email_send', email_id=email.pk):
+                    connection.send_messages([message])
+            except Exception as e:
+                _record_failure(email, e, max_attempts)
+                failed += 1
+                continue
+            email.status = 'sent'
+            email.attempts += 1
+            email.sent_at = timezone.now()
+            email.last_error = ''
+            email.claimed_at = None
+            email.save(update_fields=['status', 'attempts', 'sent_at', 'last_error', 'claimed_at'])
+            sent += 1
+    finally:
+        connection.close()
+
+    logger.info(f"Mail queue batch done: {sent} sent, {failed} failed")
+    return sent, failed
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from core.models import Project, TeamMember, Testimonial
+from core.renditions import RENDITION_FIELDS, enqueue_renditions, process_rendition_jobs
+
+
+class Command(BaseCommand):
+    help = 'Queue rendition jobs for existing project, team member and testimonial images'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--run', action='store_true',
+                            help='Process the queued jobs in this command instead of leaving them to the worker')
+
+    def handle(self, *args, **options):
+        queued = 0
+        for model in (Project, TeamMember, Testimonial):
+            fields = list(RENDITION_FIELDS[model.__name__])
+            for instance in model.objects.only('pk', *fields).iterator():
+                queued += len(enqueue_renditions(instance))
+        self.stdout.write(f'Queued {queued} image(s)')
+
+        if options['run']:
+            total_succeeded = total_failed = 0
+            while True:
+                succeeded, failed = process_rendition_jobs()
+                if not (succeeded or failed):
+                    break
+                total_succeeded += succeeded
+                total_failed += failed
+            self.stdout.write(self.style.SUCCESS(f'Done: {total_succeeded} succeeded, {total_failed} failed'))
@@ -0,0 +1,107 @@
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.test import override_settings
+
+from core import related, technologies
+from core.models import Project, ProjectTechnology, RelatedProject, Technology
+
+
+class Command(BaseCommand):
+    help = ('Seed scratch SQLite databases with synthetic projects and time the full related projects '
+            'rebuild and an incremental refresh after one project changes')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+        parser.add_argument('--technologies', type=int, default=300, help='Distinct technology tags')
+        parser.add_argument('--top-k', type=int, default=settings.RELATED_PROJECTS_TOP_K)
+        parser.add_argument('--metric', choices=related.METRICS, default=settings.RELATED_PROJECTS_METRIC)
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'{"projects":>9} {"links":>8} {"load":>7} {"compute":>8} {"rebuild":>8} '
+                          f'{"refresh":>8} {"lists":>6}')
+        for size in options['sizes']:
+            with tempfile.TemporaryDirectory() as tmp:
+                row = self.run_size(size, Path(tmp) / 'bench.sqlite3', options)
+            self.stdout.write('{:>9} {:>8} {:>6.2f}s {:>7.2f}s {:>7.2f}s {:>7.3f}s {:>6}'.format(size, *row))
+
+    def run_size(self, size, path, options):
+        settings_dict = connections.settings[DEFAULT_DB_ALIAS]
+        saved = settings_dict['NAME'], settings_dict['OPTIONS']
+        connections.close_all()
+        settings_dict['NAME'] = str(path)
+        settings_dict['OPTIONS'] = {}
+        overrides = override_settings(
+            CACHES={alias: {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+                    for alias in ('default', 'content', 'sessions')},
+            DATABASE_REPLICA_ALIAS=None,
+        )
+        try:
+            with overrides:
+                call_command('migrate', verbosity=0, interactive=False)
+                links = self.seed(size, options)
+                return (links, *self.measure(options))
+        finally:
+            connections.close_all()
+            settings_dict['NAME'], settings_dict['OPTIONS'] = saved
+
+    def seed(self, size, options):
+        """Projects with 2-8 technologies each, drawn from a long-tailed popularity distribution"""
+        rng = np.random.default_rng(options['seed'])
+        tags = options['technologies']
+        popularity = 1 / np.arange(1, tags + 1) ** 1.1
+        popularity /= popularity.sum()
+        names = [f'Tech {i}' for i in range(tags)]
+        categories = [value for value, _ in Project.CATEGORY_CHOICES]
+
+        with transaction.atomic():
+            Technology.objects.bulk_create([Technology(name=name, slug=technologies.technology_slug(name))
+                                            for name in names])
+            technology_ids = dict(Technology.objects.values_list('name', 'pk'))
+            stacks = [sorted(set(rng.choice(tags, size=rng.integers(2, 9), p=popularity).tolist()))
+                      for _ in range(size)]
+            projects = Project.objects.bulk_create([
+                Project(title=f'Project {i}', description='Description', client='Client',
+                        category=categories[rng.integers(len(categories))], completion_date='2024-01',
+                        technologies=[names[t] for t in stack])
+                for i, stack in enumerate(stacks)
+            ], batch_size=2000)
+            links = [ProjectTechnology(project_id=project.pk, technology_id=technology_ids[names[t]])
+                     for project, stack in zip(projects, stacks) for t in stack]
+            ProjectTechnology.objects.bulk_create(links, batch_size=5000)
+            technologies.recount()
+        return len(links)
+
+    def measure(self, options):
+        top_k, metric = options['top_k'], options['metric']
+
+        started = time.perf_counter()
+        matrix = related.load_features()
+        load = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in related.top_neighbours(matrix, np.arange(len(matrix)), top_k, metric):
+            pass
+        compute = time.perf_counter() - started
+
+        started = time.perf_counter()
+        related.rebuild(top_k, metric)
+        rebuild = time.perf_counter() - started
+
+        # Give one project a different stack, as an admin edit would
+        project = Project.objects.order_by('?').first()
+        project.technologies = ['Tech 0', 'Tech 5', 'Tech 50']
+        Project.objects.filter(pk=project.pk).update(technologies=project.technologies)
+        technologies.sync_projects([project])
+        started = time.perf_counter()
+        lists = len(related.refresh_projects([project.pk], top_k, metric))
+        refresh = time.perf_counter() - started
+        assert RelatedProject.objects.filter(project=project).exists()
+        return load, compute, rebuild, refresh, lists
@@ -0,0 +1,167 @@
+import logging
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connection, connections
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from core.models import Project, TeamMember
+from core.sqlite import production_pragmas
+
+PROFILES = ('default', 'sqlite-production')
+
+
+class Counters:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reads, self.writes, self.failed, self.locked = [], [], 0, 0
+
+    def record(self, kind, started):
+        with self.lock:
+            getattr(self, kind).append(time.perf_counter() - started)
+
+    def error(self, locked):
+        with self.lock:
+            if locked:
+                self.locked += 1
+            else:
+                self.failed += 1
+
+
+def _p95(samples):
+    if len(samples) < 2:
+        return sum(samples)
+    return statistics.quantiles(samples, n=20)[-1]
+
+
+class Command(BaseCommand):
+    help = ('Fire parallel contact/meeting submissions alongside portfolio reads at a scratch SQLite '
+            'database, with and without the sqlite-production profile, and report throughput and lock errors')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', choices=PROFILES + ('both',), default='both')
+        parser.add_argument('--writers', type=int, default=4)
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds per profile')
+        parser.add_argument('--projects', type=int, default=60)
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            self.stderr.write('The default database is not SQLite; the benchmark uses a scratch SQLite file anyway')
+        profiles = PROFILES if options['profile'] == 'both' else (options['profile'],)
+
+        # Per-request logging would dominate the run
+        quiet = [logging.getLogger(name) for name in ('core', 'django.request')]
+        levels = [logger.level for logger in quiet]
+        for logger in quiet:
+            logger.setLevel(logging.CRITICAL)
+        try:
+            self.stdout.write(f'{"profile":<18} {"total/s":>8} {"reads/s":>8} {"writes/s":>9} {"p95 read":>9} '
+                              f'{"p95 write":>10} {"locked":>7} {"failed":>7}')
+            for profile in profiles:
+                with tempfile.TemporaryDirectory() as tmp:
+                    counters = self.run_profile(profile, Path(tmp) / 'bench.sqlite3', options)
+                duration = options['duration']
+                self.stdout.write(
+                    f'{profile:<18} {(len(counters.reads) + len(counters.writes)) / duration:>8.1f} '
+                    f'{len(counters.reads) / duration:>8.1f} {len(counters.writes) / duration:>9.1f} '
+                    f'{_p95(counters.reads) * 1000:>7.1f}ms {_p95(counters.writes) * 1000:>8.1f}ms '
+                    f'{counters.locked:>7} {counters.failed:>7}')
+        finally:
+            for logger, level in zip(quiet, levels):
+                logger.setLevel(level)
+
+    def run_profile(self, profile, path, options):
+        production = profile == 'sqlite-production'
+        settings_dict = connections.settings[DEFAULT_DB_ALIAS]
+        saved = settings_dict['NAME'], settings_dict['OPTIONS']
+        connections.close_all()
+        settings_dict['NAME'] = str(path)
+        settings_dict['OPTIONS'] = {'transaction_mode': 'IMMEDIATE'} if production else {}
+        overrides = override_settings(
+            SQLITE_PRAGMAS=production_pragmas() if production else {},
+            # Every read has to reach the database for the numbers to mean anything
+            CACHES={alias: {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+                    for alias in ('default', 'content', 'sessions')},
+            SESSION_ENGINE='django.contrib.sessions.backends.db',
+            DATABASE_REPLICA_ALIAS=None,
+            ALLOWED_HOSTS=['testserver'],
+        )
+        try:
+            with overrides:
+                call_command('migrate', verbosity=0, interactive=False)
+                user = self.seed(options['projects'])
+                return self.hammer(user, options)
+        finally:
+            connections.close_all()
+            settings_dict['NAME'], settings_dict['OPTIONS'] = saved
+
+    def seed(self, project_count):
+        members = [TeamMember.objects.create(name=f'Member {i}', role='Developer', bio='Bio') for i in range(5)]
+        Project.objects.bulk_create([
+            Project(title=f'Project {i}', description='Description ' * 20, category='Web Development',
+                    client='Client', completion_date='2024-01', technologies=['Django', 'React'],
+                    team_member=members[i % len(members)])
+            for i in range(project_count)
+        ])
+        return User.objects.create_user('bench', 'bench@example.com', 'bench')
+
+    def hammer(self, user, options):
+        counters = Counters()
+        deadline = time.perf_counter() + options['duration']
+        portfolio_url, contact_url, meeting_url = reverse('portfolio'), reverse('contact'), reverse('schedule_meeting')
+
+        def call(kind, request):
+            started = time.perf_counter()
+            try:
+                ok = request()
+            except OperationalError as e:
+                counters.error(locked='locked' in str(e))
+            except Exception:
+                counters.error(locked=False)
+            else:
+                if ok:
+                    counters.record(kind, started)
+                else:
+                    counters.error(locked=False)
+
+        def reader():
+            client = Client()
+            client.force_login(user)
+            while time.perf_counter() < deadline:
+                call('reads', lambda: client.get(portfolio_url).status_code == 200)
+            connection.close()
+
+        def writer(n):
+            client = Client()
+            client.force_login(user)
+            i = 0
+            while time.perf_counter() < deadline:
+                i += 1
+                if i % 2:
+                    call('writes', lambda: client.post(contact_url, {
+                        'name': f'Writer {n}', 'email': 'writer@example.com', 'subject': f'Benchmark {i}',
+                        'message': 'Hello ' * 50, 'inquiry_type': 'general', 'preferred_contact': 'email1',
+                    }).status_code == 302)
+                else:
+                    # schedule_meeting reports its own failures as success: false
+                    call('writes', lambda: client.post(meeting_url, {
+                        'name': f'Writer {n}', 'email': 'writer@example.com', 'topic': 'Benchmark',
+                        'notes': 'Notes', 'date': '2030-01-15', 'time': '10:00',
+                    }, content_type='application/json').json()['success'])
+            connection.close()
+
+        threads = [threading.Thread(target=reader) for _ in range(options['readers'])]
+        threads += [threading.Thread(target=writer, args=(n,)) for n in range(options['writers'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return counters
@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from core.assets import extract_inline_assets
+
+
+class Command(BaseCommand):
+    help = ('Move inline <style>/<script> blocks out of the templates into static bundles, '
+            'then run collectstatic to minify, hash and precompress them')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--templates-dir', default=str(settings.TEMPLATES[0]['DIRS'][0]),
+                            help='Template directory to scan (default: the project templates dir)')
+        parser.add_argument('--static-dir', default=str(settings.STATICFILES_DIRS[0]),
+                            help='Static source directory the bundles are written into')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report what would be extracted without writing anything')
+        parser.add_argument('--no-collect', action='store_true',
+                            help='Only extract; skip collectstatic')
+
+    def handle(self, *args, **options):
+        results = extract_inline_assets(options['templates_dir'], options['static_dir'],
+                                        dry_run=options['dry_run'])
+        moved = skipped = 0
+        for result in results:
+            if result.bundles or result.skipped:
+                self.stdout.write(f'{result.template}: {len(result.bundles)} bundle(s), '
+                                  f'{result.bytes_moved} bytes moved, {result.skipped} left inline')
+            moved += result.bytes_moved
+            skipped += result.skipped
+        self.stdout.write(self.style.SUCCESS(
+            f'Extracted {moved} bytes of inline assets ({skipped} block(s) left inline)'))
+
+        if not (options['dry_run'] or options['no_collect']):
+            call_command('collectstatic', interactive=False, verbosity=options['verbosity'])
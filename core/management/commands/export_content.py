@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from core import bulk
+
+
+class Command(BaseCommand):
+    help = 'Stream projects, team members or testimonials to a JSONL or CSV file that import_content reads back'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=list(bulk.SPECS))
+        parser.add_argument('path', nargs='?', default='-', help="Output file, or '-' for stdout (default)")
+        parser.add_argument('--format', choices=('auto',) + bulk.FORMATS, default='auto',
+                            help='Defaults to csv for .csv files and jsonl otherwise')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Rows fetched per query')
+
+    def handle(self, *args, **options):
+        spec = bulk.SPECS[options['kind']]
+        fmt = bulk.detect_format(options['path'], None if options['format'] == 'auto' else options['format'])
+        stream = bulk.open_output(options['path'], self.stdout)
+        try:
+            count = bulk.write_rows(bulk.export_rows(spec, batch_size=options['batch_size']), stream, fmt,
+                                    spec.fields)
+        finally:
+            if stream is not self.stdout:
+                stream.close()
+        if stream is not self.stdout:
+            self.stdout.write(self.style.SUCCESS(f'Done: exported {count} row(s) to {options["path"]}'))
@@ -0,0 +1,54 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import bulk
+
+
+class Command(BaseCommand):
+    help = ('Import projects, team members or testimonials from a JSONL or CSV file, updating rows that '
+            'match an existing natural key (project title, team member slug, testimonial name and workplace)')
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=list(bulk.SPECS))
+        parser.add_argument('path', help="Input file, or '-' for stdin")
+        parser.add_argument('--format', choices=('auto',) + bulk.FORMATS, default='auto',
+                            help='Defaults to csv for .csv files and jsonl otherwise')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--image-root', help='Directory that relative image paths are resolved against')
+        parser.add_argument('--workers', type=int, default=8, help='Concurrent image copies')
+        parser.add_argument('--create-only', action='store_true',
+                            help='Skip the natural key lookups and insert every row (initial loads)')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1 or options['workers'] < 1:
+            raise CommandError('--batch-size and --workers must be at least 1')
+        spec = bulk.SPECS[options['kind']]
+        fmt = bulk.detect_format(options['path'], None if options['format'] == 'auto' else options['format'])
+
+        started = time.perf_counter()
+        try:
+            stream = bulk.open_input(options['path'])
+        except OSError as e:
+            raise CommandError(e)
+        try:
+            result = bulk.import_rows(
+                spec, bulk.read_rows(stream, fmt), batch_size=options['batch_size'],
+                image_root=options['image_root'], workers=options['workers'], create_only=options['create_only'],
+            )
+        except ValueError as e:
+            # Malformed JSON or CSV aborts the import; rows already written stay
+            raise CommandError(f'Could not read {options["path"]}: {e}')
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        for line, message in result.errors:
+            self.stderr.write(f'Line {line}: {message}')
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Done: {result.created} created, {result.updated} updated, {result.unchanged} unchanged, '
+            f'{len(result.errors)} skipped '
+            f'in {elapsed:.1f}s'))
+
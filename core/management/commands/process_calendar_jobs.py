@@ -0,0 +1,12 @@
+from core.job_queue import QueueWorkerCommand
+from core.meeting_jobs import DEFAULT_BATCH_SIZE, MAX_ATTEMPTS, process_calendar_jobs
+
+
+class Command(QueueWorkerCommand):
+    help = 'Create Google Calendar events and Meet links for queued meeting requests'
+    default_batch_size = DEFAULT_BATCH_SIZE
+    default_max_attempts = MAX_ATTEMPTS
+    default_interval = 2.0
+
+    def process_batch(self, batch_size, max_attempts):
+        return process_calendar_jobs(batch_size, max_attempts)
@@ -0,0 +1,12 @@
+from core.job_queue import QueueWorkerCommand
+from core.related import DEFAULT_BATCH_SIZE, MAX_ATTEMPTS, process_refresh_jobs
+
+
+class Command(QueueWorkerCommand):
+    help = 'Refresh the related projects lists affected by queued project changes'
+    default_batch_size = DEFAULT_BATCH_SIZE
+    default_max_attempts = MAX_ATTEMPTS
+    batch_size_help = 'Maximum number of changed projects refreshed together'
+
+    def process_batch(self, batch_size, max_attempts):
+        return process_refresh_jobs(batch_size, max_attempts)
@@ -0,0 +1,12 @@
+from core.job_queue import QueueWorkerCommand
+from core.renditions import DEFAULT_BATCH_SIZE, MAX_ATTEMPTS, process_rendition_jobs
+
+
+class Command(QueueWorkerCommand):
+    help = 'Generate queued responsive image renditions'
+    default_batch_size = DEFAULT_BATCH_SIZE
+    default_max_attempts = MAX_ATTEMPTS
+    batch_size_help = 'Maximum number of images processed per batch'
+
+    def process_batch(self, batch_size, max_attempts):
+        return process_rendition_jobs(batch_size, max_attempts)
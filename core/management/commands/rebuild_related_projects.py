@@ -0,0 +1,21 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core import related
+
+
+class Command(BaseCommand):
+    help = 'Recompute the precomputed related projects of every project from the technology index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-k', type=int, default=settings.RELATED_PROJECTS_TOP_K,
+                            help='Related projects kept per project')
+        parser.add_argument('--metric', choices=related.METRICS, default=settings.RELATED_PROJECTS_METRIC)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        count = related.rebuild(top_k=options['top_k'], metric=options['metric'])
+        self.stdout.write(self.style.SUCCESS(
+            f'Done: related projects of {count} project(s) in {time.perf_counter() - started:.1f}s'))
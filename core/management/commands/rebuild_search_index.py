@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from core import search
+from core.models import ContactMessage, Meeting
+
+
+class Command(BaseCommand):
+    help = 'Recreate and repopulate the admin full-text search index for contact messages and meetings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        if not search.is_supported():
+            self.stdout.write(self.style.WARNING('This database backend has no full-text index; admin search uses LIKE'))
+            return
+        for model in (ContactMessage, Meeting):
+            search.create_index(model)
+            count = search.rebuild_index(model, batch_size=options['batch_size'])
+            self.stdout.write(f'{model.__name__}: indexed {count} row(s)')
+        self.stdout.write(self.style.SUCCESS('Done'))
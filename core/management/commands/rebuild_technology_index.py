@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from core import technologies
+
+
+class Command(BaseCommand):
+    help = 'Re-link every project to its technology tags and recompute the technology and category counts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--counts-only', action='store_true',
+                            help='Keep the existing links and only recompute the counts')
+
+    def handle(self, *args, **options):
+        if options['counts_only']:
+            technologies.recount()
+        else:
+            count = technologies.rebuild_index(batch_size=options['batch_size'])
+            self.stdout.write(f'Linked {count} project/technology pair(s)')
+        self.stdout.write(self.style.SUCCESS('Done'))
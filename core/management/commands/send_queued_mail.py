@@ -0,0 +1,13 @@
+from core.job_queue import QueueWorkerCommand
+from core.mail_queue import DEFAULT_BATCH_SIZE, MAX_ATTEMPTS, send_queued_mail
+
+
+class Command(QueueWorkerCommand):
+    help = 'Deliver queued OutboundEmail messages over a single SMTP connection per batch'
+    default_batch_size = DEFAULT_BATCH_SIZE
+    default_max_attempts = MAX_ATTEMPTS
+    batch_size_help = 'Maximum number of messages sent per connection'
+    outcomes = ('sent', 'failed')
+
+    def process_batch(self, batch_size, max_attempts):
+        return send_queued_mail(batch_size, max_attempts)
@@ -0,0 +1,187 @@
+"""
+Background pipeline for Google Calendar/Meet creation.
+
+schedule_meeting saves the meeting as pending and calls enqueue_calendar_job().
+The process_calendar_jobs management command claims due jobs, creates the
+calendar event through the configured calendar client, stores the Meet URL,
+moves the meeting to 'scheduled' and queues the notification emails. Claims
+are leased (see core.job_queue), so jobs held by a worker that died are
+picked up again.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .job_queue import backoff_delay, claim_batch
+from .mail_queue import enqueue_mail
+from .models import CalendarJob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CALENDAR_CLIENT = 'core.meeting_utils.GoogleCalendarClient'
+DEFAULT_BATCH_SIZE = 20
+MAX_ATTEMPTS = 3
+# How long a claimed batch may stay 'running' before another worker retries it
+LEASE_SECONDS = 15 * 60
+
+
+def get_calendar_client():
+    """Instantiate the calendar client named by settings.MEETING_CALENDAR_CLIENT"""
+    path = getattr(settings, 'MEETING_CALENDAR_CLIENT', DEFAULT_CALENDAR_CLIENT)
+    return import_string(path)()
+
+
+def enqueue_calendar_job(meeting):
+    return CalendarJob.objects.create(meeting=meeting)
+
+
+def queue_meeting_emails(meeting):
+    """Queue the requester confirmation and the admin notification for a meeting"""
+    # Email to the user (meeting requester)
+    user_email_body = f"""
+Hello {meeting.name},
+
+Thank you for requesting a meeting with us! We've received your meeting request and will get back to you shortly.
+
+Meeting Details:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Topic: {meeting.topic}
+Requested Date: {meeting.date.strftime('%A, %B %d, %Y')}
+Requested Time: {meeting.time.strftime('%I:%M %p')} IST
+Your Email: {meeting.email}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Event Link: {meeting.google_meet_url if meeting.google_meet_url else 'Will be sent after confirmation'}
+
+Additional Notes: {meeting.notes if meeting.notes else 'None provided'}
+
+You will receive a calendar invitation with the Google Meet link shortly. 
+You can also use the link above to access the meeting details in Google Calendar.
+
+Best regards,
+Serendipity Team
+            """
+
+    # Email to admins
+    admin_email_body = f"""
+New Meeting Request Received!
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Requester Name: {meeting.name}
+Requester Email: {meeting.email}
+Meeting Topic: {meeting.topic}
+Requested Date: {meeting.date.strftime('%A, %B %d, %Y')}
+Requested Time: {meeting.time.strftime('%I:%M %p')} IST
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Calendar Event Link: {meeting.google_meet_url if meeting.google_meet_url else 'Creating event...'}
+
+Additional Notes:
+{meeting.notes if meeting.notes else 'None provided'}
+
+The calendar event has been automatically created and is in your Google Calendar.
+You can access it via the link above to add a Google Meet call or reschedule if needed.
+
+Action Required:
+1. Review the meeting request
+2. Accept/Confirm the calendar invitation in your Google Calendar
+3. Optional: Add Google Meet conference to the event if not already present
+4. Send confirmation to {meeting.email}
+
+You can manage this request in the admin panel.
+            """
+
+    enqueue_mail(
+        f'Meeting Request Received: {meeting.topic}',
+        user_email_body,
+        settings.DEFAULT_FROM_EMAIL,
+        [meeting.email],
+    )
+
+    admin_emails = list(User.objects.filter(is_superuser=True).exclude(email='').values_list('email', flat=True))
+    if admin_emails:
+        enqueue_mail(
+            f'New Meeting Request: {meeting.topic}',
+            admin_email_body,
+            settings.DEFAULT_FROM_EMAIL,
+            admin_emails,
+        )
+
+
+def _finish(job, result):
+    """
+    Store the Meet link, mark the meeting scheduled and queue its emails in
+    one transaction with the job's 'done' status, so a job handed out again
+    after a crash never queues the emails twice
+    """
+    meeting = job.meeting
+    with transaction.atomic():
+        meeting.google_meet_url = result.get('url') or meeting.google_meet_url
+        if meeting.status == 'pending':
+            meeting.status = 'scheduled'
+        meeting.save(update_fields=['google_meet_url', 'status'])
+
+        job.status = 'done'
+        job.event_id = result.get('event_id') or ''
+        job.finished_at = timezone.now()
+        job.claimed_at = None
+        job.save(update_fields=['status', 'attempts', 'last_error', 'event_id', 'finished_at', 'claimed_at'])
+
+        queue_meeting_emails(meeting)
+
+
+def run_calendar_job(job, client, max_attempts=MAX_ATTEMPTS):
+    """Create the calendar event for one claimed job. Returns True on success."""
+    job.attempts += 1
+    try:
+        result = client.create_event(job.meeting)
+        error = None if result.get('success') else result.get('error') or 'Calendar event creation failed'
+    except Exception as e:
+        result, error = {}, str(e)
+
+    if error is None:
+        job.last_error = ''
+        _finish(job, result)
+        logger.info(f"Calendar event {result.get('event_id')} created for meeting {job.meeting_id}")
+        return True
+
+    job.last_error = error
+    if job.attempts >= max_attempts:
+        # No event was created: the meeting stays pending for an admin to
+        # schedule by hand, and nobody is told it was scheduled
+        job.status = 'failed'
+        job.finished_at = timezone.now()
+        job.claimed_at = None
+        job.save(update_fields=['status', 'attempts', 'last_error', 'finished_at', 'claimed_at'])
+        logger.error(f"Giving up on calendar job {job.pk} after {job.attempts} attempts: {error}")
+    else:
+        job.status = 'pending'
+        job.next_attempt_at = timezone.now() + timedelta(seconds=backoff_delay(job.attempts))
+        job.claimed_at = None
+        job.save(update_fields=['status', 'attempts', 'last_error', 'next_attempt_at', 'claimed_at'])
+        logger.warning(f"Calendar job {job.pk} failed (attempt {job.attempts}), retrying at {job.next_attempt_at}: {error}")
+    return False
+
+
+def process_calendar_jobs(batch_size=DEFAULT_BATCH_SIZE, max_attempts=MAX_ATTEMPTS, client=None):
+    """
+    Run one batch of due calendar jobs.
+    Returns a (succeeded, failed) tuple of job counts.
+    """
+    batch = claim_batch(CalendarJob.objects.select_related('meeting'), batch_size, 'running', LEASE_SECONDS, max_attempts)
+    if not batch:
+        return 0, 0
+
+    client = client or get_calendar_client()
+    succeeded = failed = 0
+    for job in batch:
+        if run_calendar_job(job, client, max_attempts):
+            succeeded += 1
+        else:
+            failed += 1
+    return succeeded, failed
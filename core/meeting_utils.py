@@ -10,11 +10,15 @@ import uuid
 import json
 import os
 import pickle
-from datetime import datetime, timedelta
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
 from urllib.parse import urlencode
 import logging
 import pytz
 
+from .instrumentation import span
+
 logger = logging.getLogger(__name__)
 
 # IST timezone
@@ -27,41 +31,113 @@ SCOPES = [
 ]
 
 
+TOKEN_PATH = os.path.join(os.path.dirname(__file__), 'token.pickle')
+
+# Refresh the access token this long before it actually expires
+REFRESH_MARGIN = timedelta(minutes=5)
+
+# Process-wide credential and Calendar service cache, guarded by _lock.
+# Credentials are reloaded only when token.pickle changes on disk.
+_lock = threading.RLock()
+_credentials = None
+_credentials_mtime = None
+_service = None
+_service_credentials = None
+# httplib2 connections are not thread-safe, so each thread gets its own
+_thread_local = threading.local()
+
+
+def _needs_refresh(credentials):
+    if not credentials.token:
+        return True
+    if credentials.expiry is None:
+        return False
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(dt_timezone.utc).replace(tzinfo=None)
+    return credentials.expiry - REFRESH_MARGIN <= now
+
+
+def _save_credentials(credentials):
+    """Persist refreshed credentials atomically so readers never see a partial file"""
+    global _credentials_mtime
+    token_dir = os.path.dirname(TOKEN_PATH)
+    fd, tmp_path = tempfile.mkstemp(dir=token_dir, prefix='.token-', suffix='.pickle')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(credentials, f)
+        os.replace(tmp_path, TOKEN_PATH)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _credentials_mtime = os.stat(TOKEN_PATH).st_mtime_ns
+
+
 def get_oauth_credentials():
     """
     Load OAuth token.pickle created by setup_oauth_token.py
+
+    The credentials are cached for the whole process and refreshed only when
+    they are about to expire.
     """
+    global _credentials, _credentials_mtime
     try:
         from google.auth.transport.requests import Request
-        from google.oauth2.credentials import Credentials
-        
-        token_path = os.path.join(os.path.dirname(__file__), 'token.pickle')
 
-        if not os.path.exists(token_path):
-            print("❌ token.pickle NOT FOUND — run: python core/setup_oauth_token.py")
-            return None, False
+        with _lock:
+            try:
+                mtime = os.stat(TOKEN_PATH).st_mtime_ns
+            except FileNotFoundError:
+                logger.warning("token.pickle not found - run: python core/setup_oauth_token.py")
+                _credentials = _credentials_mtime = None
+                return None, False
+
+            if _credentials is None or mtime != _credentials_mtime:
+                with span('token_load'):
+                    with open(TOKEN_PATH, 'rb') as f:
+                        _credentials = pickle.load(f)
+                _credentials_mtime = mtime
+                logger.info("OAuth credentials loaded from %s", TOKEN_PATH)
+
+            # Refresh expired or soon-to-expire token
+            if _needs_refresh(_credentials) and _credentials.refresh_token:
+                with span('token_refresh'):
+                    _credentials.refresh(Request())
+                    _save_credentials(_credentials)
+                logger.info("OAuth token refreshed")
+
+            return _credentials, True
 
-        print(f"✓ token.pickle found at: {token_path}")
+    except Exception as e:
+        logger.error("Failed to load OAuth token: %s", e)
+        return None, False
 
-        with open(token_path, 'rb') as f:
-            credentials = pickle.load(f)
 
-        print(f"✓ Credentials loaded")
-        print(f"  - Valid: {credentials.valid}")
-        print(f"  - Expired: {credentials.expired}")
-        print(f"  - Refresh Token: {bool(credentials.refresh_token)}")
+def get_calendar_service(credentials):
+    """
+    Return the process-wide Calendar service, building it on first use from
+    the discovery document bundled with google-api-python-client.
+    """
+    global _service, _service_credentials
+    with _lock:
+        if _service is None or _service_credentials is not credentials:
+            from googleapiclient.discovery import build
+            with span('client_build'):
+                _service = build("calendar", "v3", credentials=credentials,
+                                 static_discovery=True, cache_discovery=False)
+            _service_credentials = credentials
+        return _service
 
-        # Refresh expired token
-        if credentials.expired and credentials.refresh_token:
-            print("⏳ Refreshing token...")
-            credentials.refresh(Request())
-            print("✓ Token refreshed")
 
-        return credentials, True
-
-    except Exception as e:
-        print(f"❌ Failed to load token: {e}")
-        return None, False
+def _get_thread_http(credentials):
+    """Per-thread authorized HTTP transport for executing requests on the shared service"""
+    http = getattr(_thread_local, 'http', None)
+    if http is None or http.credentials is not credentials:
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+        http = AuthorizedHttp(credentials, http=httplib2.Http())
+        _thread_local.http = http
+    return http
 
 
 
@@ -70,15 +146,11 @@ def generate_google_meet_url(meeting_title, meeting_date, meeting_time, meeting_
     Generate REAL Google Meet link by creating a calendar event.
     If OAuth fails → returns fallback valid Meet-like URL.
     """
-    print("\n" + "="*70)
-    print("🎯 GENERATING GOOGLE MEET URL")
-    print("="*70)
-
     credentials, is_valid = get_oauth_credentials()
 
     if not is_valid:
         fallback = generate_simple_meet_url()
-        print(f"⚠ OAuth missing → Using fallback: {fallback}")
+        logger.warning("OAuth unavailable, using fallback Meet URL %s", fallback)
         return {
             "url": fallback,
             "method": "fallback",
@@ -97,87 +169,91 @@ def generate_google_meet_url(meeting_title, meeting_date, meeting_time, meeting_
 
 
 
-def _create_real_calendar_event(credentials, meeting_title, meeting_date, meeting_time, meeting_email, meeting_notes):
-    """
-    CREATE event WITH Google Meet via INSERT (works for all Gmail accounts).
-    """
-    try:
-        from googleapiclient.discovery import build
-        from django.conf import settings
-        
-        service = build("calendar", "v3", credentials=credentials)
-        print("✓ Google Calendar service ready")
-
-        # Build datetime (IST)
-        start_dt = IST.localize(datetime.combine(meeting_date, meeting_time))
-        end_dt = start_dt + timedelta(hours=1)
-
-        admin_email = settings.EMAIL_HOST_USER
-
-        print(f"🕒 Start: {start_dt}, End: {end_dt}")
-
-        # ✔ Google requires “attendees”, not “guests”
-        event_body = {
-            "summary": meeting_title,
-            "description": f"Requested by: {meeting_email}\n\nNotes:\n{meeting_notes}",
-            "start": {
-                "dateTime": start_dt.isoformat(),
-                "timeZone": "Asia/Kolkata"
-            },
-            "end": {
-                "dateTime": end_dt.isoformat(),
-                "timeZone": "Asia/Kolkata"
-            },
-            "attendees": [
-                {"email": meeting_email},
-                {"email": admin_email}
-            ],
-            "conferenceData": {
-                "createRequest": {
-                    "requestId": str(uuid.uuid4()),
-                    "conferenceSolutionKey": {"key": "hangoutsMeet"}
-                }
+def _build_event_body(meeting_title, meeting_date, meeting_time, meeting_email, meeting_notes):
+    """Calendar event resource with a Google Meet conference request"""
+    from django.conf import settings
+
+    # Build datetime (IST)
+    start_dt = IST.localize(datetime.combine(meeting_date, meeting_time))
+    end_dt = start_dt + timedelta(hours=1)
+
+    admin_email = settings.EMAIL_HOST_USER
+
+    # ✔ Google requires “attendees”, not “guests”
+    return {
+        "summary": meeting_title,
+        "description": f"Requested by: {meeting_email}\n\nNotes:\n{meeting_notes}",
+        "start": {
+            "dateTime": start_dt.isoformat(),
+            "timeZone": "Asia/Kolkata"
+        },
+        "end": {
+            "dateTime": end_dt.isoformat(),
+            "timeZone": "Asia/Kolkata"
+        },
+        "attendees": [
+            {"email": meeting_email},
+            {"email": admin_email}
+        ],
+        "conferenceData": {
+            "createRequest": {
+                "requestId": str(uuid.uuid4()),
+                "conferenceSolutionKey": {"key": "hangoutsMeet"}
             }
         }
+    }
+
 
-        print("📤 Creating event with Google Meet...")
+def _insert_event_request(service, event_body):
+    # ✔ INSERT event with conferenceData (Works for ALL accounts)
+    return service.events().insert(
+        calendarId="primary",
+        body=event_body,
+        conferenceDataVersion=1
+    )
 
-        # ✔ INSERT event with conferenceData (Works for ALL accounts)
-        created_event = service.events().insert(
-            calendarId="primary",
-            body=event_body,
-            conferenceDataVersion=1
-        ).execute()
 
-        print("✓ Event created!")
+def _event_result(created_event):
+    """Turn a created event resource into the result dict returned to callers"""
+    event_id = created_event.get("id")
+    meet_url = ""
 
-        event_id = created_event.get("id")
-        meet_url = ""
+    # Extract Meet URL
+    conference = created_event.get("conferenceData", {})
+    for ep in conference.get("entryPoints", []):
+        if ep.get("entryPointType") == "video":
+            meet_url = ep.get("uri")
+            break
 
-        # Extract Meet URL
-        conference = created_event.get("conferenceData", {})
-        for ep in conference.get("entryPoints", []):
-            if ep.get("entryPointType") == "video":
-                meet_url = ep.get("uri")
-                break
+    if not meet_url:
+        logger.warning("No Meet link on event %s, using calendar link instead", event_id)
+        meet_url = created_event.get("htmlLink")
 
-        if meet_url:
-            print(f"✓ Meet Link: {meet_url}")
-        else:
-            print("⚠ No meet link found, using fallback calendar link")
-            meet_url = created_event.get("htmlLink")
+    return {
+        "url": meet_url,
+        "event_id": event_id,
+        "calendar_link": created_event.get("htmlLink", ""),
+        "method": "calendar_api",
+        "success": True,
+        "error": None
+    }
 
-        return {
-            "url": meet_url,
-            "event_id": event_id,
-            "calendar_link": created_event.get("htmlLink", ""),
-            "method": "calendar_api",
-            "success": True,
-            "error": None
-        }
+
+def _create_real_calendar_event(credentials, meeting_title, meeting_date, meeting_time, meeting_email, meeting_notes):
+    """
+    CREATE event WITH Google Meet via INSERT (works for all Gmail accounts).
+    """
+    try:
+        service = get_calendar_service(credentials)
+        event_body = _build_event_body(meeting_title, meeting_date, meeting_time, meeting_email, meeting_notes)
+
+        with span('event_insert', batch_size=1):
+            created_event = _insert_event_request(service, event_body).execute(http=_get_thread_http(credentials))
+
+        return _event_result(created_event)
 
     except Exception as e:
-        print(f"❌ ERROR creating real event: {e}")
+        logger.error("Error creating calendar event: %s", e)
         fallback = generate_simple_meet_url()
         return {
             "url": fallback,
@@ -187,6 +263,73 @@ def _create_real_calendar_event(credentials, meeting_title, meeting_date, meetin
         }
 
 
+# The Calendar API accepts at most 50 calls per batch request
+CALENDAR_BATCH_SIZE = 50
+
+
+def create_calendar_events(meetings):
+    """
+    Create calendar events with Google Meet for several meetings using the
+    Calendar API batch endpoint (one HTTP round trip per 50 meetings).
+
+    Returns a dict mapping meeting pk to a result dict shaped like the one
+    from generate_google_meet_url(). A failed insert gets success=False and
+    no URL, so callers can report it per meeting.
+    """
+    meetings = list(meetings)
+    credentials, is_valid = get_oauth_credentials()
+
+    if not is_valid:
+        logger.warning("OAuth unavailable, using fallback Meet URLs for %d meeting(s)", len(meetings))
+        return {
+            meeting.pk: {
+                "url": generate_simple_meet_url(),
+                "method": "fallback",
+                "success": True,
+                "error": "No OAuth"
+            }
+            for meeting in meetings
+        }
+
+    results = {}
+
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            logger.error("Error creating calendar event for meeting %s: %s", request_id, exception)
+            results[int(request_id)] = {
+                "url": None,
+                "method": "calendar_api",
+                "success": False,
+                "error": str(exception)
+            }
+        else:
+            results[int(request_id)] = _event_result(response)
+
+    try:
+        service = get_calendar_service(credentials)
+        http = _get_thread_http(credentials)
+        for i in range(0, len(meetings), CALENDAR_BATCH_SIZE):
+            chunk = meetings[i:i + CALENDAR_BATCH_SIZE]
+            batch = service.new_batch_http_request(callback=on_response)
+            for meeting in chunk:
+                event_body = _build_event_body(meeting.topic, meeting.date, meeting.time, meeting.email, meeting.notes or "")
+                batch.add(_insert_event_request(service, event_body), request_id=str(meeting.pk))
+            with span('event_insert', batch_size=len(chunk)):
+                batch.execute(http=http)
+    except Exception as e:
+        # Whole batch failed (e.g. network error) - report every remaining meeting
+        logger.error("Error executing calendar batch request: %s", e)
+        for meeting in meetings:
+            results.setdefault(meeting.pk, {
+                "url": None,
+                "method": "calendar_api",
+                "success": False,
+                "error": str(e)
+            })
+
+    return results
+
+
 
 def generate_simple_meet_url():
     """ Generates a valid-form Meet-like URL for fallback use. """
@@ -216,3 +359,21 @@ def generate_google_calendar_link(meeting_title, meeting_email, meeting_date, me
 
     except:
         return None
+
+
+
+class GoogleCalendarClient:
+    """
+    Default calendar client used by the calendar job worker.
+    Any class with the same create_event(meeting) method can be configured
+    through settings.MEETING_CALENDAR_CLIENT (e.g. a local fake in tests).
+    """
+
+    def create_event(self, meeting):
+        return generate_google_meet_url(
+            meeting_title=meeting.topic,
+            meeting_date=meeting.date,
+            meeting_time=meeting.time,
+            meeting_email=meeting.email,
+            meeting_notes=meeting.notes
+        )
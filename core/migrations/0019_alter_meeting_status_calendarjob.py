@@ -0,0 +1,37 @@
+# Generated by Django 5.2.3 on 2026-10-17 22:28
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_outboundemail'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='meeting',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending - Awaiting Confirmation'), ('scheduled', 'Scheduled - Calendar Event Created'), ('confirmed', 'Confirmed - Meet Link Sent'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='pending', max_length=20),
+        ),
+        migrations.CreateModel(
+            name='CalendarJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('event_id', models.CharField(blank=True, default='', max_length=255)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('meeting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='calendar_jobs', to='core.meeting')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='core_calendarjob_due_idx')],
+            },
+        ),
+    ]
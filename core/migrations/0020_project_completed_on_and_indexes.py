@@ -0,0 +1,58 @@
+# Generated by Django 5.2.3 on 2026-10-17 22:33
+
+from datetime import datetime
+
+from dateutil import parser as date_parser
+from django.db import migrations, models
+
+
+def backfill_completed_on(apps, schema_editor):
+    Project = apps.get_model('core', 'Project')
+    projects = []
+    for project in Project.objects.only('pk', 'completion_date'):
+        try:
+            project.completed_on = date_parser.parse(project.completion_date, default=datetime(2000, 1, 1)).date()
+        except (ValueError, OverflowError, TypeError):
+            continue
+        projects.append(project)
+    Project.objects.bulk_update(projects, ['completed_on'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_alter_meeting_status_calendarjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='completed_on',
+            field=models.DateField(blank=True, editable=False, help_text='Parsed from completion_date on save, used for ordering', null=True),
+        ),
+        migrations.RunPython(backfill_completed_on, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['received_at'], name='core_contact_received_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['status', 'date'], name='core_meeting_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['created_at'], name='core_meeting_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['completed_on'], name='core_project_completed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['category', 'completed_on'], name='core_project_cat_done_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['team_member', 'completed_on'], name='core_project_member_done_idx'),
+        ),
+    ]
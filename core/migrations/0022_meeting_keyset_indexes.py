@@ -0,0 +1,25 @@
+# Generated by Django 5.2.3 on 2026-10-17 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_image_renditions'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='meeting',
+            name='core_meeting_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['created_at', 'id'], name='core_meeting_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='core_meeting_stat_created_idx'),
+        ),
+    ]
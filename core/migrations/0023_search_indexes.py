@@ -0,0 +1,29 @@
+from django.db import migrations
+
+from core import search
+
+
+def create_search_indexes(apps, schema_editor):
+    conn = schema_editor.connection
+    if not search.is_supported(conn):
+        return
+    for name in ('ContactMessage', 'Meeting'):
+        model = apps.get_model('core', name)
+        search.create_index(model, conn)
+        search.rebuild_index(model, conn=conn)
+
+
+def drop_search_indexes(apps, schema_editor):
+    for name in ('ContactMessage', 'Meeting'):
+        search.drop_index(apps.get_model('core', name), schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_meeting_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+def _lines(value):
+    return [line.strip() for line in (value or '').splitlines() if line.strip()]
+
+
+def _skills(value):
+    return [skill.strip() for skill in (value or '').split(',') if skill.strip()]
+
+
+def backfill_profile_items(apps, schema_editor):
+    TeamMember = apps.get_model('core', 'TeamMember')
+    members = []
+    for member in TeamMember.objects.only('pk', 'education', 'experience', 'skills'):
+        member.education_items = _lines(member.education)
+        member.experience_items = _lines(member.experience)
+        member.skill_items = _skills(member.skills)
+        members.append(member)
+    TeamMember.objects.bulk_update(members, ['education_items', 'experience_items', 'skill_items'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teammember',
+            name='education_items',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name='teammember',
+            name='experience_items',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.AddField(
+            model_name='teammember',
+            name='skill_items',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(backfill_profile_items, migrations.RunPython.noop),
+    ]
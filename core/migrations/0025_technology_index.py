@@ -0,0 +1,110 @@
+# Generated by Django 5.2.3 on 2026-10-17 23:10
+
+import json
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def _technology_names(value):
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            value = json.loads(text) if text.startswith('[') else None
+        except ValueError:
+            value = None
+        if value is None:
+            value = text.replace(';', ',').replace('|', ',').split(',')
+    if not isinstance(value, list):
+        return []
+    return [str(item).strip() for item in value if str(item).strip()]
+
+
+def backfill_technology_index(apps, schema_editor):
+    Project = apps.get_model('core', 'Project')
+    Technology = apps.get_model('core', 'Technology')
+    ProjectTechnology = apps.get_model('core', 'ProjectTechnology')
+    CategoryCount = apps.get_model('core', 'CategoryCount')
+
+    technologies, links, normalised = {}, [], []
+    categories = Counter()
+    for project in Project.objects.only('pk', 'category', 'technologies'):
+        names = _technology_names(project.technologies)
+        if names != project.technologies:
+            # Comma-separated strings become lists
+            project.technologies = names
+            normalised.append(project)
+        categories[project.category] += 1
+        slugs = {}
+        for name in names:
+            slug = slugify(name)[:100]
+            if slug:
+                slugs.setdefault(slug, name[:100])
+        for slug, name in slugs.items():
+            technologies.setdefault(slug, name)
+            links.append((project.pk, slug))
+
+    Project.objects.bulk_update(normalised, ['technologies'], batch_size=500)
+    counts = Counter(slug for _, slug in links)
+    Technology.objects.bulk_create([
+        Technology(slug=slug, name=name, project_count=counts[slug]) for slug, name in technologies.items()
+    ])
+    ids = dict(Technology.objects.values_list('slug', 'pk'))
+    ProjectTechnology.objects.bulk_create(
+        [ProjectTechnology(project_id=pk, technology_id=ids[slug]) for pk, slug in links], batch_size=1000)
+    CategoryCount.objects.bulk_create([CategoryCount(category=c, project_count=n) for c, n in categories.items()])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_teammember_parsed_profile_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(max_length=20, unique=True)),
+                ('project_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(max_length=100, unique=True)),
+                ('project_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'technologies',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectTechnology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='technology_links', to='core.project')),
+                ('technology', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_links', to='core.technology')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='technology_tags',
+            field=models.ManyToManyField(blank=True, related_name='projects', through='core.ProjectTechnology', to='core.technology'),
+        ),
+        migrations.AddIndex(
+            model_name='projecttechnology',
+            index=models.Index(fields=['technology', 'project'], name='core_projtech_tech_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='projecttechnology',
+            constraint=models.UniqueConstraint(fields=('project', 'technology'), name='core_project_technology_unique'),
+        ),
+        migrations.RunPython(backfill_technology_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-17 23:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_technology_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='core_project_completed_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='core_project_cat_done_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['completed_on', 'id'], name='core_project_done_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['category', 'completed_on', 'id'], name='core_project_cat_done_id_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-17 23:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0028_outboundemail_claimed_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarjob',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -1,6 +1,79 @@
+import json
+from datetime import datetime
+
+from dateutil import parser as date_parser
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
 
+
+def parse_completion_date(value):
+    """Best-effort parse of a free-text completion date ('March 2024', '2024-03-15', ...)"""
+    if not value:
+        return None
+    try:
+        # Missing day/month default to the first, so 'March 2024' -> 2024-03-01
+        return date_parser.parse(value, default=datetime(2000, 1, 1)).date()
+    except (ValueError, OverflowError):
+        return None
+
+
+def split_lines(value):
+    """Education/experience text: one entry per non-blank line"""
+    return [line.strip() for line in (value or '').splitlines() if line.strip()]
+
+
+def split_skills(value):
+    """Skills text: comma-separated"""
+    return [skill.strip() for skill in (value or '').split(',') if skill.strip()]
+
+
+def parse_technologies(value):
+    """
+    Normalise a technologies value to a list of names. Accepts a list, a JSON
+    list string, or a comma/semicolon/pipe separated string.
+    """
+    if value is None or value == '':
+        return []
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            value = json.loads(text) if text.startswith('[') else None
+        except ValueError:
+            value = None
+        if value is None:
+            for separator in ';|':
+                text = text.replace(separator, ',')
+            value = text.split(',')
+    if not isinstance(value, list):
+        raise ValueError('technologies must be a list or a separated string')
+    return [str(item).strip() for item in value if str(item).strip()]
+
+
+class Technology(models.Model):
+    """A technology tag, deduplicated by slug ('Node.js' and 'nodejs' differ, 'React' and 'react' don't)"""
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=100, unique=True)
+    # Maintained incrementally by core.technologies
+    project_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = 'technologies'
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class CategoryCount(models.Model):
+    """Number of projects per category, maintained incrementally by core.technologies"""
+    category = models.CharField(max_length=20, unique=True)
+    project_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f'{self.category}: {self.project_count}'
+
+
 class Project(models.Model):
     CATEGORY_CHOICES = [
         ('Web Development', 'Web Development'),
@@ -16,13 +89,92 @@ class Project(models.Model):
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
     client = models.CharField(max_length=200)
     completion_date = models.CharField(max_length=50)
+    completed_on = models.DateField(blank=True, null=True, editable=False, help_text="Parsed from completion_date on save, used for ordering")
     technologies = models.JSONField(default=list)
+    # Normalised index of ``technologies``, kept in sync by core.technologies
+    technology_tags = models.ManyToManyField(Technology, through='ProjectTechnology', related_name='projects', blank=True)
     website = models.URLField(blank=True, null=True)
     team_member = models.ForeignKey('TeamMember', on_delete=models.SET_NULL, null=True, blank=True, related_name='projects')
 
+    class Meta:
+        indexes = [
+            # Keyset pagination on ('-completed_on', '-id'), optionally by category
+            models.Index(fields=['completed_on', 'id'], name='core_project_done_id_idx'),
+            models.Index(fields=['category', 'completed_on', 'id'], name='core_project_cat_done_id_idx'),
+            models.Index(fields=['team_member', 'completed_on'], name='core_project_member_done_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
+    def clean(self):
+        try:
+            parse_technologies(self.technologies)
+        except ValueError as e:
+            raise ValidationError({'technologies': str(e)})
+
+    def save(self, *args, **kwargs):
+        self.completed_on = parse_completion_date(self.completion_date)
+        self.technologies = parse_technologies(self.technologies)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'completion_date' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'completed_on'}
+        super().save(*args, **kwargs)
+
+class ProjectTechnology(models.Model):
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='technology_links')
+    technology = models.ForeignKey(Technology, on_delete=models.CASCADE, related_name='project_links')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'technology'], name='core_project_technology_unique'),
+        ]
+        indexes = [
+            # Filtering by technology: technology -> projects
+            models.Index(fields=['technology', 'project'], name='core_projtech_tech_idx'),
+        ]
+
+class RelatedProject(models.Model):
+    """Precomputed most similar projects of a project, maintained by core.related"""
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='related_links')
+    related = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='+')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        constraints = [
+            # Also serves reading a project's neighbours in rank order
+            models.UniqueConstraint(fields=['project', 'rank'], name='core_related_project_rank_unique'),
+        ]
+
+class RelatedProjectsJob(models.Model):
+    """Refresh of the related project lists a changed project affects, run by the process_related_jobs worker"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    # Not a foreign key: the project may be deleted before the job runs
+    project_pk = models.BigIntegerField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # Start of the current worker's lease while 'running' (see core.job_queue)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='core_relatedjob_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"Related projects refresh for project {self.project_pk} ({self.status})"
+
 class TeamMember(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField(blank=True, null=True)
@@ -36,14 +188,34 @@ class TeamMember(models.Model):
     skills = models.TextField(blank=True, null=True)
     location = models.CharField(max_length=200, blank=True, null=True, help_text="City/Location for this team member (e.g., Coimbatore, TN, India)")
     slug = models.SlugField(unique=True, blank=True, null=True, help_text="URL-friendly identifier (auto-generated from name)")
+    # Parsed from the text fields above on save so pages don't re-split them per request
+    education_items = models.JSONField(default=list, blank=True, editable=False)
+    experience_items = models.JSONField(default=list, blank=True, editable=False)
+    skill_items = models.JSONField(default=list, blank=True, editable=False)
+
+    # text field -> (parsed field, parser)
+    PARSED_FIELDS = {
+        'education': ('education_items', split_lines),
+        'experience': ('experience_items', split_lines),
+        'skills': ('skill_items', split_skills),
+    }
 
     def __str__(self):
         return self.name
-    
+
+    def parse_profile_fields(self):
+        for source, (target, parse) in self.PARSED_FIELDS.items():
+            setattr(self, target, parse(getattr(self, source)))
+
     def save(self, *args, **kwargs):
         if not self.slug:
             from django.utils.text import slugify
             self.slug = slugify(self.name)
+        self.parse_profile_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, *(self.PARSED_FIELDS[name][0] for name in update_fields
+                                                         if name in self.PARSED_FIELDS)}
         super().save(*args, **kwargs)
 
 class Testimonial(models.Model):
@@ -89,6 +261,10 @@ class ContactMessage(models.Model):
     team_member = models.CharField(max_length=100, blank=True, null=True)
     department = models.CharField(max_length=20, choices=DEPARTMENT_CHOICES, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['received_at'], name='core_contact_received_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.subject}"
@@ -96,6 +272,7 @@ class ContactMessage(models.Model):
 class Meeting(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Pending - Awaiting Confirmation'),
+        ('scheduled', 'Scheduled - Calendar Event Created'),
         ('confirmed', 'Confirmed - Meet Link Sent'),
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled'),
@@ -111,5 +288,117 @@ class Meeting(models.Model):
     google_meet_url = models.URLField(blank=True, null=True, help_text="Google Meet link for this meeting")
     created_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'date'], name='core_meeting_status_date_idx'),
+            # Keyset pagination of the staff dashboard on (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='core_meeting_created_id_idx'),
+            models.Index(fields=['status', 'created_at', 'id'], name='core_meeting_stat_created_idx'),
+        ]
+
     def __str__(self):
         return f"Meeting with {self.name} on {self.date} at {self.time}"
+
+class CalendarJob(models.Model):
+    """Calendar/Meet creation for a meeting, run by the process_calendar_jobs worker"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    meeting = models.ForeignKey(Meeting, on_delete=models.CASCADE, related_name='calendar_jobs')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    event_id = models.CharField(max_length=255, blank=True, default='')
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # Start of the current worker's lease while 'running' (see core.job_queue)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='core_calendarjob_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"Calendar job for meeting {self.meeting_id} ({self.status})"
+
+class ImageRendition(models.Model):
+    """A resized, re-encoded copy of an uploaded image, keyed by the original's storage name"""
+    source = models.CharField(max_length=255)
+    format = models.CharField(max_length=10)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    file = models.FileField(max_length=255)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'format', 'width'], name='core_rendition_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.source} {self.width}w {self.format}"
+
+class RenditionJob(models.Model):
+    """Rendition generation for one uploaded image, run by the process_rendition_jobs worker"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    source = models.CharField(max_length=255)
+    preset = models.CharField(max_length=50)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # Start of the current worker's lease while 'running' (see core.job_queue)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='core_renditionjob_due_idx'),
+            models.Index(fields=['source'], name='core_renditionjob_source_idx'),
+        ]
+
+    def __str__(self):
+        return f"Renditions for {self.source} ({self.status})"
+
+class OutboundEmail(models.Model):
+    """Email queued by a view and delivered by the send_queued_mail worker"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    recipients = models.JSONField(default=list)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # Start of the current worker's lease while 'sending' (see core.job_queue)
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='core_outbound_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)} ({self.status})"
@@ -0,0 +1,119 @@
+"""
+Keyset (cursor) pagination.
+
+Instead of OFFSET, each page continues strictly after the ordering values of
+the previous page's last row, so page N costs the same index range scan as
+page 1. The ordering must end in a unique column (normally ``id``) to make
+the position unambiguous. Cursors are signed so clients can't hand-craft
+arbitrary filters through them.
+
+The leading column may be nullable. Its NULL rows come after all others
+(whatever the direction) and are paged as a second segment, so neither
+segment needs a NULLS FIRST/LAST ordering the index can't serve.
+"""
+import datetime
+import json
+
+from django.core import signing
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+CURSOR_SALT = 'core.pagination.cursor'
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _split(ordering):
+    return [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+
+
+def encode_cursor(obj, ordering):
+    values = [getattr(obj, name) for name, _ in _split(ordering)]
+    return signing.dumps(values, salt=CURSOR_SALT, serializer=_JSONSerializer, compress=True)
+
+
+def decode_cursor(token, model, ordering):
+    """Return the cursor's ordering values converted back to Python types"""
+    try:
+        values = signing.loads(token, salt=CURSOR_SALT, serializer=_JSONSerializer)
+    except signing.BadSignature as e:
+        raise InvalidCursor('Invalid cursor') from e
+    fields = _split(ordering)
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise InvalidCursor('Cursor does not match this ordering')
+    try:
+        return [model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(fields, values)]
+    except Exception as e:
+        raise InvalidCursor('Invalid cursor') from e
+
+
+def keyset_filter(ordering, values):
+    """
+    Build the "rows after this position" condition for ``ordering``, e.g.
+    for ``('-created_at', '-id')``::
+
+        created_at < c OR (created_at = c AND id < i)
+
+    A None value (only valid for the leading column) matches the NULL
+    segment, which has nothing after it on that column.
+    """
+    condition = Q()
+    fields = _split(ordering)
+    for index, (name, descending) in enumerate(fields):
+        if values[index] is None:
+            continue
+        step = Q(**{f'{name}__{"lt" if descending else "gt"}': values[index]})
+        for (prev_name, _), prev_value in zip(fields[:index], values):
+            # name=None is an IS NULL lookup
+            step &= Q(**{prev_name: prev_value})
+        condition |= step
+    return condition
+
+
+def keyset_page(queryset, ordering, cursor=None, limit=25):
+    """
+    Return ``(rows, next_cursor)`` for the page that starts after ``cursor``.
+    ``next_cursor`` is None on the last page. Raises InvalidCursor.
+    """
+    queryset = queryset.order_by(*ordering)
+    values = decode_cursor(cursor, queryset.model, ordering) if cursor else None
+    lead = _split(ordering)[0][0]
+
+    if not queryset.model._meta.get_field(lead).null:
+        segments = [queryset]
+    elif values is not None and values[0] is None:
+        # Already inside the NULL segment
+        segments = [queryset.filter(**{f'{lead}__isnull': True})]
+    else:
+        segments = [queryset.filter(**{f'{lead}__isnull': False}), queryset.filter(**{f'{lead}__isnull': True})]
+
+    # One extra row tells us whether there is a next page without a COUNT
+    rows = []
+    for number, segment in enumerate(segments):
+        if values is not None and number == 0:
+            segment = segment.filter(keyset_filter(ordering, values))
+        rows += segment[:limit + 1 - len(rows)]
+        if len(rows) > limit:
+            break
+    next_cursor = encode_cursor(rows[limit - 1], ordering) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder drops microseconds past the millisecond, which
+        # would break the equality half of the keyset condition
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class _JSONSerializer:
+    def dumps(self, obj):
+        return _CursorEncoder(separators=(',', ':')).encode(obj).encode()
+
+    def loads(self, data):
+        return json.loads(data.decode())
@@ -0,0 +1,345 @@
+"""
+Precomputed "related projects" for the portfolio modal and team member pages.
+
+Each project is a binary feature vector over its technology tags (the
+normalised index kept by core.technologies) plus its category. Stored
+sparsely, the matrix is a list of feature ids per project (CSR) and a list
+of projects per feature (CSC). For binary vectors both similarities only
+need the size of the overlap:
+
+    cosine(a, b)  = |a & b| / sqrt(|a| * |b|)
+    jaccard(a, b) = |a & b| / (|a| + |b| - |a & b|)
+
+The overlaps of a block of projects with every other project are counted
+with one ``np.bincount`` over the posting lists of the block's features,
+the sparse equivalent of ``X[block] @ X.T``. Each project's top-k neighbours
+are picked from that block with ``np.argpartition`` and stored in
+``RelatedProject``, so pages read them with a plain indexed query.
+
+``rebuild`` recomputes every project. ``refresh_projects`` runs after
+projects change and recomputes only the lists that can have changed: the
+changed projects', lists that contain one of them, and lists a changed
+project now outscores the weakest entry of. It still reads every project's
+features, so admin saves and deletes (core.signals) only queue a
+RelatedProjectsJob and the process_related_jobs worker refreshes all
+queued projects in one pass; bulk imports (core.bulk) refresh directly.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import Count, F, Min
+from django.utils import timezone
+
+from .caching import invalidate_project_details, mark_content_changed
+from .job_queue import backoff_delay, claim_batch
+from .models import Project, ProjectTechnology, RelatedProject, RelatedProjectsJob
+
+logger = logging.getLogger(__name__)
+
+METRICS = ('cosine', 'jaccard')
+
+# Upper bound on the cells of one (block x projects) overlap matrix, which
+# keeps a block's working set at a few tens of MB whatever the project count
+BLOCK_CELLS = 4_000_000
+
+# refresh_projects recomputes everything once this share of lists is affected
+FULL_REBUILD_SHARE = 0.5
+
+# pks per IN (...) query, well under SQLite's bound parameter limit
+QUERY_CHUNK = 5000
+
+# Queued refreshes handled per worker batch, all in one refresh_projects call
+DEFAULT_BATCH_SIZE = 500
+MAX_ATTEMPTS = 3
+# How long a claimed batch may stay 'running' before another worker retries it
+LEASE_SECONDS = 15 * 60
+
+
+@dataclass
+class FeatureMatrix:
+    pks: np.ndarray        # project pk of each row, ascending
+    indptr: np.ndarray     # CSR: features of row r are indices[indptr[r]:indptr[r + 1]]
+    indices: np.ndarray
+    feature_ptr: np.ndarray  # CSC: rows of feature f are feature_rows[feature_ptr[f]:feature_ptr[f + 1]]
+    feature_rows: np.ndarray
+    sizes: np.ndarray      # number of features per row
+    inverse_norms: np.ndarray  # 1 / sqrt(sizes), for cosine
+
+    def __len__(self):
+        return len(self.pks)
+
+    def rows_for(self, pks):
+        """Row indices of the given pks, skipping ones that aren't in the matrix"""
+        pks = np.asarray(sorted(pks), dtype=np.int64)
+        rows = np.searchsorted(self.pks, pks)
+        rows = rows[rows < len(self.pks)]
+        return rows[np.isin(self.pks[rows], pks)]
+
+
+def build_matrix(pks, rows, features, feature_count):
+    """FeatureMatrix from parallel arrays of (row, feature) entries"""
+    n = len(pks)
+    entries = np.unique(np.asarray(rows, dtype=np.int64) * feature_count + np.asarray(features, dtype=np.int64))
+    rows, features = entries // feature_count, entries % feature_count
+    sizes = np.bincount(rows, minlength=n)
+    by_feature = np.argsort(features, kind='stable')
+    return FeatureMatrix(
+        pks=np.asarray(pks, dtype=np.int64),
+        indptr=np.concatenate(([0], np.cumsum(sizes))),
+        indices=features,
+        feature_ptr=np.concatenate(([0], np.cumsum(np.bincount(features, minlength=feature_count)))),
+        feature_rows=rows[by_feature],
+        sizes=sizes.astype(np.float32),
+        inverse_norms=(1 / np.sqrt(np.maximum(sizes, 1))).astype(np.float32),
+    )
+
+
+def load_features():
+    """Build the project x (technology + category) matrix from the technology index"""
+    projects = list(Project.objects.order_by('pk').values_list('pk', 'category'))
+    pks = np.fromiter((pk for pk, _ in projects), dtype=np.int64, count=len(projects))
+    links = np.array(ProjectTechnology.objects.values_list('project_id', 'technology_id'), dtype=np.int64).reshape(-1, 2)
+
+    # Technology pks are used as feature ids directly, categories follow them
+    technology_count = int(links[:, 1].max()) + 1 if len(links) else 0
+    category_ids = {category: i for i, category in enumerate(sorted({category for _, category in projects}))}
+    categories = np.fromiter((technology_count + category_ids[category] for _, category in projects),
+                             dtype=np.int64, count=len(projects))
+    rows = np.concatenate((np.searchsorted(pks, links[:, 0]), np.arange(len(pks))))
+    features = np.concatenate((links[:, 1], categories))
+    return build_matrix(pks, rows, features, technology_count + len(category_ids))
+
+
+def _ranges(starts, lengths):
+    """Concatenation of arange(start, start + length) for each pair"""
+    total = int(lengths.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+def _overlaps(matrix, rows):
+    """(len(rows), len(matrix)) counts of features shared by each row and every project"""
+    overlap = np.zeros((len(rows), len(matrix)), dtype=np.float32)
+    starts, nnz = matrix.indptr[rows], matrix.indptr[rows + 1] - matrix.indptr[rows]
+    block_rows = np.repeat(np.arange(len(rows)), nnz)
+    features = matrix.indices[_ranges(starts, nnz)]
+    # Group the block's entries by feature: every block row having feature f
+    # overlaps by one with every project in f's posting list
+    order = np.argsort(features, kind='stable')
+    features, block_rows = features[order], block_rows[order]
+    present, first = np.unique(features, return_index=True)
+    bounds = np.append(first, len(features))
+    for feature, start, end in zip(present.tolist(), bounds[:-1].tolist(), bounds[1:].tolist()):
+        postings = matrix.feature_rows[matrix.feature_ptr[feature]:matrix.feature_ptr[feature + 1]]
+        overlap[np.ix_(block_rows[start:end], postings)] += 1
+    return overlap
+
+
+def similarities(matrix, rows, metric='cosine'):
+    """
+    (len(rows), len(matrix)) float32 scores of each row against every
+    project, 0 for itself. Every project has at least its category feature,
+    so the denominators are never 0.
+    """
+    overlap = _overlaps(matrix, rows)
+    if metric == 'cosine':
+        scores = overlap * matrix.inverse_norms[rows][:, None] * matrix.inverse_norms[None, :]
+    elif metric == 'jaccard':
+        scores = overlap / (matrix.sizes[rows][:, None] + matrix.sizes[None, :] - overlap)
+    else:
+        raise ValueError(f'Unknown similarity metric {metric!r}, expected one of {", ".join(METRICS)}')
+    scores[np.arange(len(rows)), rows] = 0
+    return scores
+
+
+def _blocks(matrix, rows):
+    size = max(1, BLOCK_CELLS // max(len(matrix), 1))
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _top_blocks(matrix, rows, top_k, metric):
+    """Yield ``(block_rows, neighbour_rows, scores)`` arrays, each row's neighbours best first"""
+    n = len(matrix)
+    k = min(top_k, n - 1)
+    if k <= 0:
+        return
+    columns = np.arange(n, dtype=np.int64)
+    for block in _blocks(matrix, np.asarray(rows, dtype=np.int64)):
+        scores = similarities(matrix, block, metric)
+        # Non-negative float32s order like their bit patterns, so packing
+        # (score bits, row) into one int64 sorts by score and then by row:
+        # ties go to the newer (higher) project, exactly
+        ranked = (scores.view(np.int32).astype(np.int64) << 32) | columns
+        best = np.argpartition(ranked, n - k, axis=1)[:, n - k:]
+        order = np.argsort(-np.take_along_axis(ranked, best, axis=1), axis=1)
+        best = np.take_along_axis(best, order, axis=1)
+        yield block, best, np.take_along_axis(scores, best, axis=1)
+
+
+def top_neighbours(matrix, rows, top_k, metric='cosine'):
+    """
+    Yield ``(row, neighbour_rows, scores)`` for each of ``rows``, best first.
+    Projects sharing no feature with the row are never neighbours.
+    """
+    for block, best, best_scores in _top_blocks(matrix, rows, top_k, metric):
+        for row, neighbours, scores in zip(block, best, best_scores):
+            keep = scores > 0
+            yield row, neighbours[keep], scores[keep]
+
+
+def _settings(top_k, metric):
+    return top_k or settings.RELATED_PROJECTS_TOP_K, metric or settings.RELATED_PROJECTS_METRIC
+
+
+def _insert_many(params):
+    """
+    Insert (project_id, related_id, rank, score) rows with one parameterised
+    INSERT run through ``executemany``, skipping a model instance per row
+    """
+    connection = connections[router.db_for_write(RelatedProject)]
+    qn = connection.ops.quote_name
+    columns = [RelatedProject._meta.get_field(name).column for name in ('project', 'related', 'rank', 'score')]
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        qn(RelatedProject._meta.db_table), ', '.join(qn(column) for column in columns), ', '.join(['%s'] * 4))
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, params)
+
+
+def _store(matrix, rows, top_k, metric, replace=True):
+    """Write freshly computed neighbours of ``rows``, replacing their stored lists"""
+    pks = matrix.pks
+    with transaction.atomic():
+        if replace:
+            for start in range(0, len(rows), QUERY_CHUNK):
+                RelatedProject.objects.filter(project__in=pks[rows[start:start + QUERY_CHUNK]].tolist()).delete()
+        for block, best, scores in _top_blocks(matrix, rows, top_k, metric):
+            keep = scores > 0
+            ranks = np.broadcast_to(np.arange(1, best.shape[1] + 1), best.shape)
+            _insert_many(zip(
+                np.broadcast_to(pks[block][:, None], best.shape)[keep].tolist(),
+                pks[best][keep].tolist(),
+                ranks[keep].tolist(),
+                scores[keep].astype(np.float64).tolist(),
+            ))
+
+
+def _lists_changed(pks):
+    """
+    Drop the cached details showing the recomputed lists and expire the
+    conditional GET validators of the pages listing related work
+    """
+    invalidate_project_details(pks)
+    mark_content_changed()
+
+
+def rebuild(top_k=None, metric=None):
+    """Recompute the related projects of every project; returns the number of projects"""
+    top_k, metric = _settings(top_k, metric)
+    matrix = load_features()
+    with transaction.atomic():
+        RelatedProject.objects.all().delete()
+        _store(matrix, np.arange(len(matrix)), top_k, metric, replace=False)
+    _lists_changed(matrix.pks.tolist())
+    return len(matrix)
+
+
+def _score_floors(matrix, top_k):
+    """Score a project has to reach to enter each row's list: its weakest entry when full, else anything above 0"""
+    floors = np.zeros(len(matrix))
+    full = np.array([
+        (pk, low) for pk, n, low in RelatedProject.objects.values_list('project_id').annotate(
+            n=Count('pk'), low=Min('score')).order_by() if n >= top_k
+    ]).reshape(-1, 2)
+    rows = np.searchsorted(matrix.pks, full[:, 0].astype(np.int64))
+    found = rows < len(matrix)
+    found[found] = matrix.pks[rows[found]] == full[found, 0]
+    floors[rows[found]] = full[found, 1]
+    return floors
+
+
+def refresh_projects(pks, top_k=None, metric=None):
+    """
+    Update the stored lists after the projects ``pks`` were created, changed
+    or deleted. Returns the pks of the projects whose lists were recomputed.
+    """
+    top_k, metric = _settings(top_k, metric)
+    pks = set(pks)
+    if not pks:
+        return set()
+    matrix = load_features()
+    if len(pks) >= FULL_REBUILD_SHARE * len(matrix):
+        rebuild(top_k, metric)
+        return set(matrix.pks.tolist())
+    changed = matrix.rows_for(pks)
+    affected = set(changed.tolist())
+    # Lists that contain a changed project may rank it differently or lose it
+    ordered = sorted(pks)
+    for start in range(0, len(ordered), QUERY_CHUNK):
+        affected.update(matrix.rows_for(RelatedProject.objects.filter(
+            related__in=ordered[start:start + QUERY_CHUNK]).values_list('project_id', flat=True)).tolist())
+    # A changed project can push the weakest entry out of another list
+    if len(changed):
+        floors = _score_floors(matrix, top_k)
+        for block in _blocks(matrix, changed):
+            scores = similarities(matrix, block, metric)
+            # Ties count: the tie break may rank the changed project first
+            beats = ((scores > 0) & (scores >= floors)).any(axis=0)
+            affected.update(np.flatnonzero(beats).tolist())
+
+    if len(affected) >= FULL_REBUILD_SHARE * len(matrix):
+        rebuild(top_k, metric)
+        return set(matrix.pks.tolist())
+    rows = np.asarray(sorted(affected), dtype=np.int64)
+    _store(matrix, rows, top_k, metric)
+    refreshed = set(matrix.pks[rows].tolist())
+    _lists_changed(refreshed)
+    return refreshed
+
+
+def enqueue_refresh(pks):
+    """Queue a refresh of the lists the projects ``pks`` can affect, skipping ones already waiting"""
+    pks = set(pks)
+    if not pks:
+        return []
+    waiting = set(RelatedProjectsJob.objects.filter(status='pending', project_pk__in=pks).values_list(
+        'project_pk', flat=True))
+    return RelatedProjectsJob.objects.bulk_create(
+        [RelatedProjectsJob(project_pk=pk) for pk in sorted(pks - waiting)])
+
+
+def process_refresh_jobs(batch_size=DEFAULT_BATCH_SIZE, max_attempts=MAX_ATTEMPTS):
+    """
+    Refresh the lists of one batch of queued projects with a single
+    refresh_projects call. Returns a (succeeded, failed) tuple of job counts.
+    """
+    batch = claim_batch(RelatedProjectsJob.objects.all(), batch_size, 'running', LEASE_SECONDS, max_attempts)
+    if not batch:
+        return 0, 0
+    try:
+        refresh_projects({job.project_pk for job in batch})
+    except Exception as e:
+        for job in batch:
+            job.attempts += 1
+            job.last_error = str(e)
+            job.claimed_at = None
+            if job.attempts >= max_attempts:
+                job.status = 'failed'
+                job.finished_at = timezone.now()
+            else:
+                job.status = 'pending'
+                job.next_attempt_at = timezone.now() + timedelta(seconds=backoff_delay(job.attempts))
+        RelatedProjectsJob.objects.bulk_update(
+            batch, ['status', 'attempts', 'last_error', 'claimed_at', 'next_attempt_at', 'finished_at'])
+        logger.warning(f"Related projects refresh of {len(batch)} project(s) failed: {e}")
+        return 0, len(batch)
+
+    RelatedProjectsJob.objects.filter(pk__in=[job.pk for job in batch]).update(
+        status='done', attempts=F('attempts') + 1, last_error='', claimed_at=None, finished_at=timezone.now())
+    return len(batch), 0
@@ -0,0 +1,194 @@
+"""
+Responsive image renditions for uploaded project, team and testimonial images.
+
+Saving a model with an image queues a RenditionJob (see core.signals). The
+process_rendition_jobs worker resizes the original to the widths of its
+preset, strips EXIF metadata and encodes WebP, AVIF (when Pillow has an AVIF
+encoder) and a JPEG fallback, stored in a ``renditions/`` folder next to the
+original. Views look renditions up in bulk with renditions_for() and the
+responsive_image template tag turns them into a <picture> with srcset/sizes.
+Claims are leased (see core.job_queue), so jobs held by a worker that died
+are picked up again.
+"""
+import logging
+import os
+from datetime import timedelta
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image, ImageOps, features
+
+from .caching import (
+    CONTENT_NAMESPACE, PORTFOLIO_NAMESPACE, bump_version, invalidate_project_details, mark_content_changed,
+)
+from .job_queue import backoff_delay, claim_batch, queued
+from .models import ImageRendition, Project, RelatedProject, RenditionJob
+
+logger = logging.getLogger(__name__)
+
+# Target widths per preset, matching the sizes the templates display
+PRESETS = {
+    'project_image': (480, 800, 1200),   # modal/detail view, recommended 1200x800
+    'project_card': (400, 800),          # card preview at 1x/2x, recommended 400x300
+    'avatar': (200, 400),
+    'testimonial': (100, 200),
+}
+
+# Which preset each uploaded image field uses
+RENDITION_FIELDS = {
+    'Project': {'image': 'project_image', 'fallback_image': 'project_card'},
+    'TeamMember': {'image': 'avatar'},
+    'Testimonial': {'image': 'testimonial'},
+}
+
+# (format, Pillow format name, file extension, save options), best first
+ENCODINGS = [
+    ('avif', 'AVIF', 'avif', {'quality': 50}),
+    ('webp', 'WEBP', 'webp', {'quality': 80, 'method': 4}),
+    ('jpeg', 'JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+]
+
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp', 'jpeg': 'image/jpeg'}
+
+DEFAULT_BATCH_SIZE = 10
+MAX_ATTEMPTS = 3
+# How long a claimed batch may stay 'running' before another worker retries
+# it; AVIF encoding of a full batch of large uploads can take minutes
+LEASE_SECONDS = 30 * 60
+
+
+def available_encodings():
+    return [encoding for encoding in ENCODINGS if encoding[0] != 'avif' or features.check('avif')]
+
+
+def rendition_name(source, width, extension):
+    directory, filename = os.path.split(source)
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(directory, 'renditions', f'{stem}-{width}w.{extension}')
+
+
+def _target_widths(preset, original_width):
+    # Never upscale: keep the widths that fit, or the original size if none do
+    widths = [width for width in PRESETS[preset] if width <= original_width]
+    return widths or [original_width]
+
+
+def generate_renditions(source, preset, storage=default_storage):
+    """Create (or replace) every rendition of ``source`` for ``preset``"""
+    with storage.open(source, 'rb') as f:
+        original = Image.open(f)
+        original.load()
+
+    # Apply the EXIF orientation before the metadata is dropped
+    image = ImageOps.exif_transpose(original)
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    delete_renditions([source], storage)
+    renditions = []
+    for width in _target_widths(preset, image.width):
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.LANCZOS) if width != image.width else image
+        for fmt, pil_format, extension, options in available_encodings():
+            frame = resized
+            if fmt == 'jpeg' and has_alpha:
+                # JPEG has no alpha channel, flatten onto white
+                frame = Image.new('RGB', resized.size, (255, 255, 255))
+                frame.paste(resized, mask=resized.getchannel('A'))
+            buffer = BytesIO()
+            # No exif= argument, so the metadata is stripped
+            frame.save(buffer, pil_format, **options)
+            name = storage.save(rendition_name(source, width, extension), ContentFile(buffer.getvalue()))
+            renditions.append(ImageRendition(source=source, format=fmt, width=width, height=height, file=name))
+
+    ImageRendition.objects.bulk_create(renditions)
+    return renditions
+
+
+def delete_renditions(sources, storage=default_storage):
+    existing = ImageRendition.objects.filter(source__in=sources)
+    for name in existing.values_list('file', flat=True):
+        storage.delete(name)
+    existing.delete()
+
+
+def renditions_for(sources):
+    """
+    Look up renditions for many original storage names in one query.
+    Returns {source: {format: [(url, width), ...]}} with widths ascending.
+    """
+    sources = [source for source in sources if source]
+    result = {}
+    if not sources:
+        return result
+    renditions = ImageRendition.objects.filter(source__in=sources).order_by('width')
+    for rendition in renditions:
+        result.setdefault(rendition.source, {}).setdefault(rendition.format, []).append(
+            (rendition.file.url, rendition.width)
+        )
+    return result
+
+
+def enqueue_renditions(*instances):
+    """Queue rendition jobs for image fields of the given instances that have none yet"""
+    sources = {}
+    for instance in instances:
+        fields = RENDITION_FIELDS.get(type(instance).__name__, {})
+        sources.update({getattr(instance, field).name: preset for field, preset in fields.items() if getattr(instance, field)})
+    if not sources:
+        return []
+    known = set(ImageRendition.objects.filter(source__in=sources).values_list('source', flat=True))
+    # A 'running' job whose lease expired belongs to a dead worker and doesn't count
+    known.update(RenditionJob.objects.filter(queued('running', LEASE_SECONDS), source__in=sources)
+                 .values_list('source', flat=True))
+    return RenditionJob.objects.bulk_create([
+        RenditionJob(source=source, preset=preset) for source, preset in sources.items() if source not in known
+    ])
+
+
+def process_rendition_jobs(batch_size=DEFAULT_BATCH_SIZE, max_attempts=MAX_ATTEMPTS, storage=default_storage):
+    """
+    Run one batch of due rendition jobs.
+    Returns a (succeeded, failed) tuple of job counts.
+    """
+    batch = claim_batch(RenditionJob.objects.all(), batch_size, 'running', LEASE_SECONDS, max_attempts)
+    succeeded = failed = 0
+    done_sources = []
+    for job in batch:
+        job.attempts += 1
+        try:
+            generate_renditions(job.source, job.preset, storage)
+        except Exception as e:
+            failed += 1
+            job.last_error = str(e)
+            if job.attempts >= max_attempts:
+                job.status = 'failed'
+                job.finished_at = timezone.now()
+                logger.error(f"Giving up on renditions for {job.source}: {e}")
+            else:
+                job.status = 'pending'
+                job.next_attempt_at = timezone.now() + timedelta(seconds=backoff_delay(job.attempts))
+                logger.warning(f"Renditions for {job.source} failed (attempt {job.attempts}): {e}")
+        else:
+            succeeded += 1
+            done_sources.append(job.source)
+            job.status = 'done'
+            job.last_error = ''
+            job.finished_at = timezone.now()
+        job.claimed_at = None
+        job.save(update_fields=['status', 'attempts', 'last_error', 'next_attempt_at', 'finished_at', 'claimed_at'])
+
+    if succeeded:
+        # Cached project cards and page fragments embed rendition URLs
+        bump_version(PORTFOLIO_NAMESPACE)
+        bump_version(CONTENT_NAMESPACE)
+        # Details embed the project's image and the card thumbnails (fallback or main image) of related work
+        changed = list(Project.objects.filter(Q(image__in=done_sources) | Q(fallback_image__in=done_sources))
+                       .values_list('pk', flat=True))
+        referrers = RelatedProject.objects.filter(related__in=changed).values_list('project_id', flat=True)
+        invalidate_project_details([*changed, *referrers])
+        mark_content_changed()
+    return succeeded, failed
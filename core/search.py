@@ -0,0 +1,163 @@
+"""
+Full-text search for the admin inbox (ContactMessage) and meetings.
+
+Each indexed model gets a side table named ``<db_table>_fts``, keyed by the
+row's primary key:
+
+* SQLite: an FTS5 virtual table, ranked with ``bm25()``.
+* PostgreSQL: ``(id, document tsvector)`` with a GIN index, ranked with
+  ``ts_rank()``.
+
+Other backends keep Django's default ``LIKE`` search. Rows are (re)indexed
+from post_save/post_delete in core.signals; ``manage.py rebuild_search_index``
+repopulates the tables from scratch.
+"""
+import re
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+# Indexed columns per model, with their relevance weight (higher ranks first)
+SEARCH_FIELDS = {
+    'ContactMessage': {'subject': 'A', 'name': 'B', 'email': 'B', 'message': 'C'},
+    'Meeting': {'topic': 'A', 'name': 'B', 'email': 'B', 'notes': 'C'},
+}
+# bm25() column weights for the SQLite index
+FTS5_WEIGHTS = {'A': 10.0, 'B': 5.0, 'C': 1.0}
+# ts_rank() weights, in PostgreSQL's {D, C, B, A} order
+PG_WEIGHTS = '{0.1, 0.1, 0.5, 1.0}'
+PG_CONFIG = 'english'
+
+TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def is_supported(conn=connection):
+    return conn.vendor in ('sqlite', 'postgresql')
+
+
+def index_table(model):
+    return f'{model._meta.db_table}_fts'
+
+
+def _fields(model):
+    return SEARCH_FIELDS[model.__name__]
+
+
+def _terms(search_term):
+    return TERM_RE.findall(search_term.lower())
+
+
+# --- Schema -----------------------------------------------------------------
+
+def create_index(model, conn=connection):
+    table, fields = index_table(model), _fields(model)
+    with conn.cursor() as cursor:
+        if conn.vendor == 'sqlite':
+            columns = ', '.join(fields)
+            cursor.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} "
+                           f"USING fts5({columns}, tokenize='porter unicode61')")
+        elif conn.vendor == 'postgresql':
+            cursor.execute(f'CREATE TABLE IF NOT EXISTS {table} '
+                           f'(id bigint PRIMARY KEY, document tsvector NOT NULL)')
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {table}_gin ON {table} USING GIN (document)')
+
+
+def drop_index(model, conn=connection):
+    if is_supported(conn):
+        with conn.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {index_table(model)}')
+
+
+# --- Sync -------------------------------------------------------------------
+
+def _upsert_sql(model, conn):
+    table, fields = index_table(model), _fields(model)
+    if conn.vendor == 'sqlite':
+        placeholders = ', '.join(['%s'] * (len(fields) + 1))
+        return f'INSERT OR REPLACE INTO {table} (rowid, {", ".join(fields)}) VALUES ({placeholders})'
+    document = ' || '.join(
+        f"setweight(to_tsvector('{PG_CONFIG}', %s), '{weight}')" for weight in fields.values()
+    )
+    return (f'INSERT INTO {table} (id, document) VALUES (%s, {document}) '
+            f'ON CONFLICT (id) DO UPDATE SET document = EXCLUDED.document')
+
+
+def _row(instance):
+    return [instance.pk] + [getattr(instance, field) or '' for field in _fields(type(instance))]
+
+
+def index_instances(model, instances, conn=connection):
+    if not is_supported(conn):
+        return
+    rows = [_row(instance) for instance in instances]
+    if rows:
+        with conn.cursor() as cursor:
+            cursor.executemany(_upsert_sql(model, conn), rows)
+
+
+def index_instance(instance, conn=connection):
+    index_instances(type(instance), [instance], conn)
+
+
+def unindex_instance(instance, conn=connection):
+    if not is_supported(conn):
+        return
+    key = 'rowid' if conn.vendor == 'sqlite' else 'id'
+    with conn.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {index_table(type(instance))} WHERE {key} = %s', [instance.pk])
+
+
+def rebuild_index(model, batch_size=500, conn=connection):
+    """Repopulate a model's index from its table; returns the number of rows indexed"""
+    if not is_supported(conn):
+        return 0
+    with conn.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {index_table(model)}')
+    fields = ['pk', *_fields(model)]
+    batch, total = [], 0
+    for instance in model.objects.only(*fields).iterator(chunk_size=batch_size):
+        batch.append(instance)
+        if len(batch) == batch_size:
+            index_instances(model, batch, conn)
+            total, batch = total + len(batch), []
+    index_instances(model, batch, conn)
+    return total + len(batch)
+
+
+# --- Querying ---------------------------------------------------------------
+
+def _match_query(terms, vendor):
+    # Every term must match; the last one as a prefix so search-as-you-type works
+    if vendor == 'sqlite':
+        quoted = [f'"{term}"' for term in terms]
+        quoted[-1] += '*'
+        return ' '.join(quoted)
+    return ' & '.join(terms[:-1] + [f'{terms[-1]}:*'])
+
+
+def search(queryset, search_term):
+    """
+    Restrict ``queryset`` to rows matching ``search_term``, annotated with
+    ``search_rank`` and ordered best match first. Returns None when the
+    backend has no full-text index or the term has nothing searchable.
+    """
+    terms = _terms(search_term)
+    if not terms or not is_supported():
+        return None
+    model = queryset.model
+    table, pk_column = index_table(model), f'{model._meta.db_table}.{model._meta.pk.column}'
+    match = _match_query(terms, connection.vendor)
+
+    if connection.vendor == 'sqlite':
+        weights = ', '.join(str(FTS5_WEIGHTS[weight]) for weight in _fields(model).values())
+        matches = RawSQL(f'SELECT rowid FROM {table} WHERE {table} MATCH %s', [match])
+        # bm25() is lower-is-better; negate so higher ranks first like ts_rank
+        rank = RawSQL(f'SELECT -bm25({table}, {weights}) FROM {table} '
+                      f'WHERE {table} MATCH %s AND rowid = {pk_column}', [match])
+    else:
+        query = f"to_tsquery('{PG_CONFIG}', %s)"
+        matches = RawSQL(f'SELECT id FROM {table} WHERE document @@ {query}', [match])
+        rank = RawSQL(f"SELECT ts_rank('{PG_WEIGHTS}', document, {query}) FROM {table} "
+                      f'WHERE id = {pk_column}', [match])
+
+    return queryset.filter(pk__in=matches).annotate(search_rank=rank).order_by('-search_rank')
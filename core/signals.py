@@ -0,0 +1,138 @@
+"""
+Model signal receivers that keep cached content in sync with the database.
+Connected from CoreConfig.ready().
+"""
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from allauth.socialaccount.models import SocialApp
+
+from .caching import (
+    CONTENT_NAMESPACE, PORTFOLIO_NAMESPACE, SOCIAL_APP_NAMESPACE, TEAM_NAMESPACE, bump_version,
+    invalidate_project_details, mark_content_changed,
+)
+from .models import ContactMessage, Meeting, Project, RelatedProject, TeamMember, Testimonial
+from . import related, search, technologies
+from .renditions import enqueue_renditions
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+def invalidate_portfolio_cache(sender, **kwargs):
+    """Projects link to team members, so a change to either invalidates the portfolio"""
+    bump_version(PORTFOLIO_NAMESPACE)
+
+
+# Project fields shown on the related project cards of other projects' details
+RELATED_CARD_FIELDS = {'title', 'category', 'image', 'fallback_image'}
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_detail(sender, instance, update_fields=None, **kwargs):
+    """Only this project's modal details change, and those showing its card as related work"""
+    referrers = getattr(instance, '_related_referrers', None)
+    if referrers is None and (update_fields is None or RELATED_CARD_FIELDS & set(update_fields)):
+        referrers = RelatedProject.objects.filter(related=instance).values_list('project_id', flat=True)
+    invalidate_project_details([instance.pk, *(referrers or [])])
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+@receiver(post_save, sender=Testimonial)
+@receiver(post_delete, sender=Testimonial)
+def invalidate_content_fragments(sender, **kwargs):
+    """Re-render the cached fragments and expire conditional GET validators after a content change"""
+    bump_version(CONTENT_NAMESPACE)
+    mark_content_changed()
+
+
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+def invalidate_team_cache(sender, **kwargs):
+    """Refresh the slug -> pk map used to resolve team member portfolio URLs"""
+    bump_version(TEAM_NAMESPACE)
+
+
+@receiver(post_save, sender=SocialApp)
+@receiver(post_delete, sender=SocialApp)
+def invalidate_social_app_cache(sender, **kwargs):
+    """Re-check Google OAuth availability after the social app configuration changes"""
+    bump_version(SOCIAL_APP_NAMESPACE)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=TeamMember)
+@receiver(post_save, sender=Testimonial)
+def queue_image_renditions(sender, instance, raw=False, **kwargs):
+    """Queue responsive renditions for newly uploaded images"""
+    if not raw:
+        enqueue_renditions(instance)
+
+
+@receiver(post_save, sender=ContactMessage)
+@receiver(post_save, sender=Meeting)
+def update_search_index(sender, instance, **kwargs):
+    """Keep the admin full-text index in step with the row"""
+    search.index_instance(instance)
+
+
+@receiver(post_delete, sender=ContactMessage)
+@receiver(post_delete, sender=Meeting)
+def remove_from_search_index(sender, instance, **kwargs):
+    search.unindex_instance(instance)
+
+
+def _indexed_fields_touched(update_fields):
+    return update_fields is None or bool({'technologies', 'category'} & set(update_fields))
+
+
+@receiver(pre_save, sender=Project)
+def remember_project_category(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Note the stored category so post_save can move the project between category counts"""
+    instance._indexed_category = None
+    if not raw and not instance._state.adding and _indexed_fields_touched(update_fields):
+        instance._indexed_category = Project.objects.filter(pk=instance.pk).values_list('category', flat=True).first()
+
+
+@receiver(post_save, sender=Project)
+def update_technology_index(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Keep the technology links and facet counts in step with the project"""
+    if raw or not _indexed_fields_touched(update_fields):
+        return
+    technologies.sync_projects([instance])
+    previous = None if created else getattr(instance, '_indexed_category', None)
+    if created or previous != instance.category:
+        deltas = {instance.category: 1}
+        if previous is not None:
+            deltas[previous] = -1
+        technologies.adjust_category_counts(deltas)
+
+
+@receiver(pre_delete, sender=Project)
+def remove_from_technology_index(sender, instance, **kwargs):
+    technologies.unindex_project(instance)
+
+
+@receiver(post_save, sender=Project)
+def refresh_related_projects(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Queue a refresh of the related project lists the saved project can change"""
+    if raw or not _indexed_fields_touched(update_fields):
+        return
+    related.enqueue_refresh([instance.pk])
+
+
+@receiver(pre_delete, sender=Project)
+def remember_related_referrers(sender, instance, **kwargs):
+    """Note which lists include the project before its RelatedProject rows cascade"""
+    instance._related_referrers = list(
+        RelatedProject.objects.filter(related=instance).values_list('project_id', flat=True))
+
+
+@receiver(post_delete, sender=Project)
+def refill_related_projects(sender, instance, **kwargs):
+    """Queue the lists that lost the deleted project, to be refilled by the worker"""
+    related.enqueue_refresh(getattr(instance, '_related_referrers', []))
@@ -0,0 +1,25 @@
+from django.core.files.base import ContentFile
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+from .assets import BUNDLE_DIR, MINIFIERS
+
+
+class MinifiedManifestStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    WhiteNoise's hashed + gzip/brotli storage, minifying page bundles first.
+
+    Only files under ``bundles/`` are minified; third-party static files
+    (admin, allauth) are collected untouched. Minification happens when the
+    file is copied into STATIC_ROOT, so the content hash and the compressed
+    variants are both computed from the minified bytes. post_process saves
+    the hashed copy through here again, which is harmless because the
+    minifiers are idempotent.
+    """
+
+    def _save(self, name, content):
+        suffix = name[name.rfind('.'):] if '.' in name else ''
+        if name.startswith(f'{BUNDLE_DIR}/') and suffix in MINIFIERS:
+            content.seek(0)
+            source = content.read().decode('utf-8')
+            content = ContentFile(MINIFIERS[suffix](source).encode('utf-8'))
+        return super()._save(name, content)
@@ -0,0 +1,165 @@
+"""
+Normalised technology index and facet counts for the portfolio.
+
+``Project.technologies`` stays the editable source of truth. Each project's
+list is mirrored into ``ProjectTechnology`` rows pointing at deduplicated
+``Technology`` tags, so projects can be filtered by technology with an
+indexed join instead of scanning every JSON value.
+
+``Technology.project_count`` and ``CategoryCount.project_count`` are
+adjusted by deltas as projects are saved and deleted (see core.signals),
+so facet counts are a plain read. ``rebuild_index`` recomputes everything
+from ``Project`` for backfills, bulk loads and repairing drift, and then
+bumps the portfolio cache namespace so cached facets and filtered pages
+are rebuilt from the repaired index.
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils.text import slugify
+
+from .caching import PORTFOLIO_NAMESPACE, bump_version
+from .models import CategoryCount, Project, ProjectTechnology, Technology, parse_technologies
+
+SLUG_LENGTH = Technology._meta.get_field('slug').max_length
+
+
+def technology_slug(name):
+    return slugify(name)[:SLUG_LENGTH]
+
+
+def _tags(technologies):
+    """{slug: display name} for a technologies value, first spelling wins"""
+    tags = {}
+    try:
+        names = parse_technologies(technologies)
+    except ValueError:
+        names = []
+    for name in names:
+        slug = technology_slug(name)
+        if slug:
+            tags.setdefault(slug, name[:100])
+    return tags
+
+
+def _ensure_technologies(tags):
+    """Return {slug: Technology pk}, creating missing tags"""
+    if not tags:
+        return {}
+    Technology.objects.bulk_create(
+        [Technology(slug=slug, name=name) for slug, name in tags.items()], ignore_conflicts=True)
+    return dict(Technology.objects.filter(slug__in=tags).values_list('slug', 'pk'))
+
+
+def _apply_deltas(model, deltas, key='pk'):
+    """Add each delta to model.project_count, one UPDATE per distinct delta"""
+    by_delta = defaultdict(list)
+    for value, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(value)
+    for delta, values in by_delta.items():
+        model.objects.filter(**{f'{key}__in': values}).update(project_count=F('project_count') + delta)
+
+
+def adjust_category_counts(deltas):
+    """Apply {category: delta} to the category counts"""
+    CategoryCount.objects.bulk_create(
+        [CategoryCount(category=category) for category, delta in deltas.items() if delta], ignore_conflicts=True)
+    _apply_deltas(CategoryCount, deltas, key='category')
+
+
+def sync_projects(projects):
+    """
+    Bring the technology links of ``projects`` in line with their
+    ``technologies`` lists and adjust the per-technology counts.
+    """
+    projects = [project for project in projects if project.pk is not None]
+    if not projects:
+        return
+    wanted = {project.pk: _tags(project.technologies) for project in projects}
+    with transaction.atomic():
+        ids = _ensure_technologies({slug: name for tags in wanted.values() for slug, name in tags.items()})
+        wanted_links = {(pk, ids[slug]) for pk, tags in wanted.items() for slug in tags}
+        current = {
+            (project_id, technology_id): link_id
+            for link_id, project_id, technology_id in ProjectTechnology.objects.filter(
+                project__in=wanted).values_list('pk', 'project_id', 'technology_id')
+        }
+        added = wanted_links - current.keys()
+        removed = current.keys() - wanted_links
+        if removed:
+            ProjectTechnology.objects.filter(pk__in=[current[link] for link in removed]).delete()
+        ProjectTechnology.objects.bulk_create(
+            [ProjectTechnology(project_id=project_id, technology_id=technology_id) for project_id, technology_id in added])
+
+        deltas = Counter(technology_id for _, technology_id in added)
+        deltas.subtract(technology_id for _, technology_id in removed)
+        _apply_deltas(Technology, deltas)
+
+
+def unindex_project(project):
+    """Drop a project that is about to be deleted from the counts; its links cascade"""
+    technology_ids = list(ProjectTechnology.objects.filter(project=project).values_list('technology_id', flat=True))
+    _apply_deltas(Technology, Counter({technology_id: -1 for technology_id in technology_ids}))
+    adjust_category_counts({project.category: -1})
+
+
+def rebuild_index(batch_size=1000):
+    """Re-link every project and recompute all counts from scratch"""
+    with transaction.atomic():
+        ProjectTechnology.objects.all().delete()
+        batch = []
+        for project in Project.objects.only('pk', 'technologies').iterator(chunk_size=batch_size):
+            batch.append(project)
+            if len(batch) >= batch_size:
+                _link(batch)
+                batch = []
+        _link(batch)
+        _recount()
+    bump_version(PORTFOLIO_NAMESPACE)
+    return ProjectTechnology.objects.count()
+
+
+def _link(projects):
+    wanted = {project.pk: _tags(project.technologies) for project in projects}
+    ids = _ensure_technologies({slug: name for tags in wanted.values() for slug, name in tags.items()})
+    ProjectTechnology.objects.bulk_create([
+        ProjectTechnology(project_id=pk, technology_id=ids[slug]) for pk, tags in wanted.items() for slug in tags
+    ])
+
+
+def recount():
+    """Recompute the technology and category counts with two GROUP BY queries"""
+    _recount()
+    bump_version(PORTFOLIO_NAMESPACE)
+
+
+def _recount():
+    with transaction.atomic():
+        Technology.objects.update(project_count=0)
+        counts = Counter(dict(ProjectTechnology.objects.values_list('technology').annotate(n=Count('pk')).order_by()))
+        _apply_deltas(Technology, counts)
+
+        CategoryCount.objects.all().delete()
+        CategoryCount.objects.bulk_create([
+            CategoryCount(category=category, project_count=n)
+            for category, n in Project.objects.values_list('category').annotate(n=Count('pk')).order_by()
+        ])
+
+
+def facet_counts():
+    """Technologies and categories that have projects, with their counts"""
+    labels = dict(Project.CATEGORY_CHOICES)
+    return {
+        'technologies': [
+            {'name': name, 'slug': slug, 'count': count}
+            for name, slug, count in Technology.objects.filter(project_count__gt=0).order_by(
+                '-project_count', 'name').values_list('name', 'slug', 'project_count')
+        ],
+        'categories': [
+            {'value': category, 'label': labels.get(category, category), 'count': count}
+            for category, count in CategoryCount.objects.filter(project_count__gt=0).order_by(
+                'category').values_list('category', 'project_count')
+        ],
+    }
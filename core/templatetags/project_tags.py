@@ -1,6 +1,10 @@
 from django import template
 from django.conf import settings
 from django.templatetags.static import static
+from django.forms.utils import flatatt
+from django.utils.html import format_html, format_html_join
+
+from core.renditions import MIME_TYPES
 
 register = template.Library()
 
@@ -46,4 +50,47 @@ def clean_phone(phone_number):
     # Remove spaces, hyphens, parentheses, and dots
     import re
     cleaned = re.sub(r'[\s\-\(\)\.]', '', str(phone_number))
-    return cleaned
\ No newline at end of file
+    return cleaned
+
+def _srcset(candidates):
+    return ', '.join(f'{url} {width}w' for url, width in candidates)
+
+@register.simple_tag
+def responsive_image(renditions, src, sizes='100vw', **attrs):
+    """
+    Renders a <picture> with AVIF/WebP <source>s and a JPEG <img> fallback
+    from the renditions_for() data of an image. Without renditions (not
+    generated yet, or a placeholder URL) it renders a plain <img src>.
+
+    Attribute names use underscores for hyphens:
+    {% responsive_image project.image_renditions project.image sizes="(max-width: 768px) 100vw, 800px" alt=project.title data_fallback="..." %}
+    """
+    img_attrs = {'src': src}
+    img_attrs.update((name.replace('_', '-'), value) for name, value in attrs.items())
+    if not renditions:
+        return format_html('<img{}>', flatatt(img_attrs))
+
+    if 'jpeg' in renditions:
+        img_attrs['srcset'] = _srcset(renditions['jpeg'])
+        img_attrs['sizes'] = sizes
+    sources = format_html_join(
+        '', '<source type="{}" srcset="{}" sizes="{}">',
+        ((MIME_TYPES[fmt], _srcset(renditions[fmt]), sizes) for fmt in ('avif', 'webp') if fmt in renditions),
+    )
+    # display: contents keeps the <img> laid out exactly as before it was wrapped
+    return format_html('<picture style="display: contents">{}<img{}></picture>', sources, flatatt(img_attrs))
+
+@register.filter
+def rendition_src(renditions, width):
+    """
+    URL of the smallest JPEG rendition at least ``width`` pixels wide (or the
+    largest one), for places that can't use srcset such as CSS backgrounds.
+    Returns '' without renditions so it can be chained with |default.
+    """
+    candidates = (renditions or {}).get('jpeg')
+    if not candidates:
+        return ''
+    for url, candidate_width in candidates:
+        if candidate_width >= int(width):
+            return url
+    return candidates[-1][0]
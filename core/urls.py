@@ -9,14 +9,19 @@ urlpatterns = [
     path('about/', views.about, name='about'),
     path('services/', views.services, name='services'),
     path('portfolio/', views.portfolio, name='portfolio'),
+    path('portfolio/filter/', views.portfolio_filter, name='portfolio_filter'),
+    path('portfolio/<int:project_id>.json', views.portfolio_project, name='portfolio_project'),
     path('contact/', views.contact, name='contact'),
     path('contact/<str:member_slug>/', developer_contact, name='developer_contact'),
     path('schedule-meeting/', views.schedule_meeting, name='schedule_meeting'),
+    path('schedule-meeting/status/<str:token>/', views.meeting_status, name='meeting_status'),
     path('meetings/', views.meetings, name='meetings'),
     path('edit-profile/', views.edit_profile, name='edit_profile'),
+    path('metrics/', views.metrics, name='metrics'),
     path('team/', team, name='team'),
-    path('team/<str:member_name>/', team_member_portfolio, name='team_member_portfolio'),
-    path('<str:member_name>/', team_member_portfolio, name='team_member_portfolio_direct'),
+    path('team/<slug:member_name>/', team_member_portfolio, name='team_member_portfolio'),
+    # Catch-all: only slug-shaped paths are tried, and unknown ones 404 instead of redirecting
+    path('<slug:member_name>/', team_member_portfolio, {'redirect_unknown': False}, name='team_member_portfolio_direct'),
 ]
 
 # Serve media files during development
@@ -1,11 +1,30 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.core.mail import send_mail
+from django.template.loader import render_to_string
 from django.conf import settings
 from django.contrib import messages
-from .forms import ContactForm, MeetingForm, TeamMemberEditForm
+from .forms import ContactForm, MeetingFilterForm, MeetingForm, PortfolioFilterForm, TeamMemberEditForm
 from django.urls import reverse
-from .models import Project, TeamMember, Meeting
-from django.http import JsonResponse
+from .models import Project, RelatedProject, TeamMember, Meeting
+from .caching import (
+    CONTENT_NAMESPACE, PORTFOLIO_NAMESPACE, PROJECT_DETAIL_KEY, get_or_build, get_or_build_many, get_version,
+)
+from .conditional import content_conditional
+from .db_routing import read_from_replica
+from .mail_queue import enqueue_mail
+from .meeting_jobs import enqueue_calendar_job
+from .instrumentation import metrics_enabled, render_prometheus
+from .pagination import InvalidCursor, keyset_page
+from .renditions import renditions_for
+from .technologies import facet_counts, technology_slug
+from .templatetags.project_tags import rendition_src
+from .views_team import TEAM_MEMBER_PROFILE_FIELDS, serialize_team_member
+from django.http import JsonResponse, HttpResponse, Http404
+from django.core import signing
+from django.utils.functional import SimpleLazyObject
+from django.utils.http import urlencode
+from django.utils.text import slugify
+from django.db import transaction
+from django.db.models.functions import Left
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 from django.contrib.admin.views.decorators import staff_member_required
@@ -15,52 +34,152 @@ import logging
 
 from .models import Testimonial
 
+MEETING_STATUS_SALT = 'core.meeting_status'
+
+# Staff meetings dashboard: newest first, paged by keyset on (created_at, id)
+MEETINGS_PAGE_SIZE = 25
+MEETINGS_ORDERING = ('-created_at', '-id')
+MEETING_LIST_FIELDS = ('id', 'name', 'email', 'topic', 'date', 'time', 'status', 'google_meet_url', 'created_at')
+NOTES_EXCERPT_LENGTH = 200
+
+# Portfolio: newest first, paged by keyset on (completed_on, id)
+PORTFOLIO_PAGE_SIZE = 12
+PORTFOLIO_ORDERING = ('-completed_on', '-id')
+# Columns rendered by the project cards (completed_on is the keyset cursor)
+PROJECT_CARD_FIELDS = ('id', 'title', 'category', 'image', 'fallback_image', 'completed_on')
+# Columns shown in the project modal, fetched per project when a card is opened
+PROJECT_DETAIL_FIELDS = ('id', 'title', 'description', 'image', 'category', 'client', 'completion_date',
+                         'technologies', 'website')
+PROJECT_IMAGE_PLACEHOLDER = 'https://via.placeholder.com/1200x800/7f8c8d/ffffff?text=Project+Image'
+
+# Page sections shared by all users are cached as template fragments keyed on
+# the content version. Their data is passed lazily so a warm fragment never
+# runs the queries behind it.
+
 @login_required(login_url='/accounts/login/')
+@read_from_replica
 def home(request):
-    # Get the 4 most recent projects
-    projects = get_portfolio_projects()[:4]  # Only get the first 4 projects
-    testimonials = Testimonial.objects.all()
-    return render(request, 'core/home.html', {'section': 'home', 'featured_projects': projects, 'testimonials': testimonials})
+    return render(request, 'core/home.html', {
+        'section': 'home',
+        'content_version': get_version(CONTENT_NAMESPACE),
+        'featured_projects': SimpleLazyObject(get_featured_projects),
+        'testimonials': SimpleLazyObject(get_testimonials),
+    })
+
+def get_testimonials():
+    testimonials = list(Testimonial.objects.all())
+    testimonial_renditions = renditions_for([testimonial.image.name for testimonial in testimonials])
+    for testimonial in testimonials:
+        testimonial.image_renditions = testimonial_renditions.get(testimonial.image.name, {})
+    return testimonials
+
+def get_featured_projects():
+    """
+    The 4 most recent projects, sliced from the same cached page as the
+    portfolio, merged with their cached modal details
+    """
+    cards = get_portfolio_projects()[:4]
+    details = get_project_details([card['id'] for card in cards])
+    return [{**card, **details[card['id']]} for card in cards if card['id'] in details]
 
 def get_portfolio_projects():
-    """Returns list of portfolio projects - used by both home and portfolio views"""
-    projects = Project.objects.all().order_by('-completion_date')
+    """Returns the first page of portfolio project cards - used by both home and portfolio views"""
+    return get_portfolio_page()['results']
+
+def get_portfolio_page(tech='', category='', cursor=None, limit=PORTFOLIO_PAGE_SIZE):
+    """
+    One keyset page of project cards, optionally narrowed to a technology
+    slug and/or category: ``{'results': [...], 'next_cursor': ...}``.
+
+    First pages are cached under the portfolio version, which is bumped by
+    the Project/TeamMember signals in core.signals. Later pages are cheap
+    index range scans and aren't cached. Raises InvalidCursor.
+    """
+    build = lambda: _build_portfolio_page(tech, category, cursor, limit)
+    if cursor or limit != PORTFOLIO_PAGE_SIZE:
+        return build()
+    name = f'projects:{tech}:{slugify(category)}' if tech or category else 'projects'
+    return get_or_build(PORTFOLIO_NAMESPACE, name, build)
+
+def _build_portfolio_page(tech, category, cursor, limit):
+    projects = Project.objects.only(*PROJECT_CARD_FIELDS)
+    if tech:
+        projects = projects.filter(technology_links__technology__slug=tech)
+    if category:
+        projects = projects.filter(category=category)
+    page, next_cursor = keyset_page(projects, PORTFOLIO_ORDERING, cursor, limit)
+    return {'results': _serialize_project_cards(page), 'next_cursor': next_cursor}
+
+def _serialize_project_cards(projects):
+    """Card data: title, category and a thumbnail, the modal details are fetched separately"""
+    projects = list(projects)
+    renditions = renditions_for([name for project in projects for name in (project.image.name, project.fallback_image.name)])
     project_list = []
     for project in projects:
-        # Get main image URL (full-size for modal)
-        main_image_url = project.image.url if project.image else 'https://via.placeholder.com/1200x800/7f8c8d/ffffff?text=Project+Image'
-        # Get fallback image URL (for card preview)
-        fallback_image_url = project.fallback_image.url if project.fallback_image else 'https://via.placeholder.com/400x300/7f8c8d/ffffff?text=Project+Placeholder'
-        
+        # The card preview image if there is one, otherwise the main image
+        if project.fallback_image:
+            thumbnail = rendition_src(renditions.get(project.fallback_image.name), 400) or project.fallback_image.url
+        elif project.image:
+            thumbnail = rendition_src(renditions.get(project.image.name), 800) or project.image.url
+        else:
+            thumbnail = 'https://via.placeholder.com/400x300/7f8c8d/ffffff?text=Project+Placeholder'
         project_list.append({
+            'id': project.id,
+            'title': project.title,
+            'category': project.category,
+            'thumbnail': thumbnail,
+        })
+    return project_list
+
+def get_project_details(pks):
+    """
+    ``{pk: details}`` for the project modal, cached per project and dropped by
+    the Project signals in core.signals. Unknown pks are left out.
+    """
+    return get_or_build_many(PROJECT_DETAIL_KEY, pks, _build_project_details)
+
+def _build_project_details(pks):
+    projects = list(Project.objects.only(*PROJECT_DETAIL_FIELDS).filter(pk__in=pks))
+    renditions = renditions_for([project.image.name for project in projects])
+    related = _related_project_cards(pks)
+    return {
+        project.id: {
+            'id': project.id,
             'title': project.title,
             'description': project.description,
-            'image': main_image_url,
-            'fallback_image': fallback_image_url,
-            'external_image': project.external_image,
+            'image': project.image.url if project.image else PROJECT_IMAGE_PLACEHOLDER,
+            'image_renditions': renditions.get(project.image.name, {}),
             'category': project.category,
             'client': project.client,
             'completion_date': project.completion_date,
             'technologies': project.technologies,
-            'website': project.website
-        })
-    return project_list
+            'website': project.website,
+            'related': related.get(project.id, []),
+        }
+        for project in projects
+    }
+
+def _related_project_cards(pks):
+    """{pk: cards of its precomputed related projects (core.related), best first}"""
+    links = list(RelatedProject.objects.filter(project__in=pks).select_related('related').only(
+        'project', 'rank', *(f'related__{name}' for name in PROJECT_CARD_FIELDS)).order_by('project', 'rank'))
+    related = {}
+    for link, card in zip(links, _serialize_project_cards(link.related for link in links)):
+        related.setdefault(link.project_id, []).append(card)
+    return related
 
 @login_required(login_url='/accounts/login/')
+@content_conditional
+@read_from_replica
 def about(request):
-    db_team_members = TeamMember.objects.all()
-    team_members = []
-    for member in db_team_members:
-        team_members.append({
-            'name': member.name,
-            'role': member.role,
-            'bio': member.bio,
-            'image': member.image.url if member.image else '',
-            'education': member.education.split('\n') if member.education else [],
-            'experience': member.experience.split('\n') if member.experience else [],
-            'skills': [skill.strip() for skill in member.skills.split(',')] if member.skills else []
-        })
-    return render(request, 'core/about.html', {'section': 'about', 'team_members': team_members})
+    return render(request, 'core/about.html', {
+        'section': 'about',
+        'content_version': get_version(CONTENT_NAMESPACE),
+        'team_members': SimpleLazyObject(_about_team_members),
+    })
+
+def _about_team_members():
+    return [serialize_team_member(member) for member in TeamMember.objects.only(*TEAM_MEMBER_PROFILE_FIELDS)]
 
 @login_required(login_url='/accounts/login/')
 def services(request):
@@ -95,11 +214,86 @@ def get_fallback_image(project_title):
         return 'https://via.placeholder.com/800x500/7f8c8d/ffffff?text=Project+Placeholder'
 
 @login_required(login_url='/accounts/login/')
+@content_conditional
+@read_from_replica
 def portfolio(request):
-    projects = get_portfolio_projects()
-    
-    # Get team members data for the portfolio page
-    db_team_members = TeamMember.objects.all()
+    """First page of project cards, optionally filtered by ``?category=``/``?tech=``.
+
+    Further pages come from portfolio_filter as the visitor scrolls; without
+    JavaScript the "More projects" link loads them as regular pages.
+    """
+    form = PortfolioFilterForm(request.GET)
+    if not form.is_valid():
+        return redirect(request.path)
+    filters = form.cleaned_data
+    tech = technology_slug(filters['tech'])
+    try:
+        page = get_portfolio_page(tech, filters['category'], filters['cursor'])
+    except InvalidCursor:
+        return redirect(request.path)
+
+    params = {name: value for name, value in (('tech', tech), ('category', filters['category'])) if value}
+    return render(request, 'core/portfolio.html', {
+        'section': 'portfolio',
+        'content_version': get_version(CONTENT_NAMESPACE),
+        'projects': page['results'],
+        'next_cursor': page['next_cursor'],
+        'next_query': urlencode({**params, 'cursor': page['next_cursor']}) if page['next_cursor'] else None,
+        'filter_query': urlencode(params),
+        'active_category': filters['category'],
+        'active_tech': tech,
+        'categories': Project.CATEGORY_CHOICES,
+        'team_members': SimpleLazyObject(_portfolio_team_members),
+    })
+
+@login_required(login_url='/accounts/login/')
+@read_from_replica
+def portfolio_filter(request):
+    """One page of portfolio projects matching ``?tech=`` and/or ``?category=``, as JSON.
+
+    Serves the portfolio's infinite scroll (``?cursor=`` from the previous
+    page's ``next_cursor``) and its category/technology slices. Filtering
+    goes through the normalised technology index and the response carries
+    the precomputed facet counts (core.technologies). ``html`` holds the
+    rendered cards for appending to the page.
+    """
+    form = PortfolioFilterForm(request.GET)
+    if not form.is_valid():
+        return JsonResponse({'success': False, 'errors': form.errors}, status=400)
+    filters = form.cleaned_data
+    try:
+        page = get_portfolio_page(technology_slug(filters['tech']), filters['category'], filters['cursor'],
+                                  filters['limit'] or PORTFOLIO_PAGE_SIZE)
+    except InvalidCursor:
+        return JsonResponse({'success': False, 'message': 'Invalid cursor.'}, status=400)
+    return JsonResponse({
+        'success': True,
+        'results': page['results'],
+        'next_cursor': page['next_cursor'],
+        'facets': get_or_build(PORTFOLIO_NAMESPACE, 'facets', facet_counts),
+        'html': {
+            'cards': render_to_string('includes/project_cards.html', {'projects': page['results']}, request),
+        },
+    })
+
+@login_required(login_url='/accounts/login/')
+@content_conditional
+@read_from_replica
+def portfolio_project(request, project_id):
+    """Modal details of one project as JSON, fetched when its card is opened"""
+    project = get_project_details([project_id]).get(project_id)
+    if project is None:
+        return JsonResponse({'success': False, 'message': 'Project not found.'}, status=404)
+    return JsonResponse({
+        'success': True,
+        'project': project,
+        'html': render_to_string('includes/project_modal.html', {'project': project}, request),
+    })
+
+def _portfolio_team_members():
+    """Team members data for the portfolio page"""
+    db_team_members = list(TeamMember.objects.all())
+    member_renditions = renditions_for([member.image.name for member in db_team_members])
     team_members = []
     for member in db_team_members:
         # Use member image if available, otherwise use default
@@ -111,13 +305,9 @@ def portfolio(request):
             'role': member.role,
             'bio': member.bio,
             'image': member_image,
+            'image_renditions': member_renditions.get(member.image.name, {}),
         })
-    
-    return render(request, 'core/portfolio.html', {
-        'section': 'portfolio', 
-        'projects': projects,
-        'team_members': team_members
-    })
+    return team_members
 
 @login_required(login_url='/accounts/login/')
 def contact(request):
@@ -148,8 +338,8 @@ def contact(request):
                 except TeamMember.DoesNotExist:
                     pass
             
-            # Send email notification
-            send_mail(
+            # Queue email notification (delivered by the send_queued_mail worker)
+            enqueue_mail(
                 f'New Contact Form Submission: {contact_message.subject}',
                 f'Name: {contact_message.name}\n'
                 f'Email: {contact_message.email}\n'
@@ -159,7 +349,6 @@ def contact(request):
                 f'Message: {contact_message.message}',
                 settings.DEFAULT_FROM_EMAIL,
                 [recipient_email],
-                fail_silently=False,
             )
             
             messages.success(request, 'Your message has been sent successfully!')
@@ -183,7 +372,11 @@ def contact(request):
 @csrf_exempt
 @require_POST
 def schedule_meeting(request):
-    """AJAX view to handle meeting scheduling - allows unauthenticated users to request meetings"""
+    """AJAX view to handle meeting scheduling - allows unauthenticated users to request meetings.
+
+    The meeting is saved as pending and the Google Calendar/Meet creation is
+    left to the process_calendar_jobs worker; clients poll meeting_status.
+    """
     logger = logging.getLogger(__name__)
     try:
         data = json.loads(request.body)
@@ -197,127 +390,18 @@ def schedule_meeting(request):
                 'errors': form.errors
             })
 
-        if form.is_valid():
-            # Save the meeting to the database
-            meeting = form.save(commit=False)
-            
-            # Generate Google Meet URL
-            from .meeting_utils import generate_google_meet_url
-            meet_result = generate_google_meet_url(
-                meeting_title=meeting.topic,
-                meeting_date=meeting.date,
-                meeting_time=meeting.time,
-                meeting_email=meeting.email,
-                meeting_notes=meeting.notes
-            )
-            
-            # Store the Google Calendar event link
-            if meet_result.get('success') or meet_result.get('url'):
-                meeting.google_meet_url = meet_result.get('url')
-                logger.info(f"Google Calendar event created: {meet_result.get('event_id')}")
-                logger.info(f"Event link: {meet_result.get('url')}")
-            else:
-                logger.warning(f"Failed to create calendar event: {meet_result.get('error')}")
-            
-            # Now save the meeting with the URL
-            meeting.save()
-            logger.info(f"Meeting saved to database with ID: {meeting.id}")
-
-            # Email to the user (meeting requester)
-            user_email_body = f"""
-Hello {meeting.name},
-
-Thank you for requesting a meeting with us! We've received your meeting request and will get back to you shortly.
-
-Meeting Details:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Topic: {meeting.topic}
-Requested Date: {meeting.date.strftime('%A, %B %d, %Y')}
-Requested Time: {meeting.time.strftime('%I:%M %p')} IST
-Your Email: {meeting.email}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Event Link: {meeting.google_meet_url if meeting.google_meet_url else 'Will be sent after confirmation'}
-
-Additional Notes: {meeting.notes if meeting.notes else 'None provided'}
-
-You will receive a calendar invitation with the Google Meet link shortly. 
-You can also use the link above to access the meeting details in Google Calendar.
-
-Best regards,
-Serendipity Team
-            """
-
-            # Email to admins
-            admin_email_body = f"""
-New Meeting Request Received!
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Requester Name: {meeting.name}
-Requester Email: {meeting.email}
-Meeting Topic: {meeting.topic}
-Requested Date: {meeting.date.strftime('%A, %B %d, %Y')}
-Requested Time: {meeting.time.strftime('%I:%M %p')} IST
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Calendar Event Link: {meeting.google_meet_url if meeting.google_meet_url else 'Creating event...'}
-
-Additional Notes:
-{meeting.notes if meeting.notes else 'None provided'}
-
-The calendar event has been automatically created and is in your Google Calendar.
-You can access it via the link above to add a Google Meet call or reschedule if needed.
-
-Action Required:
-1. Review the meeting request
-2. Accept/Confirm the calendar invitation in your Google Calendar
-3. Optional: Add Google Meet conference to the event if not already present
-4. Send confirmation to {meeting.email}
-
-You can manage this request in the admin panel.
-            """
-
-            # Send confirmation email to user
-            try:
-                send_mail(
-                    f'Meeting Request Received: {meeting.topic}',
-                    user_email_body,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [meeting.email],
-                    fail_silently=False,
-                )
-                logger.info(f"User confirmation email sent to {meeting.email}")
-            except Exception as email_error:
-                logger.warning(f"Failed to send user confirmation email: {str(email_error)}")
-
-            # Send notification email to all admin/superusers
-            try:
-                from django.contrib.auth.models import User
-                admin_emails = User.objects.filter(is_superuser=True).values_list('email', flat=True)
-                
-                if admin_emails:
-                    send_mail(
-                        f'New Meeting Request: {meeting.topic}',
-                        admin_email_body,
-                        settings.DEFAULT_FROM_EMAIL,
-                        list(admin_emails),
-                        fail_silently=False,
-                    )
-                    logger.info(f"Admin notification emails sent to {len(admin_emails)} admin(s)")
-            except Exception as email_error:
-                logger.warning(f"Failed to send admin notification emails: {str(email_error)}")
+        with transaction.atomic():
+            meeting = form.save()
+            enqueue_calendar_job(meeting)
+        logger.info(f"Meeting saved to database with ID: {meeting.id}, calendar job queued")
 
-            return JsonResponse({
-                'success': True,
-                'message': 'Meeting request submitted successfully! We\'ll send you a confirmation email with the Google Meet link shortly.',
-                'meeting_id': meeting.id,
-                'meet_url': meeting.google_meet_url,
-            })
-        else:
-            return JsonResponse({
-                'success': False,
-                'errors': form.errors
-            })
+        return JsonResponse({
+            'success': True,
+            'message': 'Meeting request submitted successfully! We\'ll send you a confirmation email with the Google Meet link shortly.',
+            'meeting_id': meeting.id,
+            'status': meeting.status,
+            'status_url': reverse('meeting_status', args=[signing.dumps(meeting.id, salt=MEETING_STATUS_SALT)]),
+        })
 
     except json.JSONDecodeError as e:
         return JsonResponse({
@@ -332,11 +416,116 @@ You can manage this request in the admin panel.
             'message': 'An error occurred while scheduling the meeting. Please try again.'
         })
 
+def meeting_status(request, token):
+    """Lightweight polling endpoint for the state of a scheduled meeting.
+
+    The token is the signed meeting id returned by schedule_meeting, so
+    meeting ids can't be enumerated to read other people's Meet links.
+    """
+    try:
+        meeting_id = signing.loads(token, salt=MEETING_STATUS_SALT)
+    except signing.BadSignature:
+        return JsonResponse({'success': False, 'message': 'Invalid status token.'}, status=404)
+
+    meeting = Meeting.objects.filter(pk=meeting_id).only('status', 'google_meet_url').first()
+    if meeting is None:
+        return JsonResponse({'success': False, 'message': 'Meeting not found.'}, status=404)
+
+    job = meeting.calendar_jobs.order_by('-created_at').only('status').first()
+    return JsonResponse({
+        'success': True,
+        'meeting_id': meeting.id,
+        'status': meeting.status,
+        'calendar_status': job.status if job else None,
+        'meet_url': meeting.google_meet_url,
+    })
+
+def metrics(request):
+    """Per-stage latency histograms in Prometheus text format.
+
+    Only available when METRICS_ENABLED is set; readable by staff users or
+    scrapers presenting METRICS_TOKEN as a bearer token.
+    """
+    if not metrics_enabled():
+        raise Http404
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    authorized = request.user.is_authenticated and request.user.is_staff
+    if token and request.headers.get('Authorization') == f'Bearer {token}':
+        authorized = True
+    if not authorized:
+        return HttpResponse(status=403)
+    return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 @staff_member_required
 def meetings(request):
-    """Admin view to display all scheduled meetings"""
-    meetings_list = Meeting.objects.all().order_by('-created_at')
-    return render(request, 'core/meetings.html', {'meetings': meetings_list})
+    """Admin view of scheduled meetings, one keyset page at a time.
+
+    ``?format=json`` returns the same page as data for the dashboard's
+    "load more" button; ``next_cursor`` is null on the last page.
+    """
+    wants_json = request.GET.get('format') == 'json'
+    form = MeetingFilterForm(request.GET)
+    if not form.is_valid():
+        if wants_json:
+            return JsonResponse({'success': False, 'errors': form.errors}, status=400)
+        return render(request, 'core/meetings.html', {'form': form, 'meetings': []}, status=400)
+
+    filters = form.cleaned_data
+    # Only the columns the list shows; notes are cut down in the database
+    queryset = Meeting.objects.only(*MEETING_LIST_FIELDS).annotate(
+        notes_excerpt=Left('notes', NOTES_EXCERPT_LENGTH + 1))
+    if filters['status']:
+        queryset = queryset.filter(status=filters['status'])
+    if filters['date_from']:
+        queryset = queryset.filter(date__gte=filters['date_from'])
+    if filters['date_to']:
+        queryset = queryset.filter(date__lte=filters['date_to'])
+
+    try:
+        page, next_cursor = keyset_page(queryset, MEETINGS_ORDERING, filters['cursor'],
+                                        filters['limit'] or MEETINGS_PAGE_SIZE)
+    except InvalidCursor:
+        if wants_json:
+            return JsonResponse({'success': False, 'message': 'Invalid cursor.'}, status=400)
+        return redirect(request.path)
+
+    if wants_json:
+        return JsonResponse({
+            'success': True,
+            'results': [_meeting_summary(meeting) for meeting in page],
+            'next_cursor': next_cursor,
+        })
+
+    next_query = None
+    if next_cursor:
+        params = request.GET.copy()
+        params['cursor'] = next_cursor
+        next_query = params.urlencode()
+    return render(request, 'core/meetings.html', {
+        'form': form,
+        'meetings': page,
+        'next_cursor': next_cursor,
+        'next_query': next_query,
+        'notes_excerpt_length': NOTES_EXCERPT_LENGTH,
+    })
+
+def _meeting_summary(meeting):
+    notes = meeting.notes_excerpt
+    if len(notes) > NOTES_EXCERPT_LENGTH:
+        notes = notes[:NOTES_EXCERPT_LENGTH - 1] + '…'
+    return {
+        'id': meeting.id,
+        'name': meeting.name,
+        'email': meeting.email,
+        'topic': meeting.topic,
+        'date': meeting.date.isoformat(),
+        'time': meeting.time.strftime('%H:%M'),
+        'status': meeting.status,
+        'status_display': meeting.get_status_display(),
+        'meet_url': meeting.google_meet_url,
+        'notes_excerpt': notes,
+        'created_at': meeting.created_at.isoformat(),
+    }
 
 @staff_member_required
 def edit_profile(request):
@@ -1,65 +1,145 @@
 from django.shortcuts import render, redirect
+from django.http import Http404
 from django.contrib import messages
-from django.core.mail import send_mail
 from django.conf import settings
 from django.urls import reverse
-from .models import TeamMember, Project
+from django.db import DatabaseError
+from django.utils.text import slugify
+from .models import RelatedProject, TeamMember, Project
 from .forms import ContactForm
+from .caching import TEAM_NAMESPACE, get_version
+from .conditional import content_conditional
+from .db_routing import read_from_replica
+from .mail_queue import enqueue_mail
+from .renditions import renditions_for
+
+# In-process (version, {slug: pk}) map used to resolve portfolio URLs without
+# querying the database. Rebuilt when core.signals bumps the team version.
+_member_slug_index = (None, {})
+
+def _slug_key(slug):
+    """Index key for a slug; stored slugs and URL segments both go through it, so matching ignores case"""
+    return slug.lower()
+
+def get_member_slug_index():
+    """Returns a dict mapping normalised member URL slugs (see _slug_key) to primary keys"""
+    global _member_slug_index
+    version = get_version(TEAM_NAMESPACE)
+    cached_version, index = _member_slug_index
+    if cached_version != version:
+        index = {}
+        members = TeamMember.objects.values_list('pk', 'name', 'slug')
+        for pk, name, slug in members:
+            if slug:
+                index[_slug_key(slug)] = pk
+        # Older links were built from the member name, keep resolving them
+        for pk, name, slug in members:
+            index.setdefault(_slug_key(slugify(name)), pk)
+        _member_slug_index = (version, index)
+    return index
+
+# Projects by other people shown under "Related Work" on a member's portfolio
+RELATED_WORK_LIMIT = 6
+
+# Columns serialize_team_member reads; the raw education/experience/skills
+# text is only needed by the edit forms
+TEAM_MEMBER_PROFILE_FIELDS = (
+    'pk', 'name', 'slug', 'email', 'role', 'bio', 'location', 'phone', 'image',
+    'education_items', 'experience_items', 'skill_items',
+)
+
+def serialize_team_member(member, default_image=''):
+    """Template data shared by the about, team and member portfolio pages"""
+    return {
+        'name': member.name,
+        'slug': member.slug,
+        'email': member.email,
+        'role': member.role,
+        'bio': member.bio,
+        'location': member.location,
+        'phone': member.phone,
+        'image': member.image.url if member.image else default_image,
+        'education': member.education_items,
+        'experience': member.experience_items,
+        'skills': member.skill_items,
+    }
+
+def get_related_work(member_pk, limit=RELATED_WORK_LIMIT):
+    """
+    Other people's projects most similar to the member's own, from the
+    precomputed neighbours in core.related: the best score per project wins.
+    """
+    links = RelatedProject.objects.filter(project__team_member=member_pk).exclude(
+        related__team_member=member_pk).select_related('related__team_member').only(
+        'score', 'related__title', 'related__category', 'related__team_member__name',
+        'related__team_member__slug').order_by('-score', 'rank')
+    related_work = {}
+    for link in links:
+        project = link.related
+        if project.pk not in related_work:
+            member = project.team_member
+            related_work[project.pk] = {
+                'title': project.title,
+                'category': project.get_category_display(),
+                'member_name': member.name if member else '',
+                'member_slug': member.slug if member else '',
+            }
+            if len(related_work) >= limit:
+                break
+    return list(related_work.values())
 
 def get_team_members():
     """Returns list of all team members with their details"""
-    # Use hardcoded data for now to ensure team page displays content
-    team_members = [
-    ]
+    # Use hardcoded data for now to ensure team page displays content.
+    # Keyed by name so database members can be merged in without a linear scan.
+    team_members = {
+    }
 
     # Try to get additional team members from database if they exist
     try:
-        db_members = TeamMember.objects.all()
+        # Projects are prefetched in one query instead of one query per member
+        db_members = TeamMember.objects.only(*TEAM_MEMBER_PROFILE_FIELDS).prefetch_related('projects')
         for member in db_members:
             # Skip if already in hardcoded list
-            if not any(m['name'] == member.name for m in team_members):
-                member_dict = {
-                    'name': member.name,
-                    'email': member.email,
-                    'role': member.role,
-                    'bio': member.bio,
-                    'image': member.image.url if member.image else 'images/profile.jpg',
-                    'education': member.education.split('\n') if member.education else [],
-                    'experience': member.experience.split('\n') if member.experience else [],
-                    'skills': member.skills.split(',') if member.skills else [],
-                    'projects': Project.objects.filter(team_member=member),
+            if member.name not in team_members:
+                team_members[member.name] = {
+                    **serialize_team_member(member, default_image='images/profile.jpg'),
+                    'projects': list(member.projects.all()),
                     'department': 'web'
                 }
-                team_members.append(member_dict)
-    except:
+    except DatabaseError:
         # If database query fails, just use hardcoded data
         pass
 
-    return team_members
+    return list(team_members.values())
+
+@content_conditional
+@read_from_replica
 def team(request):
     """Display all team members"""
     team_members = get_team_members()
     return render(request, 'core/team.html', {'section': 'team', 'team_members': team_members})
 
-def team_member_portfolio(request, member_name):
+@content_conditional
+def team_member_portfolio(request, member_name, redirect_unknown=True):
     """Display individual team member portfolio"""
+    # Resolve the slug in memory first so unknown paths never reach the database
+    member_pk = get_member_slug_index().get(_slug_key(member_name))
+    if member_pk is None:
+        if not redirect_unknown:
+            raise Http404('No team member matches this URL')
+        return redirect('team')
+
     try:
-        # Get the team member directly from the database
-        member = TeamMember.objects.get(name__iexact=member_name.replace('-', ' '))
+        member = TeamMember.objects.only(*TEAM_MEMBER_PROFILE_FIELDS, 'admin_email').get(pk=member_pk)
     except TeamMember.DoesNotExist:
         return redirect('team')
     
     # Get the projects and process their technologies
-    projects = Project.objects.filter(team_member=member)
+    projects = list(Project.objects.filter(team_member=member).order_by('-completed_on'))
+    renditions = renditions_for([member.image.name] + [project.image.name for project in projects])
     processed_projects = []
     for project in projects:
-        # Handle technologies field - it could be JSON list or comma-separated string
-        technologies = project.technologies
-        if isinstance(technologies, str):
-            technologies = [tech.strip() for tech in technologies.split(',') if tech.strip()]
-        elif not isinstance(technologies, list):
-            technologies = []
-
         # Get proper image URLs
         main_image_url = project.image.url if project.image else ''
         fallback_image_url = project.fallback_image.url if project.fallback_image else ''
@@ -70,33 +150,25 @@ def team_member_portfolio(request, member_name):
             'image': main_image_url,
             'fallback_image': fallback_image_url,
             'image_obj': project.image,
+            'image_renditions': renditions.get(project.image.name, {}),
             'category': project.category,
             'get_category_display': project.get_category_display(),
             'client': project.client,
             'completion_date': project.completion_date,
+            'completed_on': project.completed_on,
             'website': project.website,
-            'technologies': technologies
+            # Normalised to a list by Project.save()
+            'technologies': project.technologies
         }
         processed_projects.append(project_data)
     
-    # Prepare member data - ensure image URL is properly set
-    member_image_url = member.image.url if member.image else ''
-    
     member_data = {
-        'name': member.name,
-        'slug': member.slug,
-        'email': member.email,
+        **serialize_team_member(member),
         'admin_email': member.admin_email,
-        'role': member.role,
-        'bio': member.bio,
-        'image': member_image_url,
         'image_obj': member.image,
-        'location': member.location,
-        'phone': member.phone,
-        'education': member.education.split('\n') if member.education else [],
-        'experience': member.experience.split('\n') if member.experience else [],
-        'skills': [skill.strip() for skill in member.skills.split(',') if skill.strip()],
+        'image_renditions': renditions.get(member.image.name, {}),
         'projects': processed_projects,
+        'related_work': get_related_work(member.pk),
         'testimonials': [
             {
                 'text': 'Exceptional work! Their expertise and dedication made our project a huge success.',
@@ -167,10 +239,8 @@ Message:
 ---
 This message was sent via your portfolio contact form."""
             
-            try:
-                send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, [recipient_email])
-            except Exception as e:
-                print(f"Error sending email: {e}")
+            # Delivered by the send_queued_mail worker
+            enqueue_mail(subject, message, settings.DEFAULT_FROM_EMAIL, [recipient_email])
             
             messages.success(request, f'Your message has been sent to {member.name} successfully!')
             return redirect('developer_contact', member_slug=member_slug)
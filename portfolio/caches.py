@@ -0,0 +1,69 @@
+"""
+Build the CACHES setting for a selectable backend.
+
+Four aliases share one backend:
+
+* ``default``  – short-lived general purpose entries
+* ``content``  – versioned page data and template fragments (core.caching);
+  entries are invalidated by version bumps, so they can live long
+* ``sessions`` – session data (SESSION_CACHE_ALIAS)
+* ``metrics``  – stage latency counters written by the web and worker
+  processes (core.instrumentation); never expire
+
+Backends: ``redis`` (shared by every worker and host, key-prefixed per
+alias), ``file`` (shared by the workers of one host; increments are not
+atomic, so concurrent metric counts can be lost) and ``locmem``
+(per process; for development and tests).
+"""
+from pathlib import Path
+
+BACKENDS = {
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+}
+
+ALIASES = {
+    # alias: (default timeout in seconds, max entries for file/locmem)
+    'default': (300, 1000),
+    'content': (60 * 60 * 24, 10000),
+    'sessions': (60 * 60 * 24 * 14, 10000),
+    'metrics': (None, 1000),
+}
+
+
+def build_caches(backend, redis_url='', cache_dir=None, key_prefix='portfolio', redis_options=None,
+                 session_timeout=None):
+    try:
+        engine = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f'Unknown cache backend {backend!r}; expected one of {", ".join(BACKENDS)}') from None
+
+    caches = {}
+    for alias, (timeout, max_entries) in ALIASES.items():
+        if alias == 'sessions' and session_timeout:
+            timeout = session_timeout
+        config = {'BACKEND': engine, 'TIMEOUT': timeout, 'KEY_PREFIX': f'{key_prefix}:{alias}'}
+        if backend == 'redis':
+            config['LOCATION'] = redis_url
+            if redis_options:
+                config['OPTIONS'] = dict(redis_options)
+        elif backend == 'file':
+            config['LOCATION'] = str(Path(cache_dir) / alias)
+            config['OPTIONS'] = {'MAX_ENTRIES': max_entries}
+        else:
+            config['LOCATION'] = alias
+            config['OPTIONS'] = {'MAX_ENTRIES': max_entries}
+        caches[alias] = config
+    return caches
+
+
+def session_engine(backend):
+    """
+    Pure cache sessions need a cache every worker shares and that doesn't
+    cull entries under pressure, i.e. Redis. Elsewhere sessions are written
+    through to the database but still read from the cache.
+    """
+    if backend == 'redis':
+        return 'django.contrib.sessions.backends.cache'
+    return 'django.contrib.sessions.backends.cached_db'
@@ -0,0 +1,83 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const particleBackground = document.getElementById('particle-background');
+    const shapes = document.querySelectorAll('.shape');
+
+    // Create particles
+    function createParticles() {
+        for (let i = 0; i < 50; i++) {
+            const particle = document.createElement('div');
+            particle.className = 'particle';
+            particle.style.left = Math.random() * 100 + '%';
+            particle.style.top = Math.random() * 100 + '%';
+            particle.style.width = Math.random() * 10 + 5 + 'px';
+            particle.style.height = particle.style.width;
+            particle.style.animationDelay = Math.random() * 20 + 's';
+            particleBackground.appendChild(particle);
+        }
+    }
+
+    createParticles();
+
+    // Mouse interaction
+    let mouseX = 0;
+    let mouseY = 0;
+
+    document.addEventListener('mousemove', function(e) {
+        mouseX = e.clientX;
+        mouseY = e.clientY;
+
+        // Move shapes based on mouse position
+        shapes.forEach((shape, index) => {
+            const rect = shape.getBoundingClientRect();
+            const centerX = rect.left + rect.width / 2;
+            const centerY = rect.top + rect.height / 2;
+            const deltaX = (mouseX - centerX) / 50;
+            const deltaY = (mouseY - centerY) / 50;
+
+            shape.style.transform = `translate(${deltaX}px, ${deltaY}px) rotate(${deltaX + deltaY}deg)`;
+        });
+
+        // Move particles towards mouse
+        const particles = document.querySelectorAll('.particle');
+        particles.forEach(particle => {
+            const rect = particle.getBoundingClientRect();
+            const centerX = rect.left + rect.width / 2;
+            const centerY = rect.top + rect.height / 2;
+            const deltaX = (mouseX - centerX) / 100;
+            const deltaY = (mouseY - centerY) / 100;
+
+            particle.style.transform = `translate(${deltaX}px, ${deltaY}px)`;
+        });
+    });
+
+    // Keyboard navigation
+    document.addEventListener('keydown', function(e) {
+        const form = document.querySelector('.login-form');
+        const inputs = form.querySelectorAll('input[type="text"], input[type="password"], input[type="submit"]');
+
+        if (e.key === 'Tab') {
+            // Focus management
+            const focusedElement = document.activeElement;
+            const currentIndex = Array.from(inputs).indexOf(focusedElement);
+
+            if (e.shiftKey) {
+                // Shift+Tab: move to previous
+                const prevIndex = currentIndex > 0 ? currentIndex - 1 : inputs.length - 1;
+                inputs[prevIndex].focus();
+            } else {
+                // Tab: move to next
+                const nextIndex = currentIndex < inputs.length - 1 ? currentIndex + 1 : 0;
+                inputs[nextIndex].focus();
+            }
+            e.preventDefault();
+        }
+    });
+
+    // Loading animation
+    const loadingOverlay = document.querySelector('.loading-overlay');
+    if (loadingOverlay) {
+        setTimeout(() => {
+            loadingOverlay.classList.add('hidden');
+        }, 1000);
+    }
+});
@@ -0,0 +1,8 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Handle image fallbacks
+    document.querySelectorAll('img[data-fallback]').forEach(img => {
+        img.addEventListener('error', function() {
+            this.src = this.getAttribute('data-fallback');
+        });
+    });
+});
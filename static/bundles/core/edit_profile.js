@@ -0,0 +1,12 @@
+// Add some interactivity to the form
+document.addEventListener('DOMContentLoaded', function() {
+    const form = document.querySelector('form');
+    const inputs = form.querySelectorAll('input, textarea');
+    
+    inputs.forEach(input => {
+        input.addEventListener('change', function() {
+            // Visual feedback when form changes
+            form.style.opacity = '0.9';
+        });
+    });
+});
@@ -0,0 +1,297 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Initialize particles.js
+    particlesJS('particles-js', {
+        particles: {
+            number: {
+                value: 80,
+                density: {
+                    enable: true,
+                    value_area: 800
+                }
+            },
+            color: {
+                value: "#ffffff"
+            },
+            shape: {
+                type: "circle",
+                stroke: {
+                    width: 0,
+                    color: "#000000"
+                }
+            },
+            opacity: {
+                value: 0.5,
+                random: true,
+                anim: {
+                    enable: true,
+                    speed: 1,
+                    opacity_min: 0.1,
+                    sync: false
+                }
+            },
+            size: {
+                value: 3,
+                random: true,
+                anim: {
+                    enable: true,
+                    speed: 2,
+                    size_min: 0.1,
+                    sync: false
+                }
+            },
+            line_linked: {
+                enable: true,
+                distance: 150,
+                color: "#ffffff",
+                opacity: 0.4,
+                width: 1
+            },
+            move: {
+                enable: true,
+                speed: 1,
+                direction: "none",
+                random: true,
+                straight: false,
+                out_mode: "out",
+                bounce: false,
+                attract: {
+                    enable: false,
+                    rotateX: 600,
+                    rotateY: 1200
+                }
+            }
+        },
+        interactivity: {
+            detect_on: "canvas",
+            events: {
+                onhover: {
+                    enable: true,
+                    mode: "grab"
+                },
+                onclick: {
+                    enable: true,
+                    mode: "push"
+                },
+                resize: true
+            },
+            modes: {
+                grab: {
+                    distance: 140,
+                    line_linked: {
+                        opacity: 1
+                    }
+                },
+                push: {
+                    particles_nb: 4
+                }
+            }
+        },
+        retina_detect: true
+    });
+
+    // Project Modal for featured projects
+    const modalTriggers = document.querySelectorAll('.project-modal-trigger');
+    const modalCloses = document.querySelectorAll('.modal-close');
+    
+    modalTriggers.forEach(trigger => {
+        trigger.addEventListener('click', function(e) {
+            e.preventDefault();
+            const modalId = this.getAttribute('href');
+            const modal = document.querySelector(modalId);
+            modal.style.display = 'block';
+            document.body.classList.add('modal-open');
+            setTimeout(() => {
+                modal.classList.add('active');
+            }, 10);
+        });
+    });
+    
+    modalCloses.forEach(close => {
+        close.addEventListener('click', function() {
+            const modal = this.closest('.project-modal');
+            modal.classList.remove('active');
+            setTimeout(() => {
+                modal.style.display = 'none';
+                document.body.classList.remove('modal-open');
+            }, 400);
+        });
+    });
+    
+    // Close modal when clicking outside
+    window.addEventListener('click', function(e) {
+        if (e.target.classList.contains('project-modal')) {
+            e.target.classList.remove('active');
+            setTimeout(() => {
+                e.target.style.display = 'none';
+                document.body.classList.remove('modal-open');
+            }, 400);
+        }
+    });
+
+    // Stats counter animation
+    const statNumbers = document.querySelectorAll('.stat-number');
+    const statsSection = document.querySelector('.stats-section');
+
+    function animateStats() {
+        const sectionPos = statsSection.getBoundingClientRect().top;
+        const screenPos = window.innerHeight / 1.3;
+
+        if (sectionPos < screenPos) {
+            statNumbers.forEach(stat => {
+                const target = parseInt(stat.getAttribute('data-count'));
+                let count = 0;
+                const duration = 2000;
+                const increment = target / (duration / 20);
+
+                const timer = setInterval(() => {
+                    count += increment;
+                    if (count >= target) {
+                        stat.textContent = target;
+                        clearInterval(timer);
+                    } else {
+                        stat.textContent = Math.floor(count);
+                    }
+                }, 20);
+            });
+
+            window.removeEventListener('scroll', animateStats);
+        }
+    }
+
+    window.addEventListener('scroll', animateStats);
+
+    // Testimonial Slider
+    const testimonialSlides = document.querySelector('.testimonial-slides');
+    const testimonialSlide = document.querySelectorAll('.testimonial-slide');
+    const prevBtn = document.getElementById('prev-testimonial');
+    const nextBtn = document.getElementById('next-testimonial');
+    const dots = document.querySelectorAll('.dot');
+    const testimonialSlider = document.querySelector('.testimonial-slider');
+
+    let currentIndex = 0;
+    const totalSlides = testimonialSlide.length;
+
+    // Touch/swipe variables
+    let touchStartX = 0;
+    let touchEndX = 0;
+    let touchStartY = 0;
+    let touchEndY = 0;
+    const minSwipeDistance = 50; // Minimum distance for swipe recognition
+
+    function updateSlider() {
+        if (testimonialSlides) {
+            testimonialSlides.style.transform = `translateX(-${currentIndex * 100}%)`;
+        }
+
+        // Update dots
+        if (dots.length > 0) {
+            dots.forEach((dot, index) => {
+                dot.classList.toggle('active', index === currentIndex);
+            });
+        }
+
+        // Update button states
+        if (prevBtn) {
+            prevBtn.disabled = currentIndex === 0;
+        }
+        if (nextBtn) {
+            nextBtn.disabled = currentIndex === totalSlides - 1;
+        }
+    }
+
+    function nextSlide() {
+        if (currentIndex < totalSlides - 1) {
+            currentIndex++;
+            updateSlider();
+        }
+    }
+
+    function prevSlide() {
+        if (currentIndex > 0) {
+            currentIndex--;
+            updateSlider();
+        }
+    }
+
+    function goToSlide(index) {
+        if (index >= 0 && index < totalSlides) {
+            currentIndex = index;
+            updateSlider();
+        }
+    }
+
+    // Touch event handlers
+    function handleTouchStart(e) {
+        touchStartX = e.touches[0].clientX;
+        touchStartY = e.touches[0].clientY;
+    }
+
+    function handleTouchMove(e) {
+        if (!touchStartX || !touchStartY) return;
+
+        touchEndX = e.touches[0].clientX;
+        touchEndY = e.touches[0].clientY;
+    }
+
+    function handleTouchEnd(e) {
+        if (!touchStartX || !touchEndX) return;
+
+        const deltaX = touchStartX - touchEndX;
+        const deltaY = touchStartY - touchEndY;
+        const absDeltaX = Math.abs(deltaX);
+        const absDeltaY = Math.abs(deltaY);
+
+        // Check if swipe is more horizontal than vertical (to avoid triggering on vertical scrolls)
+        if (absDeltaX > absDeltaY && absDeltaX > minSwipeDistance) {
+            if (deltaX > 0) {
+                // Swipe left - next slide
+                nextSlide();
+            } else {
+                // Swipe right - previous slide
+                prevSlide();
+            }
+        }
+
+        // Reset touch coordinates
+        touchStartX = 0;
+        touchEndX = 0;
+        touchStartY = 0;
+        touchEndY = 0;
+    }
+
+    // Event listeners for buttons and dots
+    if (nextBtn) {
+        nextBtn.addEventListener('click', nextSlide);
+    }
+    if (prevBtn) {
+        prevBtn.addEventListener('click', prevSlide);
+    }
+
+    if (dots.length > 0) {
+        dots.forEach((dot, index) => {
+            dot.addEventListener('click', () => goToSlide(index));
+        });
+    }
+
+    // Touch event listeners for swipe functionality
+    if (testimonialSlider) {
+        testimonialSlider.addEventListener('touchstart', handleTouchStart, { passive: true });
+        testimonialSlider.addEventListener('touchmove', handleTouchMove, { passive: true });
+        testimonialSlider.addEventListener('touchend', handleTouchEnd, { passive: true });
+    }
+
+    // Auto slide (optional)
+    if (totalSlides > 1) {
+        setInterval(() => {
+            if (currentIndex < totalSlides - 1) {
+                nextSlide();
+            } else {
+                currentIndex = 0;
+                updateSlider();
+            }
+        }, 5000);
+    }
+
+    // Initialize
+    updateSlider();
+});
@@ -0,0 +1,71 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Load older meetings from the JSON variant of this page instead of navigating
+    const loadMore = document.getElementById('load-more-meetings');
+    const list = document.getElementById('meetings-list');
+    const template = document.getElementById('meeting-item-template');
+    if (!loadMore || !list || !template) {
+        return;
+    }
+
+    function formatDate(value) {
+        return new Date(value).toLocaleDateString(undefined, { month: 'short', day: '2-digit', year: 'numeric' });
+    }
+
+    function formatTime(value) {
+        return new Date(value).toLocaleTimeString(undefined, { hour: 'numeric', minute: '2-digit' });
+    }
+
+    function renderMeeting(meeting) {
+        const item = template.content.firstElementChild.cloneNode(true);
+        const values = Object.assign({}, meeting, {
+            when: formatDate(meeting.date + 'T00:00') + ' at ' + formatTime(meeting.date + 'T' + meeting.time),
+            created: 'Scheduled on ' + formatDate(meeting.created_at) + ' at ' + formatTime(meeting.created_at)
+        });
+        item.querySelectorAll('[data-optional]').forEach(function(el) {
+            if (!values[el.dataset.optional]) {
+                el.remove();
+            }
+        });
+        item.querySelectorAll('[data-field]').forEach(function(el) {
+            el.textContent = values[el.dataset.field] || '';
+        });
+        item.querySelectorAll('[data-href]').forEach(function(el) {
+            el.href = values[el.dataset.href];
+        });
+        return item;
+    }
+
+    loadMore.addEventListener('click', function(event) {
+        event.preventDefault();
+        const params = new URLSearchParams(window.location.search);
+        params.set('cursor', loadMore.dataset.cursor);
+        params.set('format', 'json');
+        loadMore.classList.add('loading');
+
+        fetch('?' + params.toString(), { credentials: 'same-origin' })
+            .then(function(response) { return response.json(); })
+            .then(function(data) {
+                if (!data.success) {
+                    throw new Error(data.message || 'Could not load meetings');
+                }
+                data.results.forEach(function(meeting) {
+                    list.appendChild(renderMeeting(meeting));
+                });
+                if (data.next_cursor) {
+                    loadMore.dataset.cursor = data.next_cursor;
+                    params.set('cursor', data.next_cursor);
+                    params.delete('format');
+                    loadMore.href = '?' + params.toString();
+                } else {
+                    loadMore.parentElement.remove();
+                }
+            })
+            .catch(function() {
+                // Fall back to a regular page load
+                window.location.href = loadMore.href;
+            })
+            .finally(function() {
+                loadMore.classList.remove('loading');
+            });
+    });
+});
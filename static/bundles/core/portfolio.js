@@ -0,0 +1,232 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const grid = document.getElementById('projects-grid');
+    const filterBtns = document.querySelectorAll('.filter-btn');
+    let loadMore = document.getElementById('load-more-projects');
+    let query = grid ? new URLSearchParams(grid.dataset.query) : null;
+    let loading = false;
+
+    // Fetch a page of cards from the JSON endpoint; the first page of a new
+    // filter replaces the grid, later pages are appended
+    function fetchPage(params, replace) {
+        loading = true;
+        if (loadMore) {
+            loadMore.classList.add('loading');
+        }
+        return fetch(grid.dataset.endpoint + '?' + params.toString(), { credentials: 'same-origin' })
+            .then(function(response) { return response.json(); })
+            .then(function(data) {
+                if (!data.success) {
+                    throw new Error(data.message || 'Could not load projects');
+                }
+                if (replace) {
+                    grid.innerHTML = '';
+                }
+                grid.insertAdjacentHTML('beforeend', data.html.cards);
+                updateLoadMore(data.next_cursor);
+            })
+            .finally(function() {
+                loading = false;
+                if (loadMore) {
+                    loadMore.classList.remove('loading');
+                }
+            });
+    }
+
+    function updateLoadMore(cursor) {
+        if (!cursor) {
+            if (loadMore) {
+                loadMore.parentElement.remove();
+                loadMore = null;
+            }
+            return;
+        }
+        if (!loadMore) {
+            const wrapper = document.createElement('div');
+            wrapper.className = 'load-more';
+            loadMore = document.createElement('a');
+            loadMore.className = 'btn btn-outline';
+            loadMore.id = 'load-more-projects';
+            loadMore.textContent = 'More projects';
+            wrapper.appendChild(loadMore);
+            grid.after(wrapper);
+            observe();
+        }
+        const params = new URLSearchParams(query);
+        params.set('cursor', cursor);
+        loadMore.dataset.cursor = cursor;
+        loadMore.href = '?' + params.toString();
+    }
+
+    function nextPage(event) {
+        if (event) {
+            event.preventDefault();
+        }
+        if (loading || !loadMore) {
+            return;
+        }
+        const params = new URLSearchParams(query);
+        params.set('cursor', loadMore.dataset.cursor);
+        fetchPage(params, false).catch(function() {
+            // Fall back to a regular page load
+            window.location.href = loadMore.href;
+        });
+    }
+
+    // Infinite scroll: load the next page as the "More projects" link comes into view
+    let observer = null;
+    function observe() {
+        if (!loadMore) {
+            return;
+        }
+        loadMore.addEventListener('click', nextPage);
+        if ('IntersectionObserver' in window) {
+            observer = observer || new IntersectionObserver(function(entries) {
+                if (entries.some(function(entry) { return entry.isIntersecting; })) {
+                    nextPage();
+                }
+            }, { rootMargin: '400px' });
+            observer.observe(loadMore);
+        }
+    }
+    if (grid) {
+        observe();
+    }
+
+    // Portfolio Filtering: load the category slice from the server
+    filterBtns.forEach(btn => {
+        btn.addEventListener('click', function(event) {
+            if (!grid) {
+                return;
+            }
+            event.preventDefault();
+            filterBtns.forEach(btn => btn.classList.remove('active'));
+            this.classList.add('active');
+
+            const params = new URLSearchParams(query);
+            params.delete('category');
+            if (this.dataset.category) {
+                params.set('category', this.dataset.category);
+            }
+            const href = this.href;
+            grid.style.opacity = '0.4';
+            fetchPage(params, true)
+                .then(function() {
+                    query = params;
+                    window.history.replaceState(null, '', href);
+                })
+                .catch(function() {
+                    window.location.href = href;
+                })
+                .finally(function() {
+                    grid.style.opacity = '';
+                });
+        });
+    });
+
+    // Project Modal (delegated, so appended cards work too). The details are
+    // fetched from the project's JSON endpoint the first time it is opened.
+    const projectModal = document.getElementById('project-modal');
+    const details = {};
+
+    function modalMessage(text) {
+        const content = document.createElement('div');
+        content.className = 'modal-content';
+        content.innerHTML = '<div class="modal-header"><h3></h3><span class="modal-close">&times;</span></div>';
+        content.querySelector('h3').textContent = text;
+        return content;
+    }
+
+    function loadDetails(url) {
+        if (!details[url]) {
+            details[url] = fetch(url, { credentials: 'same-origin' })
+                .then(function(response) { return response.json(); })
+                .then(function(data) {
+                    if (!data.success) {
+                        throw new Error(data.message || 'Could not load project');
+                    }
+                    return data.html;
+                })
+                .catch(function(error) {
+                    delete details[url];
+                    throw error;
+                });
+        }
+        return details[url];
+    }
+
+    function openModal(url) {
+        projectModal.replaceChildren(modalMessage('Loading project...'));
+        projectModal.dataset.url = url;
+        projectModal.style.display = 'block';
+        document.body.classList.add('modal-open');
+        setTimeout(() => {
+            projectModal.classList.add('active');
+        }, 10);
+        loadDetails(url)
+            .then(function(html) {
+                // Ignore a late response for a modal that was closed or switched
+                if (projectModal.dataset.url === url) {
+                    projectModal.innerHTML = html;
+                }
+            })
+            .catch(function(error) {
+                if (projectModal.dataset.url === url) {
+                    projectModal.replaceChildren(modalMessage(error.message));
+                }
+            });
+    }
+
+    function closeModal(modal) {
+        modal.classList.remove('active');
+        delete modal.dataset.url;
+        setTimeout(() => {
+            modal.style.display = 'none';
+            document.body.classList.remove('modal-open');
+        }, 400);
+    }
+
+    document.addEventListener('click', function(e) {
+        const trigger = e.target.closest('.project-modal-trigger');
+        if (trigger && projectModal) {
+            e.preventDefault();
+            openModal(trigger.dataset.detailUrl);
+            return;
+        }
+        const close = e.target.closest('.modal-close');
+        if (close) {
+            closeModal(close.closest('.project-modal'));
+            return;
+        }
+        // Close modal when clicking outside
+        if (e.target.classList.contains('project-modal')) {
+            closeModal(e.target);
+        }
+    });
+});
+
+
+
+        document.addEventListener('DOMContentLoaded', function() {
+        // Create floating particles
+        const particlesContainer = document.getElementById('particles');
+        const particleCount = 30;
+        
+        for (let i = 0; i < particleCount; i++) {
+            const particle = document.createElement('div');
+            particle.classList.add('particle');
+            
+            // Random properties
+            const size = Math.random() * 6 + 2;
+            const posX = Math.random() * 100;
+            const delay = Math.random() * 20;
+            const duration = 15 + Math.random() * 15;
+            
+            particle.style.width = `${size}px`;
+            particle.style.height = `${size}px`;
+            particle.style.left = `${posX}%`;
+            particle.style.animationDelay = `${delay}s`;
+            particle.style.animationDuration = `${duration}s`;
+            
+            particlesContainer.appendChild(particle);
+        }
+    });
@@ -0,0 +1,18 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Handle image fallbacks
+    document.querySelectorAll('img[data-fallback]').forEach(img => {
+        img.addEventListener('error', function() {
+            this.src = this.getAttribute('data-fallback');
+        });
+    });
+
+    // Handle hover transforms for team member avatars
+    document.querySelectorAll('.team-member-avatar').forEach(img => {
+        img.addEventListener('mouseover', function() {
+            this.style.transform = 'scale(1.04)';
+        });
+        img.addEventListener('mouseout', function() {
+            this.style.transform = 'scale(1)';
+        });
+    });
+});
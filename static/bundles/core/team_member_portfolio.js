@@ -0,0 +1,26 @@
+// Smooth scroll for anchor links
+document.querySelectorAll('.scroll-link').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+        e.preventDefault();
+        document.querySelector(this.getAttribute('href')).scrollIntoView({
+            behavior: 'smooth'
+        });
+    });
+});
+
+// Handle image fallbacks
+document.querySelectorAll('img[data-fallback]').forEach(img => {
+    img.addEventListener('error', function() {
+        this.src = this.getAttribute('data-fallback');
+    });
+});
+
+// Handle hover transforms for member and project images
+document.querySelectorAll('.member-img, .project-img').forEach(img => {
+    img.addEventListener('mouseover', function() {
+        this.style.transform = 'scale(1.04)';
+    });
+    img.addEventListener('mouseout', function() {
+        this.style.transform = 'scale(1)';
+    });
+});
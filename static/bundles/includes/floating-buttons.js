@@ -0,0 +1,41 @@
+// Enhanced Floating Buttons Script
+document.addEventListener('DOMContentLoaded', function() {
+    const backToTopBtn = document.getElementById('back-to-top');
+
+    // Back to top functionality
+    if (backToTopBtn) {
+        backToTopBtn.addEventListener('click', function(e) {
+            e.preventDefault();
+            window.scrollTo({
+                top: 0,
+                behavior: 'smooth'
+            });
+        });
+
+        // Show/hide back to top button on scroll
+        window.addEventListener('scroll', function() {
+            if (window.scrollY > 500) {
+                backToTopBtn.classList.add('show');
+            } else {
+                backToTopBtn.classList.remove('show');
+            }
+        });
+    }
+
+    // Add click tracking for analytics
+    document.querySelectorAll('.floating-btn').forEach(btn => {
+        btn.addEventListener('click', function() {
+            // You can add Google Analytics tracking here
+            console.log('Floating button clicked:', this.getAttribute('data-tooltip'));
+        });
+
+        // Add touch feedback for mobile
+        btn.addEventListener('touchstart', function() {
+            this.style.transform = 'scale(0.95)';
+        });
+
+        btn.addEventListener('touchend', function() {
+            this.style.transform = '';
+        });
+    });
+});